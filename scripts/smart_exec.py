@@ -12,11 +12,15 @@ Notes:
 - Uses npm's recommended `npm exec --package=... -- <cmd>` form.  (see: https://docs.npmjs.com/cli/v8/commands/npm-exec)
 - Supports Deno built-ins (`deno lint/fmt/check`) as truly “no install” tools, plus `deno run npm:` for npm CLIs
 - Support PowerShell “download to temp + import” execution for module-based tools (e.g. PSScriptAnalyzer)
-- Support special commands: `executors`, `db`, and `which` subcommands + JSON output + dry-run mode
+- Support special commands: `executors`, `db`, `cache`, and `which` subcommands + JSON output + dry-run mode
+- Caches tool resolutions per process and on disk, keyed by PATH and PATH-directory mtimes
+- Optional daemon (serve/client) keeps remote tools (uvx, npx) warm between lint jobs
 
 Examples:
   ./smart_exec.py executors
   ./smart_exec.py db
+  ./smart_exec.py cache [--clear]
+  ./smart_exec.py serve [--socket PATH] [--status | --stop]
   ./smart_exec.py which ruff check .
   ./smart_exec.py run ruff check .
   ./smart_exec.py run eslint .
@@ -34,15 +38,20 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import platform
 import shlex
 import shutil
+import socket
+import socketserver
 import subprocess
 import sys
+import threading
+import time
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 
 # ----------------------------
@@ -144,7 +153,11 @@ PRIORITY: Dict[str, List[str]] = {
 # ----------------------------
 
 def which(cmd: str) -> Optional[str]:
-    return shutil.which(cmd)
+    # Memoized per PATH value; see clear_caches()
+    key = (os.environ.get("PATH", ""), cmd)
+    if key not in _which_cache:
+        _which_cache[key] = shutil.which(cmd)
+    return _which_cache[key]
 
 
 def have(cmd: str) -> bool:
@@ -409,6 +422,368 @@ def choose_best(spec: ToolSpec, tool_args: List[str], executors: Dict[str, bool]
     raise RuntimeError(f"No suitable executor found for tool '{spec.name}' (ecosystem={spec.ecosystem}).")
 
 
+# ----------------------------
+# Resolution cache
+# ----------------------------
+# Resolving a tool probes PATH a dozen times (one shutil.which per executor).
+# Results are memoized per process and persisted to disk, keyed by a
+# fingerprint of PATH plus the mtime of every PATH directory: installing or
+# removing an executable changes its directory's mtime, which invalidates the
+# cache. Set SMART_EXEC_NO_CACHE=1 to bypass the on-disk cache, or run
+# `smart_exec.py cache --clear` to drop it explicitly. Docker resolutions are
+# never cached: their argv mounts the current directory.
+
+# 2: docker argvs (with a baked-in cwd mount) are no longer stored
+CACHE_VERSION = 2
+CACHE_DISABLE_ENV = "SMART_EXEC_NO_CACHE"
+CACHE_DIR_ENV = "SMART_EXEC_CACHE_DIR"
+
+_cache_lock = threading.Lock()
+# (PATH, cmd) -> shutil.which result
+_which_cache: Dict[Tuple[str, str], Optional[str]] = {}
+# PATH -> fingerprint (directories are stat'ed once per process per PATH value)
+_fingerprints: Dict[str, str] = {}
+# fingerprint -> {tool name -> argv prefix, or None if unresolvable}
+_resolved: Dict[str, Dict[str, Optional[List[str]]]] = {}
+
+
+def cache_file() -> str:
+    base = os.environ.get(CACHE_DIR_ENV) or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "smart_exec",
+    )
+    return os.path.join(base, "resolutions.json")
+
+
+def disk_cache_enabled() -> bool:
+    return os.environ.get(CACHE_DISABLE_ENV, "") in ("", "0")
+
+
+def path_fingerprint() -> str:
+    path = os.environ.get("PATH", "")
+    fp = _fingerprints.get(path)
+    if fp is None:
+        parts = [sys.platform, path]
+        for d in path.split(os.pathsep):
+            try:
+                parts.append(f"{d}\0{os.stat(d).st_mtime_ns}")
+            except OSError:
+                parts.append(f"{d}\0-")
+        fp = hashlib.sha256("\n".join(parts).encode("utf-8", "surrogateescape")).hexdigest()
+        _fingerprints[path] = fp
+    return fp
+
+
+def _load_disk_cache(fingerprint: str) -> Dict[str, Optional[List[str]]]:
+    try:
+        with open(cache_file(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION or data.get("fingerprint") != fingerprint:
+        return {}
+    tools = data.get("tools")
+    return dict(tools) if isinstance(tools, dict) else {}
+
+
+def _store_disk_cache(fingerprint: str, tools: Dict[str, Optional[List[str]]]) -> None:
+    path = cache_file()
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "fingerprint": fingerprint, "tools": tools}, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)  # atomic: concurrent readers never see a partial file
+    except OSError:
+        # Caching is best-effort; a read-only home must not break resolution
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def resolve_tool_cached(tool_name: str) -> Optional[List[str]]:
+    """Argv prefix for running tool_name (no tool args), or None if no executor can run it."""
+    with _cache_lock:
+        fingerprint = path_fingerprint()
+        tools = _resolved.get(fingerprint)
+        if tools is None:
+            tools = _load_disk_cache(fingerprint) if disk_cache_enabled() else {}
+            _resolved[fingerprint] = tools
+        if tool_name not in tools:
+            try:
+                argv, executor = choose_best(resolve_tool(tool_name), [], detect_executors())
+            except RuntimeError:
+                argv, executor = None, None
+            if executor == "docker":
+                # "-v <cwd>:/w" is only right for the directory it was built in
+                return argv
+            tools[tool_name] = argv
+            if disk_cache_enabled():
+                _store_disk_cache(fingerprint, tools)
+        argv = tools[tool_name]
+        return list(argv) if argv is not None else None
+
+
+def clear_caches(disk: bool = True) -> None:
+    """Drop all memoized lookups (and the on-disk cache unless disk is False)."""
+    with _cache_lock:
+        _which_cache.clear()
+        _fingerprints.clear()
+        _resolved.clear()
+        if disk:
+            try:
+                os.unlink(cache_file())
+            except OSError:
+                pass
+
+
+# ----------------------------
+# Daemon (serve / client)
+# ----------------------------
+# "smart_exec.py serve" runs tools on behalf of "smart_exec.py client" over a
+# Unix socket. For a remote executor (uvx/uv, npx) the daemon resolves the
+# package once, then pins the tool binary inside the executor's package cache
+# and runs it directly, skipping package resolution and launcher startup on
+# every later job. While a daemon is listening, resolve_tool_command() hands
+# out the client as the command prefix for remote tools; the client falls back
+# to a local run if the daemon goes away.
+#
+# Tools run in the client's cwd and environment (VIRTUAL_ENV, MYPYPATH, PATH
+# change what ruff/mypy report) and are killed after SMART_EXEC_RUN_TIMEOUT
+# seconds. A pinned binary is resolved again when it disappears (uv/npm cache
+# pruned) and, for "@latest" tools, once it is older than PIN_TTL.
+
+SOCKET_ENV = "SMART_EXEC_SOCKET"
+RUN_TIMEOUT_ENV = "SMART_EXEC_RUN_TIMEOUT"
+DEFAULT_RUN_TIMEOUT = 600.0
+# Seconds before a prefer_latest tool's pinned binary is resolved again
+PIN_TTL = 6 * 60 * 60
+# Launchers that resolve/fetch a package on every call (worth routing through the daemon)
+REMOTE_LAUNCHERS = {"uvx", "uv", "pipx", "bunx", "bun", "pnpm", "npx", "npm", "yarn"}
+
+# socket path -> daemon answered a ping (checked once per process)
+_daemon_alive: Dict[str, bool] = {}
+
+
+def socket_path() -> str:
+    return os.environ.get(SOCKET_ENV) or os.path.join(os.path.dirname(cache_file()), "daemon.sock")
+
+
+def run_timeout() -> float:
+    try:
+        return float(os.environ.get(RUN_TIMEOUT_ENV) or DEFAULT_RUN_TIMEOUT)
+    except ValueError:
+        return DEFAULT_RUN_TIMEOUT
+
+
+def _daemon_request(payload: Dict[str, Any], path: Optional[str] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path or socket_path())
+        sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    reply = json.loads(b"".join(chunks).decode("utf-8"))
+    if not isinstance(reply, dict):
+        raise ValueError("malformed daemon reply")
+    return reply
+
+
+def daemon_running(path: Optional[str] = None) -> bool:
+    path = path or socket_path()
+    if path not in _daemon_alive:
+        alive = False
+        if hasattr(socket, "AF_UNIX") and os.path.exists(path):
+            try:
+                alive = bool(_daemon_request({"op": "ping"}, path, timeout=0.5).get("ok"))
+            except (OSError, ValueError):
+                alive = False
+        _daemon_alive[path] = alive
+    return _daemon_alive[path]
+
+
+def daemon_client_argv(tool_name: str, argv: Optional[List[str]]) -> Optional[List[str]]:
+    """Client prefix that runs tool_name via the daemon, or None if the daemon would not help."""
+    if argv is None or argv[0] not in REMOTE_LAUNCHERS or not daemon_running():
+        return None
+    return [sys.executable, os.path.abspath(__file__), "client", tool_name, "--"]
+
+
+def _probe(argv: List[str]) -> Optional[str]:
+    try:
+        p = subprocess.run(argv, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=300)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    out = (p.stdout or "").strip().splitlines()
+    return out[-1].strip() if p.returncode == 0 and out else None
+
+
+def pin_tool_argv(spec: ToolSpec, argv: List[str], executor: str) -> List[str]:
+    """Replace a remote launcher argv with the cached tool binary, when the executor can locate it."""
+    cmd = spec.command or spec.name
+    pkg = spec.package or spec.name
+    found: Optional[str] = None
+    if executor in ("uvx", "uv"):
+        # The ephemeral env is reused from uv's cache; its bin/ holds the tool entry point
+        launcher = ["uvx"] if argv[0] == "uvx" else ["uv", "tool", "run"]
+        suffix = "@latest" if spec.prefer_latest and pkg == cmd else ""
+        prefix = _probe(launcher + ["--from", f"{pkg}{suffix}", "python", "-c", "import sys; print(sys.prefix)"])
+        if prefix:
+            found = os.path.join(prefix, "bin", cmd)
+    elif executor == "npx":
+        found = _probe(["npx", "--yes", "-p", pkg, "-c", f"command -v {shlex.quote(cmd)}"])
+    if found and os.path.isfile(found) and os.access(found, os.X_OK):
+        return [found]
+    return argv
+
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    server: "_DaemonServer"
+
+    def handle(self) -> None:
+        try:
+            req = json.loads(self.rfile.readline().decode("utf-8"))
+            reply = self.server.dispatch(req)
+        except Exception as e:
+            reply = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(reply).encode("utf-8"))
+        if reply.get("stopping"):
+            # Only after replying: shutdown() blocks until serve_forever() exits
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+
+class _DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path, _DaemonHandler)
+        # tool name -> (argv prefix, executor, time.monotonic() when pinned)
+        self.pinned: Dict[str, Tuple[List[str], str, float]] = {}
+        # Guards pinned and tool_locks only; resolution holds the tool's own lock
+        self.pin_lock = threading.Lock()
+        self.tool_locks: Dict[str, threading.Lock] = {}
+
+    def tool_argv(self, tool_name: str, stale: Optional[List[str]] = None) -> Tuple[List[str], str]:
+        """Pinned argv prefix for tool_name, resolving it first if needed.
+
+        stale is a pinned argv that failed to start; it is replaced unless
+        another request already replaced it.
+        """
+        with self.pin_lock:
+            tool_lock = self.tool_locks.setdefault(tool_name, threading.Lock())
+        # Probing a uvx/npx package can take minutes; only this tool waits for it
+        with tool_lock:
+            spec = resolve_tool(tool_name)
+            with self.pin_lock:
+                entry = self.pinned.get(tool_name)
+            if entry is not None:
+                expired = spec.prefer_latest and time.monotonic() - entry[2] > PIN_TTL
+                if not expired and (stale is None or entry[0] != stale):
+                    return entry[0], entry[1]
+            argv, executor = choose_best(spec, [], detect_executors())
+            entry = (pin_tool_argv(spec, argv, executor), executor, time.monotonic())
+            with self.pin_lock:
+                self.pinned[tool_name] = entry
+            return entry[0], entry[1]
+
+    def dispatch(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        op = req.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "status":
+            with self.pin_lock:
+                tools = {k: {"argv": v[0], "executor": v[1]} for k, v in self.pinned.items()}
+            return {"ok": True, "pid": os.getpid(), "tools": tools}
+        if op == "shutdown":
+            return {"ok": True, "stopping": True}
+        if op == "run":
+            tool_name = str(req["tool"])
+            tool_args = [str(a) for a in req.get("args", [])]
+            cwd = str(req.get("cwd") or os.getcwd())
+            env = req.get("env")
+            env = {str(k): str(v) for k, v in env.items()} if isinstance(env, dict) else None
+            timeout = float(req.get("timeout") or run_timeout())
+
+            def run(argv: List[str]) -> "subprocess.CompletedProcess[str]":
+                return subprocess.run(argv + tool_args, cwd=cwd, env=env, capture_output=True, text=True, timeout=timeout)
+
+            argv, executor = self.tool_argv(tool_name)
+            try:
+                try:
+                    p = run(argv)
+                except FileNotFoundError:
+                    # The pinned binary is gone (uv/npm cache pruned): pin the tool again
+                    argv, executor = self.tool_argv(tool_name, stale=argv)
+                    p = run(argv)
+            except subprocess.TimeoutExpired:
+                return {"ok": False, "timed_out": True, "error": f"{tool_name} timed out after {timeout:g}s"}
+            return {"ok": True, "executor": executor, "returncode": p.returncode, "stdout": p.stdout, "stderr": p.stderr}
+        return {"ok": False, "error": f"unknown op: {op}"}
+
+
+def serve(path: str) -> int:
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: serve needs Unix domain sockets", file=sys.stderr)
+        return 1
+    if daemon_running(path):
+        print(f"Error: a daemon is already listening on {path}", file=sys.stderr)
+        return 1
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    try:
+        os.unlink(path)  # stale socket from a daemon that died
+    except OSError:
+        pass
+    old_umask = os.umask(0o077)  # socket is private to this user
+    try:
+        server = _DaemonServer(path)
+    finally:
+        os.umask(old_umask)
+    print(f"[serve] listening on {path} (pid {os.getpid()})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    return 0
+
+
+def client(tool_name: str, tool_args: List[str]) -> int:
+    timeout = run_timeout()
+    payload = {"op": "run", "tool": tool_name, "args": tool_args, "cwd": os.getcwd(), "env": dict(os.environ), "timeout": timeout}
+    try:
+        # The daemon enforces the timeout; the margin covers resolving the tool first
+        reply = _daemon_request(payload, timeout=timeout + 60)
+    except socket.timeout:
+        reply = {"ok": False, "timed_out": True, "error": f"no reply from the daemon within {timeout + 60:g}s"}
+    except (OSError, ValueError):
+        reply = {"ok": False}
+    if reply.get("timed_out"):
+        # A local rerun would most likely hang the same way
+        print(f"Error: {reply.get('error')}", file=sys.stderr)
+        return 124
+    if not reply.get("ok"):
+        # Daemon gone or failed: run locally so callers never notice
+        argv = resolve_tool_cached(tool_name)
+        if argv is None:
+            print(f"Error: No suitable executor found for tool '{tool_name}'.", file=sys.stderr)
+            return 1
+        return subprocess.run(argv + tool_args).returncode
+    sys.stdout.write(str(reply.get("stdout", "")))
+    sys.stderr.write(str(reply.get("stderr", "")))
+    return int(reply.get("returncode", 1))
+
+
 # ----------------------------
 # CLI
 # ----------------------------
@@ -439,6 +814,17 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
     p_which.add_argument("tool_args", nargs=argparse.REMAINDER)
 
     sub.add_parser("executors", help="List detected executors (availability + versions)")
+    p_cache = sub.add_parser("cache", help="Show or clear the tool resolution cache")
+    p_cache.add_argument("--clear", action="store_true", help="Delete the on-disk cache")
+
+    p_serve = sub.add_parser("serve", help="Run a daemon that keeps remote tools warm (Unix socket)")
+    p_serve.add_argument("--socket", help=f"Socket path (default: ${SOCKET_ENV} or next to the cache file)")
+    p_serve.add_argument("--status", action="store_true", help="Show the running daemon's pinned tools")
+    p_serve.add_argument("--stop", action="store_true", help="Stop the running daemon")
+
+    p_client = sub.add_parser("client", help="Run a tool through the daemon (falls back to a local run)")
+    p_client.add_argument("tool", help="Tool to run")
+    p_client.add_argument("tool_args", nargs=argparse.REMAINDER, help="Arguments passed to the tool")
     p_db = sub.add_parser("db", help="List known tools in the built-in database")
     p_db.add_argument("--json", action="store_true")
 
@@ -454,6 +840,39 @@ def main(argv: List[str]) -> int:
         print(json.dumps(info, indent=2))
         return 0
 
+    if ns.subcmd == "cache":
+        if ns.clear:
+            clear_caches()
+            print(f"Cleared {cache_file()}")
+            return 0
+        fingerprint = path_fingerprint()
+        info = {
+            "file": cache_file(),
+            "enabled": disk_cache_enabled(),
+            "fingerprint": fingerprint,
+            "tools": _load_disk_cache(fingerprint),
+        }
+        print(json.dumps(info, indent=2))
+        return 0
+
+    if ns.subcmd == "serve":
+        path = ns.socket or socket_path()
+        if ns.status or ns.stop:
+            try:
+                reply = _daemon_request({"op": "shutdown" if ns.stop else "status"}, path, timeout=5)
+            except (OSError, ValueError) as e:
+                print(f"Error: no daemon on {path}: {e}", file=sys.stderr)
+                return 1
+            print(json.dumps(reply, indent=2))
+            return 0
+        return serve(path)
+
+    if ns.subcmd == "client":
+        tool_args = list(ns.tool_args)
+        if tool_args[:1] == ["--"]:
+            tool_args = tool_args[1:]
+        return client(ns.tool, tool_args)
+
     if ns.subcmd == "db":
         if ns.json:
             out = {k: TOOL_DB[k].__dict__ for k in sorted(TOOL_DB)}
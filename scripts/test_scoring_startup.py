@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+test_scoring_startup.py
+
+Manual regression benchmark for the cold start of validate_scoring.py.
+
+validate_scoring.py is run from hooks on every edit, so its startup cost is
+paid constantly. This script runs it under python -X importtime and checks:
+- Total import time (median over several runs) stays under a budget
+- No validator module, yaml or the process pool machinery is imported just
+  to start the CLI (they are loaded lazily, when their category runs)
+- validation_common does not build its pattern tables or detect private
+  usernames at import time
+
+Usage:
+    uv run python scripts/test_scoring_startup.py
+    uv run python scripts/test_scoring_startup.py --budget-ms 40 --runs 9
+    uv run python scripts/test_scoring_startup.py --json
+
+Exit codes:
+    0 - Startup is within budget and lazy
+    1 - Budget exceeded or an eager import found
+    2 - validate_scoring.py could not be run
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# ==============================================================================
+# Benchmark Configuration
+# ==============================================================================
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+SCORING_SCRIPT = SCRIPTS_DIR / "validate_scoring.py"
+
+# Default budget for the total import time of "validate_scoring.py --help"
+DEFAULT_BUDGET_MS = 50.0
+
+# Modules that must not be imported just to start the scoring CLI
+LAZY_MODULES = (
+    "validate_agent",
+    "validate_command",
+    "validate_hook",
+    "validate_mcp",
+    "validate_plugin",
+    "validate_security",
+    "validate_skill",
+    "validate_skill_comprehensive",
+    "yaml",
+    "concurrent.futures.process",
+)
+
+# validation_common constants that must still be unbuilt after the CLI starts
+LAZY_CONSTANTS = (
+    "SECRET_PATTERNS",
+    "USER_PATH_PATTERNS",
+    "ABSOLUTE_PATH_PATTERNS",
+    "PRIVATE_USERNAMES",
+    "PRIVATE_PATH_PATTERNS",
+)
+
+# "import time: <self us> | <cumulative us> | <indented module name>"
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+# ==============================================================================
+# Measurement
+# ==============================================================================
+
+
+@dataclass
+class StartupRun:
+    """Import profile of one validate_scoring.py start."""
+
+    total_ms: float = 0.0
+    modules: dict[str, float] = field(default_factory=dict)  # top-level module -> cumulative ms
+    imported: set[str] = field(default_factory=set)
+
+
+def _clean_env() -> dict[str, str]:
+    """Environment for the measured runs: bytecode caching on, as for users."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def measure_startup() -> StartupRun:
+    """Start validate_scoring.py --help once under -X importtime.
+
+    Returns:
+        The run's import profile
+
+    Raises:
+        RuntimeError: If the script exits with an error
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(SCORING_SCRIPT), "--help"],
+        capture_output=True,
+        text=True,
+        env=_clean_env(),
+        timeout=60,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"validate_scoring.py --help exited with {proc.returncode}: {proc.stderr[-500:]}")
+
+    run = StartupRun()
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match is None:
+            continue
+        cumulative_us, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        run.imported.add(name)
+        # Only top-level entries: their cumulative times already include nested imports
+        if len(indent) == 1:
+            run.modules[name] = cumulative_us / 1000
+            run.total_ms += cumulative_us / 1000
+    return run
+
+
+def unbuilt_constants() -> list[str]:
+    """Return the LAZY_CONSTANTS validation_common leaves unbuilt after import."""
+    code = (
+        "import json, validation_common as vc; "
+        f"print(json.dumps([n for n in {list(LAZY_CONSTANTS)!r} if n not in vars(vc)]))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=SCRIPTS_DIR,
+        env=_clean_env(),
+        timeout=60,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing validation_common failed: {proc.stderr[-500:]}")
+    unbuilt: list[str] = json.loads(proc.stdout)
+    return unbuilt
+
+
+# ==============================================================================
+# Reporting
+# ==============================================================================
+
+
+def _print_report(runs: list[StartupRun], median_ms: float, budget_ms: float, eager: list[str], built: list[str]) -> None:
+    slowest = sorted(runs[0].modules.items(), key=lambda item: item[1], reverse=True)[:8]
+    print("validate_scoring.py cold start")
+    print("=" * 60)
+    print(f"Runs:                {len(runs)}")
+    print(f"Median import time:  {median_ms:.1f} ms (budget {budget_ms:.1f} ms)")
+    print(f"Fastest / slowest:   {min(r.total_ms for r in runs):.1f} / {max(r.total_ms for r in runs):.1f} ms")
+    print("\nSlowest top-level imports (first run):")
+    for name, ms in slowest:
+        print(f"  {ms:8.1f} ms  {name}")
+    if eager:
+        print(f"\nEagerly imported (should be lazy): {', '.join(eager)}")
+    if built:
+        print(f"Built at import time (should be lazy): {', '.join(built)}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Regression benchmark for validate_scoring.py cold start.")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help=f"Maximum median total import time in ms (default: {DEFAULT_BUDGET_MS:.0f})",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Number of measured runs, after one warm-up run (default: 5)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results in JSON format",
+    )
+    args = parser.parse_args()
+
+    try:
+        # Warm-up run: writes bytecode caches so every measured run starts alike
+        measure_startup()
+        runs = [measure_startup() for _ in range(max(1, args.runs))]
+        unbuilt = unbuilt_constants()
+    except (RuntimeError, OSError, subprocess.TimeoutExpired, ValueError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+
+    median_ms = statistics.median(r.total_ms for r in runs)
+    eager = [name for name in LAZY_MODULES if any(name in r.imported for r in runs)]
+    built = [name for name in LAZY_CONSTANTS if name not in unbuilt]
+    within_budget = median_ms <= args.budget_ms
+    passed = within_budget and not eager and not built
+
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "passed": passed,
+                    "median_ms": round(median_ms, 2),
+                    "budget_ms": args.budget_ms,
+                    "runs_ms": [round(r.total_ms, 2) for r in runs],
+                    "eager_imports": eager,
+                    "eager_constants": built,
+                },
+                indent=2,
+            )
+        )
+    else:
+        _print_report(runs, median_ms, args.budget_ms, eager, built)
+        if passed:
+            print("\nStartup benchmark PASSED.")
+        else:
+            reason = "over budget" if not within_budget else "eager imports"
+            print(f"\nStartup benchmark FAILED ({reason}).")
+
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
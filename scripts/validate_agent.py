@@ -28,7 +28,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import yaml
 from validation_common import (
     COLORS,
     MAX_BODY_WORDS,
@@ -40,8 +39,13 @@ from validation_common import (
     USER_PATH_PATTERNS,
     VALID_MODELS,
     VALID_TOOLS,
+    NDJSONSink,
+    ResultCache,
     ValidationReport,
+    ValidationResult,
     check_utf8_encoding,
+    parse_frontmatter,
+    validator_version,
 )
 
 # Known frontmatter fields per official docs (agent-specific)
@@ -114,33 +118,6 @@ class AgentValidationReport(ValidationReport):
         return base
 
 
-def parse_frontmatter(content: str) -> tuple[dict[str, Any] | None, str, int]:
-    """Parse YAML frontmatter from agent content.
-
-    Returns:
-        Tuple of (frontmatter_dict, body_content, frontmatter_end_line)
-        Returns (None, content, 0) if no frontmatter found
-    """
-    if not content.startswith("---"):
-        return None, content, 0
-
-    # Find closing ---
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return None, content, 0
-
-    try:
-        frontmatter = yaml.safe_load(parts[1])
-        if frontmatter is None:
-            frontmatter = {}
-        body = parts[2]
-        # Count lines to find frontmatter end
-        fm_end_line = parts[0].count("\n") + parts[1].count("\n") + 2
-        return frontmatter, body, fm_end_line
-    except yaml.YAMLError:
-        return None, content, 0
-
-
 def validate_frontmatter_exists(content: str, report: AgentValidationReport, filename: str) -> dict[str, Any] | None:
     """Validate YAML frontmatter exists and is valid."""
     if not content.startswith("---"):
@@ -877,16 +854,31 @@ def validate_security(content: str, filename: str, report: AgentValidationReport
             )
 
 
-def validate_agent(agent_path: Path) -> AgentValidationReport:
+def validate_agent(
+    agent_path: Path, cache: ResultCache | None = None, sink: NDJSONSink | None = None
+) -> AgentValidationReport:
     """Validate a complete agent file.
 
     Args:
         agent_path: Path to the agent .md file
+        cache: Optional result cache; an unchanged file replays its cached findings
+        sink: Optional NDJSON sink; each result is streamed as soon as it is added
 
     Returns:
         AgentValidationReport with all results
     """
-    report = AgentValidationReport(agent_path=str(agent_path))
+    if cache is not None and agent_path.is_file():
+        cache_key = cache.key("agent", validator_version(__file__), str(agent_path), agent_path.read_bytes())
+        entry = cache.get(cache_key)
+        if entry is not None:
+            report = AgentValidationReport(agent_path=str(agent_path), sink=sink)
+            cache.replay(entry, report.append, ValidationResult)
+            return report
+        report = validate_agent(agent_path, sink=sink)
+        cache.put(cache_key, "agent", report.results)
+        return report
+
+    report = AgentValidationReport(agent_path=str(agent_path), sink=sink)
     filename = agent_path.name
 
     # Check file exists
@@ -952,11 +944,15 @@ def validate_agent(agent_path: Path) -> AgentValidationReport:
     return report
 
 
-def validate_agents_directory(agents_dir: Path) -> list[AgentValidationReport]:
+def validate_agents_directory(
+    agents_dir: Path, cache: ResultCache | None = None, sink: NDJSONSink | None = None
+) -> list[AgentValidationReport]:
     """Validate all agent files in a directory.
 
     Args:
         agents_dir: Path to the agents/ directory
+        cache: Optional result cache shared by all agent files
+        sink: Optional NDJSON sink shared by all agent files
 
     Returns:
         List of AgentValidationReport for each agent
@@ -964,19 +960,19 @@ def validate_agents_directory(agents_dir: Path) -> list[AgentValidationReport]:
     reports = []
 
     if not agents_dir.is_dir():
-        report = AgentValidationReport(agent_path=str(agents_dir))
+        report = AgentValidationReport(agent_path=str(agents_dir), sink=sink)
         report.critical(f"Not a directory: {agents_dir}")
         return [report]
 
     agent_files = list(agents_dir.glob("*.md"))
 
     if not agent_files:
-        report = AgentValidationReport(agent_path=str(agents_dir))
+        report = AgentValidationReport(agent_path=str(agents_dir), sink=sink)
         report.info("No agent files (*.md) found in directory")
         return [report]
 
     for agent_file in sorted(agent_files):
-        reports.append(validate_agent(agent_file))
+        reports.append(validate_agent(agent_file, cache, sink))
 
     return reports
 
@@ -1064,6 +1060,8 @@ def main() -> int:
         help="Show all results including passed checks",
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--ndjson", action="store_true", help="Stream results as NDJSON, then a summary record")
+    parser.add_argument("--cache", action="store_true", help="Only revalidate agent files changed since the last cached run")
     args = parser.parse_args()
 
     path = Path(args.path)
@@ -1073,13 +1071,19 @@ def main() -> int:
         return 1
 
     # Handle directory vs file
+    cache = ResultCache(path if path.is_dir() else path.parent) if args.cache else None
+    sink = NDJSONSink(validator="agent") if args.ndjson else None
     if path.is_dir():
-        reports = validate_agents_directory(path)
+        reports = validate_agents_directory(path, cache, sink)
     else:
-        reports = [validate_agent(path)]
+        reports = [validate_agent(path, cache, sink)]
+    if cache is not None:
+        cache.save()
 
     # Output
-    if args.json:
+    if sink is not None:
+        sink.close({"path": str(path), "files": len(reports)})
+    elif args.json:
         if len(reports) == 1:
             print_json(reports[0])
         else:
@@ -28,7 +28,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import yaml
 from validation_common import (
     COLORS,
     EXIT_CRITICAL,
@@ -39,8 +38,13 @@ from validation_common import (
     SECRET_PATTERNS,
     USER_PATH_PATTERNS,
     VALID_TOOLS,
+    NDJSONSink,
+    ResultCache,
     ValidationReport,
+    ValidationResult,
     check_utf8_encoding,
+    parse_frontmatter,
+    validator_version,
 )
 
 # =============================================================================
@@ -89,33 +93,6 @@ class CommandValidationReport(ValidationReport):
 # =============================================================================
 
 
-def parse_frontmatter(content: str) -> tuple[dict[str, Any] | None, str, int]:
-    """Parse YAML frontmatter from command content.
-
-    Returns:
-        Tuple of (frontmatter_dict, body_content, frontmatter_end_line)
-        Returns (None, content, 0) if no frontmatter found
-    """
-    if not content.startswith("---"):
-        return None, content, 0
-
-    # Find closing ---
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return None, content, 0
-
-    try:
-        frontmatter = yaml.safe_load(parts[1])
-        if frontmatter is None:
-            frontmatter = {}
-        body = parts[2]
-        # Count lines to find frontmatter end
-        fm_end_line = parts[0].count("\n") + parts[1].count("\n") + 2
-        return frontmatter, body, fm_end_line
-    except yaml.YAMLError:
-        return None, content, 0
-
-
 def count_frontmatter_markers(content: str) -> int:
     """Count the number of --- markers in the file."""
     count = 0
@@ -473,16 +450,31 @@ def validate_security(content: str, filename: str, report: CommandValidationRepo
 # =============================================================================
 
 
-def validate_command(command_path: Path) -> CommandValidationReport:
+def validate_command(
+    command_path: Path, cache: ResultCache | None = None, sink: NDJSONSink | None = None
+) -> CommandValidationReport:
     """Validate a complete command file.
 
     Args:
         command_path: Path to the command .md file
+        cache: Optional result cache; an unchanged file replays its cached findings
+        sink: Optional NDJSON sink; each result is streamed as soon as it is added
 
     Returns:
         CommandValidationReport with all results
     """
-    report = CommandValidationReport(command_path=str(command_path))
+    if cache is not None and command_path.is_file():
+        cache_key = cache.key("command", validator_version(__file__), str(command_path), command_path.read_bytes())
+        entry = cache.get(cache_key)
+        if entry is not None:
+            report = CommandValidationReport(command_path=str(command_path), sink=sink)
+            cache.replay(entry, report.append, ValidationResult)
+            return report
+        report = validate_command(command_path, sink=sink)
+        cache.put(cache_key, "command", report.results)
+        return report
+
+    report = CommandValidationReport(command_path=str(command_path), sink=sink)
     filename = command_path.name
 
     # Check file exists
@@ -533,11 +525,15 @@ def validate_command(command_path: Path) -> CommandValidationReport:
     return report
 
 
-def validate_commands_directory(commands_dir: Path) -> list[CommandValidationReport]:
+def validate_commands_directory(
+    commands_dir: Path, cache: ResultCache | None = None, sink: NDJSONSink | None = None
+) -> list[CommandValidationReport]:
     """Validate all command files in a directory.
 
     Args:
         commands_dir: Path to the commands/ directory
+        cache: Optional result cache shared by all command files
+        sink: Optional NDJSON sink shared by all command files
 
     Returns:
         List of CommandValidationReport for each command
@@ -545,19 +541,19 @@ def validate_commands_directory(commands_dir: Path) -> list[CommandValidationRep
     reports = []
 
     if not commands_dir.is_dir():
-        report = CommandValidationReport(command_path=str(commands_dir))
+        report = CommandValidationReport(command_path=str(commands_dir), sink=sink)
         report.critical(f"Not a directory: {commands_dir}")
         return [report]
 
     command_files = list(commands_dir.glob("*.md"))
 
     if not command_files:
-        report = CommandValidationReport(command_path=str(commands_dir))
+        report = CommandValidationReport(command_path=str(commands_dir), sink=sink)
         report.info("No command files (*.md) found in directory")
         return [report]
 
     for command_file in sorted(command_files):
-        reports.append(validate_command(command_file))
+        reports.append(validate_command(command_file, cache, sink))
 
     return reports
 
@@ -653,6 +649,8 @@ def main() -> int:
         help="Show all results including passed checks",
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--ndjson", action="store_true", help="Stream results as NDJSON, then a summary record")
+    parser.add_argument("--cache", action="store_true", help="Only revalidate command files changed since the last cached run")
     args = parser.parse_args()
 
     path = Path(args.path)
@@ -662,13 +660,19 @@ def main() -> int:
         return 1
 
     # Handle directory vs file
+    cache = ResultCache(path if path.is_dir() else path.parent) if args.cache else None
+    sink = NDJSONSink(validator="command") if args.ndjson else None
     if path.is_dir():
-        reports = validate_commands_directory(path)
+        reports = validate_commands_directory(path, cache, sink)
     else:
-        reports = [validate_command(path)]
+        reports = [validate_command(path, cache, sink)]
+    if cache is not None:
+        cache.save()
 
     # Output
-    if args.json:
+    if sink is not None:
+        sink.close({"path": str(path), "files": len(reports)})
+    elif args.json:
         if len(reports) == 1:
             print_json(reports[0])
         else:
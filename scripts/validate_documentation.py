@@ -10,7 +10,7 @@ Implements 13 documentation validation rules:
 3. README should contain usage examples
 4. README should contain description section
 5. README should have proper markdown formatting
-6. No broken internal links
+6. No broken internal links (or #anchors that match no heading)
 7. CHANGELOG.md recommended
 8. Heading hierarchy should have no skips
 9. Code blocks should be closed
@@ -19,10 +19,18 @@ Implements 13 documentation validation rules:
 12. Table structure should be valid
 13. Image references should be valid
 
+Rules 8-12 check the README; with --all-files they check every markdown file
+in the plugin. --workers spreads the per-file checks over a process pool.
+
+Anchors follow GitHub's heading slug rules. Each file's anchor set comes from
+the same parse as the other rules, and links to anchors in other files are
+checked against those sets in one pass after every file is parsed.
+
 Usage:
     uv run python scripts/validate_documentation.py path/to/plugin/
     uv run python scripts/validate_documentation.py path/to/plugin/ --verbose
     uv run python scripts/validate_documentation.py path/to/plugin/ --json
+    uv run python scripts/validate_documentation.py path/to/plugin/ --all-files --workers 4
 
 Exit codes:
     0 - All checks passed
@@ -35,12 +43,26 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-
-from validation_common import ValidationReport
+from typing import Callable
+
+from validation_common import (
+    ChangeScope,
+    IndexedFile,
+    NDJSONSink,
+    PluginTreeIndex,
+    ValidationReport,
+    ValidationResult,
+    get_change_scope,
+    get_tree_index,
+    has_anchor,
+    heading_anchors,
+    markdown_heading,
+)
 
 # =============================================================================
 # Documentation Validation Report
@@ -58,6 +80,176 @@ class DocumentationValidationReport(ValidationReport):
     plugin_path: str = ""
 
 
+# =============================================================================
+# Markdown Document Model
+# =============================================================================
+
+# Code fence marker (a line whose stripped form starts with it opens or closes a block)
+CODE_FENCE = "```"
+
+# Markdown links [text](target) and images ![alt](target)
+LINK_PATTERN = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
+IMAGE_PATTERN = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+
+# Unordered list item marker at the start of a stripped line
+LIST_MARKER_PATTERN = re.compile(r"^([-*+])\s+")
+
+# Table separator row (| --- | :---: |)
+TABLE_SEPARATOR_PATTERN = re.compile(r"^\|[\s\-:|]+\|$")
+
+
+class MarkdownDocument:
+    """A markdown file tokenized once and shared by all documentation rules.
+
+    Line numbers are 1-based. Fenced code blocks are delimited by lines whose
+    stripped form starts with three backticks; an opening fence is followed
+    by its closing fence, so fences alternate between opening and closing.
+
+    Attributes:
+        rel_path: Path relative to the plugin root
+        path: Absolute path to the file
+        label: File name used in findings (rel_path; the README is reported as README.md)
+        content: Decoded file content
+        lines: content split into lines
+        heading_lines: (line, text) for every line starting with "#", code blocks included
+        headings: (line, heading text) for ATX and setext headings outside code blocks
+        fences: (line, info string, is_opening) for every fence line
+        unclosed_fence: Line of an opening fence that is never closed, or None
+        prose: (line, stripped text) for every line outside code blocks and fences
+        list_markers: (line, marker) for unordered list items in prose
+        tables: Runs of consecutive prose lines that are table rows, as (line, stripped text)
+        links: (text, target) for every [text](target), images included
+        images: (alt, target) for every ![alt](target)
+        anchors: Link fragments the file provides (GitHub heading slugs and HTML anchors)
+    """
+
+    __slots__ = (
+        "rel_path",
+        "path",
+        "label",
+        "content",
+        "lines",
+        "heading_lines",
+        "headings",
+        "fences",
+        "unclosed_fence",
+        "prose",
+        "list_markers",
+        "tables",
+        "links",
+        "images",
+        "_anchors",
+    )
+
+    def __init__(self, rel_path: str, path: Path, content: str, label: str | None = None) -> None:
+        self.rel_path = rel_path
+        self.path = path
+        self.label = label or rel_path
+        self.content = content
+        self.lines = content.split("\n")
+        self.heading_lines: list[tuple[int, str]] = []
+        self.headings: list[tuple[int, str]] = []
+        self.fences: list[tuple[int, str, bool]] = []
+        self.unclosed_fence: int | None = None
+        self.prose: list[tuple[int, str]] = []
+        self.list_markers: list[tuple[int, str]] = []
+        self.tables: list[list[tuple[int, str]]] = []
+        self.links: list[tuple[str, str]] = LINK_PATTERN.findall(content) if "](" in content else []
+        self.images: list[tuple[str, str]] = IMAGE_PATTERN.findall(content) if "![" in content else []
+        self._anchors: set[str] | None = None
+        self._tokenize()
+
+    @property
+    def anchors(self) -> set[str]:
+        """Link fragments the file provides, built from its headings on first use."""
+        if self._anchors is None:
+            self._anchors = heading_anchors((text for _, text in self.headings), self.content)
+        return self._anchors
+
+    def _tokenize(self) -> None:
+        """Classify every line in a single pass."""
+        in_code_block = False
+        in_table = False
+        previous: str | None = None  # The prose line directly above, for setext headings
+        for line_num, line in enumerate(self.lines, 1):
+            if line.startswith("#"):
+                self.heading_lines.append((line_num, line))
+
+            stripped = line.strip()
+            if stripped.startswith(CODE_FENCE):
+                in_code_block = not in_code_block
+                self.fences.append((line_num, stripped[len(CODE_FENCE) :].strip(), in_code_block))
+                self.unclosed_fence = line_num if in_code_block else None
+                previous = None
+                continue
+            if in_code_block:
+                continue
+
+            self.prose.append((line_num, stripped))
+            heading = markdown_heading(stripped, previous)
+            if heading is not None:
+                self.headings.append((line_num, heading))
+            # A setext underline is consumed by its heading
+            previous = None if heading is not None and heading is previous else stripped
+            match = LIST_MARKER_PATTERN.match(stripped)
+            if match:
+                self.list_markers.append((line_num, match.group(1)))
+            if stripped.startswith("|") and stripped.endswith("|"):
+                if not in_table:
+                    self.tables.append([])
+                    in_table = True
+                self.tables[-1].append((line_num, stripped))
+            else:
+                in_table = False
+
+
+def load_document(indexed: IndexedFile, label: str | None = None) -> MarkdownDocument:
+    """Read and tokenize one markdown file.
+
+    Args:
+        indexed: The file in the shared tree index
+        label: File name to use in findings (defaults to the relative path)
+
+    Returns:
+        The file's document model
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    return MarkdownDocument(indexed.rel_path, indexed.path, indexed.text(), label)
+
+
+def _table_columns(row: str) -> int:
+    """Number of non-empty cells in a table row."""
+    return len([c for c in row.split("|") if c.strip()])
+
+
+def _resolve_target(doc: MarkdownDocument, target: str, index: PluginTreeIndex) -> str | None:
+    """Resolve a local link target relative to the document, then to the plugin root.
+
+    Both lookups are answered from the tree index's path set, not the disk.
+
+    Returns:
+        The target's normalized path relative to the plugin root, or None if it does not exist
+    """
+    for candidate in (os.path.join(os.path.dirname(doc.rel_path), target), target):
+        if index.exists(candidate):
+            return os.path.normpath(candidate)
+    return None
+
+
+def _document_anchors(index: PluginTreeIndex, rel_path: str) -> set[str] | None:
+    """Anchors of a markdown file in the tree, or None if it cannot be read."""
+    indexed = index.get(rel_path)
+    if indexed is None:
+        return None
+    try:
+        return load_document(indexed).anchors
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
 # =============================================================================
 # Rule 1: README.md should exist at plugin root
 # =============================================================================
@@ -95,34 +287,21 @@ def validate_readme_exists(plugin_path: Path, report: DocumentationValidationRep
 # Rule 2: README should contain installation instructions
 # =============================================================================
 
+INSTALLATION_HEADING_PATTERN = re.compile(r"#+\s*(?:installation|getting\s+started|setup|quick\s*start)", re.IGNORECASE)
+
 
-def validate_installation_section(plugin_path: Path, report: DocumentationValidationReport) -> None:
+def validate_installation_section(readme: MarkdownDocument, report: DocumentationValidationReport) -> None:
     """Validate that README contains installation instructions.
 
     Looks for sections named: Installation, Getting Started, Setup, Quick Start
 
     Args:
-        plugin_path: Path to the plugin directory
+        readme: The README document
         report: Validation report to add results to
     """
-    readme = _find_readme(plugin_path)
-    if readme is None:
-        return  # Already reported in validate_readme_exists
-
-    content = readme.read_text()
-
-    # Pattern matches ## Installation, ## Getting Started, ## Setup, ## Quick Start
-    installation_patterns = [
-        r"^#+\s*installation",
-        r"^#+\s*getting\s+started",
-        r"^#+\s*setup",
-        r"^#+\s*quick\s*start",
-    ]
-
-    for pattern in installation_patterns:
-        if re.search(pattern, content, re.IGNORECASE | re.MULTILINE):
-            report.passed("README contains installation instructions", "README.md")
-            return
+    if any(INSTALLATION_HEADING_PATTERN.match(line) for _, line in readme.heading_lines):
+        report.passed("README contains installation instructions", "README.md")
+        return
 
     report.major(
         "README missing installation section (## Installation, ## Getting Started, ## Setup, or ## Quick Start)",
@@ -134,33 +313,22 @@ def validate_installation_section(plugin_path: Path, report: DocumentationValida
 # Rule 3: README should contain usage examples
 # =============================================================================
 
+USAGE_HEADING_PATTERN = re.compile(r"#+\s*(?:usage|examples?|how\s+to\s+use)", re.IGNORECASE)
 
-def validate_usage_section(plugin_path: Path, report: DocumentationValidationReport) -> None:
+
+def validate_usage_section(readme: MarkdownDocument, report: DocumentationValidationReport) -> None:
     """Validate that README contains usage examples.
 
     Looks for sections named: Usage, Examples, How to Use
 
     Args:
-        plugin_path: Path to the plugin directory
+        readme: The README document
         report: Validation report to add results to
     """
-    readme = _find_readme(plugin_path)
-    if readme is None:
+    if any(USAGE_HEADING_PATTERN.match(line) for _, line in readme.heading_lines):
+        report.passed("README contains usage section", "README.md")
         return
 
-    content = readme.read_text()
-
-    usage_patterns = [
-        r"^#+\s*usage",
-        r"^#+\s*examples?",
-        r"^#+\s*how\s+to\s+use",
-    ]
-
-    for pattern in usage_patterns:
-        if re.search(pattern, content, re.IGNORECASE | re.MULTILINE):
-            report.passed("README contains usage section", "README.md")
-            return
-
     report.major(
         "README missing usage section (## Usage, ## Examples, or ## How to Use)",
         "README.md",
@@ -172,42 +340,34 @@ def validate_usage_section(plugin_path: Path, report: DocumentationValidationRep
 # =============================================================================
 
 
-def validate_description_section(plugin_path: Path, report: DocumentationValidationReport) -> None:
+def validate_description_section(readme: MarkdownDocument, report: DocumentationValidationReport) -> None:
     """Validate that README contains a description.
 
     A description is considered present if there's content between the
     title (h1) and the first h2 section.
 
     Args:
-        plugin_path: Path to the plugin directory
+        readme: The README document
         report: Validation report to add results to
     """
-    readme = _find_readme(plugin_path)
-    if readme is None:
-        return
-
-    content = readme.read_text()
-    lines = content.split("\n")
-
-    # Find the first h1 and first h2
-    h1_idx = None
-    h2_idx = None
-
-    for i, line in enumerate(lines):
-        if line.startswith("# ") and h1_idx is None:
-            h1_idx = i
-        elif line.startswith("## ") and h2_idx is None:
-            h2_idx = i
+    # Find the first h1 and first h2 (line numbers)
+    h1_line = None
+    h2_line = None
+
+    for line_num, line in readme.heading_lines:
+        if line.startswith("# ") and h1_line is None:
+            h1_line = line_num
+        elif line.startswith("## ") and h2_line is None:
+            h2_line = line_num
             break
 
-    if h1_idx is None:
+    if h1_line is None:
         report.major("README missing title (# heading)", "README.md")
         return
 
     # Check for content between h1 and h2 (or end of file)
-    end_idx = h2_idx if h2_idx is not None else len(lines)
-    description_lines = lines[h1_idx + 1 : end_idx]
-    description_content = "\n".join(description_lines).strip()
+    end_idx = h2_line - 1 if h2_line is not None else len(readme.lines)
+    description_content = "\n".join(readme.lines[h1_line:end_idx]).strip()
 
     # Need at least 20 characters of description content
     if len(description_content) >= 20:
@@ -229,55 +389,74 @@ def validate_description_section(plugin_path: Path, report: DocumentationValidat
 # Rule 6: No broken internal links
 # =============================================================================
 
+# A file.md#section link whose anchor is checked later:
+# (target path relative to the plugin root, fragment, link text, link target)
+AnchorRef = tuple[str, str, str, str]
+
+
+def _report_broken_anchor(report: DocumentationValidationReport, rel_path: str, link_text: str, link_target: str) -> None:
+    """Report a link whose fragment matches no heading or anchor in its target."""
+    report.minor(f"Broken anchor link: [{link_text}]({link_target})", rel_path)
+
 
-def validate_broken_links(plugin_path: Path, report: DocumentationValidationReport) -> None:
-    """Validate that all internal links point to existing files.
+def validate_broken_links(
+    plugin_path: Path,
+    doc: MarkdownDocument,
+    report: DocumentationValidationReport,
+    index: PluginTreeIndex | None = None,
+    anchor_refs: list[AnchorRef] | None = None,
+) -> None:
+    """Validate that all internal links in a document point to existing files and anchors.
 
     Checks markdown links [text](path) where path is a local file reference.
     External URLs (http://, https://, mailto:) are skipped.
-    Anchor links (#section) are skipped.
+    Anchor links (#section) are checked against the document's own headings,
+    and file.md#section links against the target file's headings. If
+    anchor_refs is given, anchors in other files are collected there
+    instead, for a caller holding every document's anchors to check in one pass.
 
     Args:
         plugin_path: Path to the plugin directory
+        doc: The markdown document to check
         report: Validation report to add results to
+        index: Shared tree index for this run (built on demand if omitted)
+        anchor_refs: Optional list collecting anchors to check in other files
     """
-    # Find all markdown files in the plugin
-    md_files = list(plugin_path.rglob("*.md"))
-
-    for md_file in md_files:
-        try:
-            content = md_file.read_text()
-        except (OSError, UnicodeDecodeError):
+    index = get_tree_index(plugin_path, index)
+    for link_text, link_target in doc.links:
+        # Skip external URLs
+        if link_target.startswith(("http://", "https://", "mailto:")):
             continue
 
-        # Find all markdown links: [text](target)
-        links = re.findall(r"\[([^\]]*)\]\(([^)]+)\)", content)
-
-        for link_text, link_target in links:
-            # Skip external URLs
-            if link_target.startswith(("http://", "https://", "mailto:")):
-                continue
-
-            # Skip anchor links
-            if link_target.startswith("#"):
-                continue
+        # Split links with anchors (file.md#section)
+        target_path, _, fragment = link_target.partition("#")
+        if not target_path:
+            # Anchor link within this document (#section)
+            if fragment and not has_anchor(doc.anchors, fragment):
+                _report_broken_anchor(report, doc.rel_path, link_text, link_target)
+            continue
 
-            # Handle links with anchors (file.md#section)
-            target_path = link_target.split("#")[0]
-            if not target_path:
-                continue
+        # Resolve relative to the markdown file's directory, then to the plugin root
+        resolved = _resolve_target(doc, target_path, index)
+        if resolved is None:
+            report.major(
+                f"Broken internal link: [{link_text}]({link_target})",
+                doc.rel_path,
+            )
+            continue
 
-            # Resolve relative to the markdown file's directory
-            resolved = md_file.parent / target_path
-            if not resolved.exists():
-                # Also try relative to plugin root
-                resolved = plugin_path / target_path
-                if not resolved.exists():
-                    rel_md = md_file.relative_to(plugin_path)
-                    report.major(
-                        f"Broken internal link: [{link_text}]({link_target})",
-                        str(rel_md),
-                    )
+        # Only markdown targets have heading anchors
+        if not fragment or not resolved.endswith(".md"):
+            continue
+        if resolved == doc.rel_path:
+            anchors: set[str] | None = doc.anchors
+        elif anchor_refs is not None:
+            anchor_refs.append((resolved, fragment, link_text, link_target))
+            continue
+        else:
+            anchors = _document_anchors(index, resolved)
+        if anchors is not None and not has_anchor(anchors, fragment):
+            _report_broken_anchor(report, doc.rel_path, link_text, link_target)
 
 
 # =============================================================================
@@ -313,44 +492,39 @@ def validate_changelog_exists(plugin_path: Path, report: DocumentationValidation
 # Rule 8: Heading hierarchy should have no skips
 # =============================================================================
 
+# ATX-style heading (# Heading); the group is the level marker
+ATX_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+")
 
-def validate_heading_hierarchy(plugin_path: Path, report: DocumentationValidationReport) -> None:
+
+def validate_heading_hierarchy(doc: MarkdownDocument, report: DocumentationValidationReport) -> None:
     """Validate that heading levels don't skip (h1 -> h3 is bad).
 
     Args:
-        plugin_path: Path to the plugin directory
+        doc: The markdown document to check
         report: Validation report to add results to
     """
-    readme = _find_readme(plugin_path)
-    if readme is None:
-        return
-
-    content = readme.read_text()
-    lines = content.split("\n")
-
     # Track current heading level
     current_level = 0
     issues_found = False
 
-    for i, line in enumerate(lines):
-        # Match ATX-style headings (# Heading)
-        match = re.match(r"^(#{1,6})\s+", line)
+    for line_num, line in doc.heading_lines:
+        match = ATX_HEADING_PATTERN.match(line)
         if match:
             level = len(match.group(1))
 
             # Check if we skipped a level
             if current_level > 0 and level > current_level + 1:
                 report.minor(
-                    f"Heading hierarchy skip: level {current_level} to level {level} (line {i + 1})",
-                    "README.md",
-                    i + 1,
+                    f"Heading hierarchy skip: level {current_level} to level {level} (line {line_num})",
+                    doc.label,
+                    line_num,
                 )
                 issues_found = True
 
             current_level = level
 
     if not issues_found and current_level > 0:
-        report.passed("Heading hierarchy is correct", "README.md")
+        report.passed("Heading hierarchy is correct", doc.label)
 
 
 # =============================================================================
@@ -358,46 +532,24 @@ def validate_heading_hierarchy(plugin_path: Path, report: DocumentationValidatio
 # =============================================================================
 
 
-def validate_code_block_closed(plugin_path: Path, report: DocumentationValidationReport) -> None:
+def validate_code_block_closed(doc: MarkdownDocument, report: DocumentationValidationReport) -> None:
     """Validate that all code blocks are properly closed.
 
     Checks that ``` fences are balanced (even count).
 
     Args:
-        plugin_path: Path to the plugin directory
+        doc: The markdown document to check
         report: Validation report to add results to
     """
-    readme = _find_readme(plugin_path)
-    if readme is None:
-        return
-
-    content = readme.read_text()
-    lines = content.split("\n")
-
-    # Track code fence state
-    in_code_block = False
-    open_line = 0
-    issues_found = False
-
-    for i, line in enumerate(lines):
-        # Check for code fence (``` with optional language)
-        if line.strip().startswith("```"):
-            if not in_code_block:
-                in_code_block = True
-                open_line = i + 1
-            else:
-                in_code_block = False
-
-    if in_code_block:
+    open_line = doc.unclosed_fence
+    if open_line is not None:
         report.major(
             f"Unclosed code block starting at line {open_line}",
-            "README.md",
+            doc.label,
             open_line,
         )
-        issues_found = True
-
-    if not issues_found:
-        report.passed("All code blocks are properly closed", "README.md")
+    else:
+        report.passed("All code blocks are properly closed", doc.label)
 
 
 # =============================================================================
@@ -405,46 +557,28 @@ def validate_code_block_closed(plugin_path: Path, report: DocumentationValidatio
 # =============================================================================
 
 
-def validate_code_block_language_tags(plugin_path: Path, report: DocumentationValidationReport) -> None:
+def validate_code_block_language_tags(doc: MarkdownDocument, report: DocumentationValidationReport) -> None:
     """Validate that code blocks have language tags.
 
     Checks that code fences specify a language (```python not just ```).
 
     Args:
-        plugin_path: Path to the plugin directory
+        doc: The markdown document to check
         report: Validation report to add results to
     """
-    readme = _find_readme(plugin_path)
-    if readme is None:
-        return
-
-    content = readme.read_text()
-    lines = content.split("\n")
-
-    in_code_block = False
     issues_found = False
 
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-
-        if stripped.startswith("```"):
-            if not in_code_block:
-                # Opening fence - check for language tag
-                in_code_block = True
-                # Extract what comes after ```
-                lang_part = stripped[3:].strip()
-                if not lang_part:
-                    report.minor(
-                        f"Code block at line {i + 1} missing language tag",
-                        "README.md",
-                        i + 1,
-                    )
-                    issues_found = True
-            else:
-                in_code_block = False
+    for line_num, info, is_opening in doc.fences:
+        if is_opening and not info:
+            report.minor(
+                f"Code block at line {line_num} missing language tag",
+                doc.label,
+                line_num,
+            )
+            issues_found = True
 
     if not issues_found:
-        report.passed("All code blocks have language tags", "README.md")
+        report.passed("All code blocks have language tags", doc.label)
 
 
 # =============================================================================
@@ -452,50 +586,25 @@ def validate_code_block_language_tags(plugin_path: Path, report: DocumentationVa
 # =============================================================================
 
 
-def validate_list_formatting(plugin_path: Path, report: DocumentationValidationReport) -> None:
+def validate_list_formatting(doc: MarkdownDocument, report: DocumentationValidationReport) -> None:
     """Validate that list formatting is consistent.
 
     Checks for mixed list markers (-, *, +) in the same document.
 
     Args:
-        plugin_path: Path to the plugin directory
+        doc: The markdown document to check
         report: Validation report to add results to
     """
-    readme = _find_readme(plugin_path)
-    if readme is None:
-        return
-
-    content = readme.read_text()
-    lines = content.split("\n")
-
-    # Track list markers used
-    markers_used: set[str] = set()
-    in_code_block = False
-
-    for line in lines:
-        stripped = line.strip()
-
-        # Skip code blocks
-        if stripped.startswith("```"):
-            in_code_block = not in_code_block
-            continue
-
-        if in_code_block:
-            continue
-
-        # Check for unordered list items
-        match = re.match(r"^([-*+])\s+", stripped)
-        if match:
-            markers_used.add(match.group(1))
+    markers_used = {marker for _, marker in doc.list_markers}
 
     if len(markers_used) > 1:
         markers = ", ".join(sorted(markers_used))
         report.minor(
             f"Inconsistent list markers used: {markers} (prefer using one consistently)",
-            "README.md",
+            doc.label,
         )
     elif markers_used:
-        report.passed("List formatting is consistent", "README.md")
+        report.passed("List formatting is consistent", doc.label)
 
 
 # =============================================================================
@@ -503,7 +612,7 @@ def validate_list_formatting(plugin_path: Path, report: DocumentationValidationR
 # =============================================================================
 
 
-def validate_table_structure(plugin_path: Path, report: DocumentationValidationReport) -> None:
+def validate_table_structure(doc: MarkdownDocument, report: DocumentationValidationReport) -> None:
     """Validate that markdown tables have consistent structure.
 
     Checks that:
@@ -511,66 +620,37 @@ def validate_table_structure(plugin_path: Path, report: DocumentationValidationR
     - Data rows have same number of columns as header
 
     Args:
-        plugin_path: Path to the plugin directory
+        doc: The markdown document to check
         report: Validation report to add results to
     """
-    readme = _find_readme(plugin_path)
-    if readme is None:
-        return
-
-    content = readme.read_text()
-    lines = content.split("\n")
-
-    in_table = False
     header_cols = 0
     issues_found = False
-    in_code_block = False
-
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-
-        # Skip code blocks
-        if stripped.startswith("```"):
-            in_code_block = not in_code_block
-            continue
-
-        if in_code_block:
-            continue
 
-        # Check for table row
-        if stripped.startswith("|") and stripped.endswith("|"):
-            cols = len([c for c in stripped.split("|") if c.strip()])
-
-            if not in_table:
-                # Header row
-                in_table = True
-                header_cols = cols
-            elif re.match(r"^\|[\s\-:|]+\|$", stripped):
-                # Separator row
-                sep_cols = len([c for c in stripped.split("|") if c.strip()])
-                if sep_cols != header_cols:
-                    report.minor(
-                        f"Table separator row has {sep_cols} columns, header has {header_cols} (line {i + 1})",
-                        "README.md",
-                        i + 1,
-                    )
-                    issues_found = True
-            else:
-                # Data row
+    for table in doc.tables:
+        # First row is the header
+        header_cols = _table_columns(table[0][1])
+        for line_num, row in table[1:]:
+            cols = _table_columns(row)
+            if TABLE_SEPARATOR_PATTERN.match(row):
                 if cols != header_cols:
                     report.minor(
-                        f"Table row has {cols} columns, header has {header_cols} (line {i + 1})",
-                        "README.md",
-                        i + 1,
+                        f"Table separator row has {cols} columns, header has {header_cols} (line {line_num})",
+                        doc.label,
+                        line_num,
                     )
                     issues_found = True
-        else:
-            # Not a table row - reset table state
-            in_table = False
-            header_cols = 0
+            elif cols != header_cols:
+                report.minor(
+                    f"Table row has {cols} columns, header has {header_cols} (line {line_num})",
+                    doc.label,
+                    line_num,
+                )
+                issues_found = True
 
-    if not issues_found and header_cols > 0:
-        report.passed("Table structure is valid", "README.md")
+    # Only a table that runs to the end of the document is still open here
+    table_at_end = bool(doc.tables) and doc.tables[-1][-1] == doc.prose[-1]
+    if not issues_found and table_at_end and header_cols > 0:
+        report.passed("Table structure is valid", doc.label)
 
 
 # =============================================================================
@@ -578,44 +658,35 @@ def validate_table_structure(plugin_path: Path, report: DocumentationValidationR
 # =============================================================================
 
 
-def validate_image_references(plugin_path: Path, report: DocumentationValidationReport) -> None:
-    """Validate that image references point to existing files.
+def validate_image_references(
+    plugin_path: Path,
+    doc: MarkdownDocument,
+    report: DocumentationValidationReport,
+    index: PluginTreeIndex | None = None,
+) -> None:
+    """Validate that image references in a document point to existing files.
 
     Checks markdown images ![alt](path) where path is a local file.
     External URLs are skipped.
 
     Args:
         plugin_path: Path to the plugin directory
+        doc: The markdown document to check
         report: Validation report to add results to
+        index: Shared tree index for this run (built on demand if omitted)
     """
-    # Find all markdown files
-    md_files = list(plugin_path.rglob("*.md"))
-
-    for md_file in md_files:
-        try:
-            content = md_file.read_text()
-        except (OSError, UnicodeDecodeError):
+    index = get_tree_index(plugin_path, index)
+    for alt_text, img_path in doc.images:
+        # Skip external URLs
+        if img_path.startswith(("http://", "https://", "data:")):
             continue
 
-        # Find all image references: ![alt](path)
-        images = re.findall(r"!\[([^\]]*)\]\(([^)]+)\)", content)
-
-        for alt_text, img_path in images:
-            # Skip external URLs
-            if img_path.startswith(("http://", "https://", "data:")):
-                continue
-
-            # Resolve relative to the markdown file's directory
-            resolved = md_file.parent / img_path
-            if not resolved.exists():
-                # Also try relative to plugin root
-                resolved = plugin_path / img_path
-                if not resolved.exists():
-                    rel_md = md_file.relative_to(plugin_path)
-                    report.major(
-                        f"Missing image: ![{alt_text}]({img_path})",
-                        str(rel_md),
-                    )
+        # Resolve relative to the markdown file's directory, then to the plugin root
+        if _resolve_target(doc, img_path, index) is None:
+            report.major(
+                f"Missing image: ![{alt_text}]({img_path})",
+                doc.rel_path,
+            )
 
 
 # =============================================================================
@@ -643,19 +714,160 @@ def _find_readme(plugin_path: Path) -> Path | None:
 # Main Validation Function
 # =============================================================================
 
+# Rules run on the README document, in report order around rules 6 and 7
+README_CONTENT_RULES: tuple[Callable[[MarkdownDocument, DocumentationValidationReport], None], ...] = (
+    validate_installation_section,  # Rule 2
+    validate_usage_section,  # Rule 3
+    validate_description_section,  # Rule 4
+)
+
+# Structural rules: run on the README, or on every markdown file with all_files
+STRUCTURE_RULES: tuple[Callable[[MarkdownDocument, DocumentationValidationReport], None], ...] = (
+    validate_heading_hierarchy,  # Rule 8
+    validate_code_block_closed,  # Rule 9
+    validate_code_block_language_tags,  # Rule 10
+    validate_list_formatting,  # Rule 11
+    validate_table_structure,  # Rule 12
+)
+
+# Markdown files per worker task; small enough to balance, large enough to amortize pickling
+DOCUMENT_BATCH_SIZE = 32
+
+# Findings for one document: (rule 6 links, rules 8-12 structure, rule 13 images,
+# the document's anchors or None if unreadable, anchors it links to in other files)
+DocumentFindings = tuple[
+    list[ValidationResult],
+    list[ValidationResult],
+    list[ValidationResult],
+    "set[str] | None",
+    list[AnchorRef],
+]
+
+# Tree index of a worker process, built once and reused for every batch it checks
+_worker_index: PluginTreeIndex | None = None
+
+
+def _init_worker(plugin_path: Path) -> None:
+    """Process pool initializer: give the worker one tree index for all its batches."""
+    global _worker_index
+    _worker_index = PluginTreeIndex(plugin_path)
+
+
+def check_documents(
+    plugin_path: Path,
+    rel_paths: list[str],
+    readme_name: str | None,
+    all_files: bool,
+    index: PluginTreeIndex | None = None,
+) -> list[DocumentFindings]:
+    """Read, tokenize and check a batch of markdown files.
+
+    Runs in worker processes, so it uses the worker's tree index (or builds
+    one) unless one is passed in, and returns plain result lists instead of
+    writing to a report.
+
+    Args:
+        plugin_path: Path to the plugin directory
+        rel_paths: Markdown files to check, relative to plugin_path
+        readme_name: File name of the root README (reported as README.md), if any
+        all_files: Also run the structural rules (8-12) on every file
+        index: Tree index to read through (built on demand if omitted)
+
+    Returns:
+        Findings for each file, in rel_paths order (empty for unreadable files)
+    """
+    index = get_tree_index(plugin_path, index if index is not None else _worker_index)
+    findings: list[DocumentFindings] = []
+    for rel_path in rel_paths:
+        indexed = index.get(rel_path)
+        if indexed is None:
+            findings.append(([], [], [], None, []))
+            continue
+        try:
+            doc = load_document(indexed, "README.md" if rel_path == readme_name else None)
+        except (OSError, UnicodeDecodeError):
+            findings.append(([], [], [], None, []))
+            continue
 
-def validate_documentation(plugin_path: Path) -> DocumentationValidationReport:
+        links = DocumentationValidationReport()
+        anchor_refs: list[AnchorRef] = []
+        validate_broken_links(plugin_path, doc, links, index, anchor_refs)
+        structure = DocumentationValidationReport()
+        if all_files:
+            for rule in STRUCTURE_RULES:
+                rule(doc, structure)
+        images = DocumentationValidationReport()
+        validate_image_references(plugin_path, doc, images, index)
+        findings.append((links.results, structure.results, images.results, doc.anchors, anchor_refs))
+    return findings
+
+
+def _check_all_documents(
+    plugin_path: Path,
+    rel_paths: list[str],
+    readme_name: str | None,
+    all_files: bool,
+    index: PluginTreeIndex,
+    workers: int,
+) -> list[DocumentFindings]:
+    """Check markdown files serially or in a process pool, in rel_paths order."""
+    if workers <= 1 or len(rel_paths) <= DOCUMENT_BATCH_SIZE:
+        return check_documents(plugin_path, rel_paths, readme_name, all_files, index)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    batches = [rel_paths[i : i + DOCUMENT_BATCH_SIZE] for i in range(0, len(rel_paths), DOCUMENT_BATCH_SIZE)]
+    findings: list[DocumentFindings] = []
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(batches)),
+        initializer=_init_worker,
+        initargs=(plugin_path,),
+    ) as pool:
+        # map() yields in submission order, so the merge is deterministic
+        for batch_findings in pool.map(
+            check_documents,
+            [plugin_path] * len(batches),
+            batches,
+            [readme_name] * len(batches),
+            [all_files] * len(batches),
+        ):
+            findings.extend(batch_findings)
+    return findings
+
+
+def validate_documentation(
+    plugin_path: Path,
+    index: PluginTreeIndex | None = None,
+    scope: ChangeScope | None = None,
+    sink: NDJSONSink | None = None,
+    all_files: bool = False,
+    workers: int = 1,
+) -> DocumentationValidationReport:
     """Validate all documentation in a plugin directory.
 
-    Runs all 13 validation rules and returns a complete report.
+    Runs all 13 validation rules and returns a complete report. Each markdown
+    file is read and tokenized once into a MarkdownDocument, and the rules
+    visit those documents. With a change scope, the README content rules only
+    run if the README is in scope and links/images are only checked in
+    markdown files in scope.
+
+    The structural rules (8-12) check only the README unless all_files is
+    set, in which case they check every markdown file. With workers > 1 the
+    per-file checks run in a process pool; findings are merged in walk
+    order, so the report is identical to a serial run.
 
     Args:
         plugin_path: Path to the plugin directory
+        index: Shared tree index for this run (built on demand if omitted)
+        scope: Optional change scope (see --changed-since)
+        sink: Optional NDJSON sink; each result is streamed as soon as it is added
+        all_files: Run the structural rules on every markdown file
+        workers: Maximum worker processes for the per-file checks (1 = serial)
 
     Returns:
         DocumentationValidationReport with all results
     """
-    report = DocumentationValidationReport(plugin_path=str(plugin_path))
+    report = DocumentationValidationReport(plugin_path=str(plugin_path), sink=sink)
 
     # Check plugin directory exists
     if not plugin_path.is_dir():
@@ -667,40 +879,59 @@ def validate_documentation(plugin_path: Path) -> DocumentationValidationReport:
         # Can't validate other rules without README
         return report
 
-    # Rule 2: Installation section
-    validate_installation_section(plugin_path, report)
+    index = get_tree_index(plugin_path, index)
 
-    # Rule 3: Usage section
-    validate_usage_section(plugin_path, report)
+    readme_path = _find_readme(plugin_path)
+    readme_name = readme_path.name if readme_path is not None else None
+    readme: MarkdownDocument | None = None
+    if readme_name is not None and (scope is None or scope.includes(readme_name)):
+        indexed_readme = index.get(readme_name)
+        try:
+            readme = load_document(indexed_readme, "README.md") if indexed_readme is not None else None
+        except (OSError, UnicodeDecodeError) as e:
+            report.major(f"Could not read README: {e}", readme_name)
 
-    # Rule 4: Description section
-    validate_description_section(plugin_path, report)
+    if readme is not None:
+        for rule in README_CONTENT_RULES:
+            rule(readme, report)
 
     # Rule 5 is covered by rules 8-12
 
-    # Rule 6: Broken links
-    validate_broken_links(plugin_path, report)
+    # Rules 6 and 13 (and 8-12 with all_files) visit every markdown file in scope
+    rel_paths = [
+        indexed.rel_path
+        for indexed in index.iter_files(suffixes={".md"})
+        if scope is None or scope.includes(indexed.rel_path)
+    ]
+    findings = _check_all_documents(plugin_path, rel_paths, readme_name, all_files, index, workers)
+
+    # Rule 6: Broken links, then each file's links to anchors in other files,
+    # looked up in the anchors every checked document returned
+    anchor_index = {rel_path: found[3] for rel_path, found in zip(rel_paths, findings)}
+    for rel_path, (links, _, _, _, anchor_refs) in zip(rel_paths, findings):
+        report.extend(links)
+        for target, fragment, link_text, link_target in anchor_refs:
+            if target not in anchor_index:
+                # Outside the change scope: parsed here, once
+                anchor_index[target] = _document_anchors(index, target)
+            anchors = anchor_index[target]
+            if anchors is not None and not has_anchor(anchors, fragment):
+                _report_broken_anchor(report, rel_path, link_text, link_target)
 
     # Rule 7: CHANGELOG recommended
     validate_changelog_exists(plugin_path, report)
 
-    # Rule 8: Heading hierarchy
-    validate_heading_hierarchy(plugin_path, report)
-
-    # Rule 9: Code blocks closed
-    validate_code_block_closed(plugin_path, report)
-
-    # Rule 10: Code block language tags
-    validate_code_block_language_tags(plugin_path, report)
-
-    # Rule 11: List formatting
-    validate_list_formatting(plugin_path, report)
-
-    # Rule 12: Table structure
-    validate_table_structure(plugin_path, report)
+    # Rules 8-12: Heading hierarchy, code blocks closed, language tags, lists, tables
+    if all_files:
+        for _, structure, _, _, _ in findings:
+            report.extend(structure)
+    elif readme is not None:
+        for rule in STRUCTURE_RULES:
+            rule(readme, report)
 
     # Rule 13: Image references
-    validate_image_references(plugin_path, report)
+    for _, _, images, _, _ in findings:
+        report.extend(images)
 
     return report
 
@@ -829,6 +1060,25 @@ def main() -> int:
         help="Show all results including passed checks",
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--ndjson", action="store_true", help="Stream results as NDJSON, then a summary record")
+    parser.add_argument(
+        "--changed-since",
+        metavar="REV",
+        help="Only check files changed since git revision REV, plus the files that reference them",
+    )
+    parser.add_argument(
+        "--all-files",
+        action="store_true",
+        help="Check heading, code block, list and table structure in every markdown file, not just the README",
+    )
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Check markdown files in up to N worker processes (default: 1, serial)",
+    )
     args = parser.parse_args()
 
     plugin_path = Path(args.plugin_path)
@@ -837,9 +1087,22 @@ def main() -> int:
         print(f"Error: {plugin_path} does not exist", file=sys.stderr)
         return 1
 
-    report = validate_documentation(plugin_path)
+    # Shared by the change scope and the validator
+    index = PluginTreeIndex(plugin_path)
+    scope = None
+    if args.changed_since:
+        try:
+            scope = get_change_scope(plugin_path, args.changed_since, index)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+    sink = NDJSONSink(validator="documentation") if args.ndjson else None
+    report = validate_documentation(plugin_path, index, scope, sink, args.all_files, args.workers)
 
-    if args.json:
+    if sink is not None:
+        sink.close({"plugin_path": report.plugin_path})
+    elif args.json:
         print_json(report)
     else:
         print_results(report, args.verbose)
@@ -19,16 +19,24 @@ from __future__ import annotations
 
 import argparse
 import json
-import os
 import re
 import sys
 from pathlib import Path
 
 from validation_common import (
     SKIP_DIRS,
+    ChangeScope,
+    IndexedFile,
+    NDJSONSink,
+    PluginTreeIndex,
+    ResultCache,
     ValidationReport,
+    ValidationResult,
+    get_change_scope,
+    get_tree_index,
     print_report_summary,
     print_results_by_level,
+    validator_version,
 )
 
 # =============================================================================
@@ -163,8 +171,8 @@ BINARY_EXTENSIONS = {
 class EncodingValidationReport(ValidationReport):
     """Extended validation report for encoding-specific statistics."""
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, sink: NDJSONSink | None = None, keep_passed_info: bool = True) -> None:
+        super().__init__(sink=sink, keep_passed_info=keep_passed_info)
         self.stats: dict[str, int] = {
             "files_scanned": 0,
             "files_skipped": 0,
@@ -188,13 +196,20 @@ class EncodingValidationReport(ValidationReport):
 # =============================================================================
 
 
-def is_binary_file(file_path: Path) -> bool:
-    """Check if a file is binary based on extension or content."""
+def is_binary_file(file_path: Path, content: bytes | None = None) -> bool:
+    """Check if a file is binary based on extension or content.
+
+    Args:
+        file_path: Path to the file
+        content: Already-loaded file bytes (read from file_path if omitted)
+    """
     # Check extension first (fast path)
     if file_path.suffix.lower() in BINARY_EXTENSIONS:
         return True
 
     # Check file content for null bytes (binary indicator)
+    if content is not None:
+        return b"\x00" in content[:8192]
     try:
         with open(file_path, "rb") as f:
             chunk = f.read(8192)
@@ -215,14 +230,21 @@ def should_skip_directory(dir_name: str) -> bool:
     return False
 
 
-def is_text_file(file_path: Path) -> bool:
-    """Determine if file should be treated as text based on extension."""
+def is_text_file(file_path: Path, content: bytes | None = None) -> bool:
+    """Determine if file should be treated as text based on extension.
+
+    Args:
+        file_path: Path to the file
+        content: Already-loaded file bytes (read from file_path if omitted)
+    """
     suffix = file_path.suffix.lower()
     # Explicit text extensions
     if suffix in TEXT_EXTENSIONS:
         return True
     # Shell scripts without extension (check shebang)
     if not suffix:
+        if content is not None:
+            return content.startswith(b"#!")
         try:
             with open(file_path, "rb") as f:
                 first_line = f.readline(128)
@@ -444,21 +466,43 @@ def check_line_endings(content: bytes, file_path: str, suffix: str, report: Enco
 # =============================================================================
 
 
-def validate_file(file_path: Path, plugin_path: Path, report: EncodingValidationReport) -> None:
+def validate_file(
+    file_path: Path,
+    plugin_path: Path,
+    report: EncodingValidationReport,
+    indexed: IndexedFile | None = None,
+    cache: ResultCache | None = None,
+) -> None:
     """Run all encoding validations on a single file.
 
     Args:
         file_path: Absolute path to the file
         plugin_path: Root plugin path for relative path calculation
         report: Report to add results to
+        indexed: Shared tree index entry for the file (content read from disk if omitted)
+        cache: Optional result cache; unchanged content replays its cached findings
     """
-    rel_path = str(file_path.relative_to(plugin_path))
+    rel_path = indexed.rel_path if indexed is not None else str(file_path.relative_to(plugin_path))
     suffix = file_path.suffix.lower()
 
     try:
         # Read raw bytes for encoding checks
-        with open(file_path, "rb") as f:
-            content_bytes = f.read()
+        if indexed is not None:
+            content_bytes = indexed.raw
+        else:
+            with open(file_path, "rb") as f:
+                content_bytes = f.read()
+
+        if cache is not None:
+            cache_key = cache.key("encoding", validator_version(__file__), rel_path, content_bytes)
+            entry = cache.get(cache_key)
+            if entry is not None:
+                cache.replay(entry, report.append, ValidationResult)
+                for stat_name, count in entry["data"].items():
+                    report.stats[stat_name] += count
+                return
+            first_result = len(report.results)
+            stats_before = dict(report.stats)
 
         report.stats["files_scanned"] += 1
 
@@ -481,12 +525,23 @@ def validate_file(file_path: Path, plugin_path: Path, report: EncodingValidation
         # Rules 5-7: Line endings (can check on raw bytes)
         check_line_endings(content_bytes, rel_path, suffix, report)
 
+        if cache is not None:
+            stats_delta = {k: v - stats_before[k] for k, v in report.stats.items() if v != stats_before[k]}
+            cache.put(cache_key, "encoding", report.results[first_result:], stats_delta)
+
     except (OSError, PermissionError) as e:
         report.minor(f"Cannot read file: {rel_path} ({e})")
         report.stats["files_skipped"] += 1
 
 
-def validate_encoding(plugin_path: Path) -> EncodingValidationReport:
+def validate_encoding(
+    plugin_path: Path,
+    index: PluginTreeIndex | None = None,
+    cache: ResultCache | None = None,
+    scope: ChangeScope | None = None,
+    sink: NDJSONSink | None = None,
+    keep_passed_info: bool = True,
+) -> EncodingValidationReport:
     """Run all encoding validations on a plugin directory.
 
     Performs comprehensive encoding analysis including:
@@ -500,11 +555,16 @@ def validate_encoding(plugin_path: Path) -> EncodingValidationReport:
 
     Args:
         plugin_path: Path to the plugin directory
+        index: Shared tree index for this run (built on demand if omitted)
+        cache: Optional result cache; unchanged files replay their cached findings
+        scope: Optional change scope; only files in it are checked (see --changed-since)
+        sink: Optional NDJSON sink; each finding is streamed as soon as it is added
+        keep_passed_info: If False, PASSED and INFO results are only counted, not stored
 
     Returns:
         EncodingValidationReport with all encoding findings
     """
-    report = EncodingValidationReport()
+    report = EncodingValidationReport(sink=sink, keep_passed_info=keep_passed_info)
 
     # Verify plugin path exists
     if not plugin_path.exists():
@@ -517,24 +577,28 @@ def validate_encoding(plugin_path: Path) -> EncodingValidationReport:
 
     report.info(f"Starting encoding scan of: {plugin_path}")
 
-    # Walk through all files
-    for root, dirs, files in os.walk(plugin_path):
-        # Filter out directories to skip
-        dirs[:] = [d for d in dirs if not should_skip_directory(d)]
+    # Walk through all files, filtering out directories to skip
+    for indexed in get_tree_index(plugin_path, index).iter_files(skip_dir=should_skip_directory):
+        file_path = indexed.path
+        if scope is not None and not scope.includes(indexed.rel_path):
+            continue
 
-        for filename in files:
-            file_path = Path(root) / filename
-
-            # Skip binary files
-            if is_binary_file(file_path):
-                report.stats["files_skipped"] += 1
-                continue
-
-            # Only check text files
-            if is_text_file(file_path) or file_path.suffix.lower() in TEXT_EXTENSIONS:
-                validate_file(file_path, plugin_path, report)
-            else:
-                report.stats["files_skipped"] += 1
+        # Skip binary files (extension check first, so binaries are never read)
+        try:
+            content = None if indexed.suffix in BINARY_EXTENSIONS else indexed.raw
+        except (OSError, PermissionError):
+            # Treat unreadable files as binary
+            report.stats["files_skipped"] += 1
+            continue
+        if is_binary_file(file_path, content):
+            report.stats["files_skipped"] += 1
+            continue
+
+        # Only check text files
+        if is_text_file(file_path, content) or indexed.suffix in TEXT_EXTENSIONS:
+            validate_file(file_path, plugin_path, report, indexed, cache)
+        else:
+            report.stats["files_skipped"] += 1
 
     # Report scan statistics
     report.info(
@@ -586,14 +650,45 @@ Exit Codes:
     parser.add_argument("plugin_path", type=Path, help="Path to the plugin directory to validate")
     parser.add_argument("-v", "--verbose", action="store_true", help="Show all results including INFO and PASSED")
     parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    parser.add_argument("--ndjson", action="store_true", help="Stream results as NDJSON, then a summary record")
+    parser.add_argument("--cache", action="store_true", help="Only recheck files changed since the last cached run")
+    parser.add_argument(
+        "--changed-since",
+        metavar="REV",
+        help="Only check files changed since git revision REV, plus the files that reference them",
+    )
 
     args = parser.parse_args()
 
+    # Shared by the change scope and the validator
+    index = PluginTreeIndex(args.plugin_path)
+    scope = None
+    if args.changed_since:
+        try:
+            scope = get_change_scope(args.plugin_path, args.changed_since, index)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
     # Run validation
-    report = validate_encoding(args.plugin_path)
+    cache = ResultCache(args.plugin_path) if args.cache else None
+    sink = NDJSONSink(validator="encoding") if args.ndjson else None
+    report = validate_encoding(
+        args.plugin_path,
+        index=index,
+        cache=cache,
+        scope=scope,
+        sink=sink,
+        # PASSED/INFO results are only printed in verbose and JSON output
+        keep_passed_info=args.verbose or args.json,
+    )
+    if cache is not None:
+        cache.save()
 
     # Output results
-    if args.json:
+    if sink is not None:
+        sink.close({"plugin_path": str(args.plugin_path), "encoding_stats": report.stats})
+    elif args.json:
         output = report.to_dict()
         output["plugin_path"] = str(args.plugin_path)
         print(json.dumps(output, indent=2))
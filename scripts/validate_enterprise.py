@@ -38,16 +38,17 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
 from validation_common import (
     EXIT_CRITICAL,
     EXIT_MAJOR,
     EXIT_OK,
     Level,
+    NDJSONSink,
     ValidationReport,
     ValidationResult,
     calculate_letter_grade,
 )
+from validation_common import parse_frontmatter as parse_common_frontmatter
 
 # =============================================================================
 # Enterprise Compliance Constants
@@ -232,22 +233,8 @@ def parse_frontmatter(content: str) -> tuple[dict[str, Any] | None, str]:
         Tuple of (frontmatter_dict, body_content)
         Returns (None, content) if no frontmatter found
     """
-    if not content.startswith("---"):
-        return None, content
-
-    # Find closing ---
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return None, content
-
-    try:
-        frontmatter = yaml.safe_load(parts[1])
-        if frontmatter is None:
-            frontmatter = {}
-        body = parts[2]
-        return frontmatter, body
-    except yaml.YAMLError:
-        return None, content
+    frontmatter, body, _ = parse_common_frontmatter(content)
+    return frontmatter, body
 
 
 # =============================================================================
@@ -682,6 +669,7 @@ def validate_agent_compliance(
 def validate_enterprise_compliance(
     plugin_path: Path,
     strict: bool = False,
+    sink: NDJSONSink | None = None,
 ) -> EnterpriseComplianceReport:
     """Validate enterprise compliance for a Claude Code plugin.
 
@@ -691,6 +679,7 @@ def validate_enterprise_compliance(
     Args:
         plugin_path: Path to the plugin directory
         strict: If True, all rules become CRITICAL instead of MAJOR
+        sink: Optional NDJSON sink; each result is streamed as soon as it is added
 
     Returns:
         EnterpriseComplianceReport with all validation results
@@ -698,6 +687,7 @@ def validate_enterprise_compliance(
     report = EnterpriseComplianceReport(
         plugin_path=str(plugin_path),
         strict_mode=strict,
+        sink=sink,
     )
 
     # Check plugin directory exists
@@ -900,6 +890,11 @@ Exit codes:
         action="store_true",
         help="Output results as JSON",
     )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream results as NDJSON, then a summary record",
+    )
     parser.add_argument(
         "--strict",
         action="store_true",
@@ -913,9 +908,20 @@ Exit codes:
         print(f"Error: {plugin_path} does not exist", file=sys.stderr)
         return EXIT_CRITICAL
 
-    report = validate_enterprise_compliance(plugin_path, strict=args.strict)
+    sink = NDJSONSink(validator="enterprise") if args.ndjson else None
+    report = validate_enterprise_compliance(plugin_path, strict=args.strict, sink=sink)
 
-    if args.json:
+    if sink is not None:
+        sink.close(
+            {
+                "plugin_path": report.plugin_path,
+                "compliant_skills": report.compliant_skills,
+                "total_skills": report.total_skills,
+                "compliant_agents": report.compliant_agents,
+                "total_agents": report.total_agents,
+            }
+        )
+    elif args.json:
         print_json(report)
     else:
         print_results(report, args.verbose)
@@ -27,14 +27,11 @@ import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal, cast
+from typing import Any, cast
 
-from validation_common import resolve_tool_command
-
-# Validation result levels
-Level = Literal["CRITICAL", "MAJOR", "MINOR", "INFO", "PASSED"]
+from validation_common import NDJSONSink, ValidationReport, resolve_tool_command
 
 # Valid hook event names per official docs
 VALID_HOOK_EVENTS = {
@@ -127,76 +124,19 @@ LINTABLE_EXTENSIONS = {
 
 
 @dataclass
-class ValidationResult:
-    """Single validation result."""
+class HookValidationReport(ValidationReport):
+    """Validation report for a hooks.json file, extends base ValidationReport with hook_path."""
 
-    level: Level
-    message: str
-    file: str | None = None
-    line: int | None = None
+    hook_path: str = ""
 
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for JSON serialization."""
+        base = super().to_dict()
+        base["hook_path"] = self.hook_path
+        return base
 
-@dataclass
-class ValidationReport:
-    """Complete validation report for a hook configuration."""
-
-    hook_path: str
-    results: list[ValidationResult] = field(default_factory=list)
-
-    def add(
-        self,
-        level: Level,
-        message: str,
-        file: str | None = None,
-        line: int | None = None,
-    ) -> None:
-        """Add a validation result."""
-        self.results.append(ValidationResult(level, message, file, line))
-
-    def passed(self, message: str, file: str | None = None) -> None:
-        """Add a passed check."""
-        self.add("PASSED", message, file)
-
-    def info(self, message: str, file: str | None = None) -> None:
-        """Add an info message."""
-        self.add("INFO", message, file)
-
-    def minor(self, message: str, file: str | None = None, line: int | None = None) -> None:
-        """Add a minor issue."""
-        self.add("MINOR", message, file, line)
-
-    def major(self, message: str, file: str | None = None, line: int | None = None) -> None:
-        """Add a major issue."""
-        self.add("MAJOR", message, file, line)
-
-    def critical(self, message: str, file: str | None = None, line: int | None = None) -> None:
-        """Add a critical issue."""
-        self.add("CRITICAL", message, file, line)
-
-    @property
-    def has_critical(self) -> bool:
-        return any(r.level == "CRITICAL" for r in self.results)
-
-    @property
-    def has_major(self) -> bool:
-        return any(r.level == "MAJOR" for r in self.results)
-
-    @property
-    def has_minor(self) -> bool:
-        return any(r.level == "MINOR" for r in self.results)
-
-    @property
-    def exit_code(self) -> int:
-        if self.has_critical:
-            return 1
-        if self.has_major:
-            return 2
-        if self.has_minor:
-            return 3
-        return 0
-
-
-def validate_json_structure(hook_path: Path, report: ValidationReport) -> dict[str, Any] | None:
+
+def validate_json_structure(hook_path: Path, report: HookValidationReport) -> dict[str, Any] | None:
     """Validate hooks.json exists and is valid JSON."""
     if not hook_path.exists():
         report.critical(f"Hook file not found: {hook_path}")
@@ -212,7 +152,7 @@ def validate_json_structure(hook_path: Path, report: ValidationReport) -> dict[s
         return None
 
 
-def validate_top_level_structure(data: Any, report: ValidationReport) -> bool:
+def validate_top_level_structure(data: Any, report: HookValidationReport) -> bool:
     """Validate top-level structure of hooks.json."""
     if not isinstance(data, dict):
         report.critical("Root must be a JSON object")
@@ -240,7 +180,7 @@ def validate_top_level_structure(data: Any, report: ValidationReport) -> bool:
     return True
 
 
-def validate_event_name(event_name: str, report: ValidationReport) -> bool:
+def validate_event_name(event_name: str, report: HookValidationReport) -> bool:
     """Validate a hook event name."""
     if event_name not in VALID_HOOK_EVENTS:
         report.critical(f"Unknown hook event: '{event_name}'. Valid events: {sorted(VALID_HOOK_EVENTS)}")
@@ -248,7 +188,7 @@ def validate_event_name(event_name: str, report: ValidationReport) -> bool:
     return True
 
 
-def validate_matcher(matcher: Any, event_name: str, report: ValidationReport) -> bool:
+def validate_matcher(matcher: Any, event_name: str, report: HookValidationReport) -> bool:
     """Validate a matcher pattern."""
     # Events without matchers - warn if matcher provided
     if event_name in EVENTS_WITHOUT_MATCHERS:
@@ -331,187 +271,379 @@ def extract_script_path(command: str, plugin_root: Path | None) -> Path | None:
     return None
 
 
-def lint_bash_script(script_path: Path, report: ValidationReport) -> None:
-    """Lint a bash script using shellcheck."""
+# =============================================================================
+# Script Linting
+# =============================================================================
+# Each linter runs once per language over every script a hooks.json references;
+# findings are mapped back to per-script reports by (resolved) file path.
+
+
+def _script_key(path: str | Path) -> str:
+    """Normalize a script path so linter output paths map back to their script."""
+    return os.path.realpath(path)
+
+
+def _batch_timeout(per_file: int, count: int) -> int:
+    """Scale a per-file linter timeout to a batch of count files."""
+    return per_file * max(1, count)
+
+
+def lint_bash_scripts(reports: dict[Path, HookValidationReport]) -> None:
+    """Lint bash scripts using a single shellcheck run.
+
+    Args:
+        reports: Script path -> report receiving that script's findings
+    """
     shellcheck_cmd = resolve_tool_command("shellcheck")
     if not shellcheck_cmd:
-        report.minor(f"shellcheck not available locally or via bunx/npx, skipping lint for {script_path.name}")
+        for script_path, report in reports.items():
+            report.minor(f"shellcheck not available locally or via bunx/npx, skipping lint for {script_path.name}")
         return
 
     try:
         result = subprocess.run(
-            shellcheck_cmd + ["-f", "json", str(script_path)],
+            shellcheck_cmd + ["-f", "json"] + [str(p) for p in reports],
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=_batch_timeout(30, len(reports)),
         )
+    except subprocess.TimeoutExpired:
+        for script_path, report in reports.items():
+            report.minor(f"shellcheck timeout for {script_path.name}")
+        return
+    except Exception as e:
+        for report in reports.values():
+            report.minor(f"shellcheck error: {e}")
+        return
 
-        if result.returncode == 0:
+    if result.returncode == 0:
+        for script_path, report in reports.items():
             report.passed(f"shellcheck: {script_path.name} OK")
-            return
+        return
 
-        try:
-            issues = json.loads(result.stdout) if result.stdout else []
-        except json.JSONDecodeError:
-            issues = []
+    try:
+        issues = json.loads(result.stdout) if result.stdout else []
+    except json.JSONDecodeError:
+        issues = []
+
+    by_key = {_script_key(p): p for p in reports}
+    flagged: set[Path] = set()
+    for issue in issues:
+        target = by_key.get(_script_key(issue.get("file", "")))
+        if target is None:
+            continue
+        flagged.add(target)
+        level = issue.get("level", "warning")
+        msg = issue.get("message", "Unknown issue")
+        line = issue.get("line", 0)
+        code = issue.get("code", "")
+
+        if level == "error":
+            reports[target].major(
+                f"shellcheck SC{code}: {msg}",
+                str(target),
+                line,
+            )
+        elif level == "warning":
+            reports[target].minor(
+                f"shellcheck SC{code}: {msg}",
+                str(target),
+                line,
+            )
 
-        for issue in issues:
-            level = issue.get("level", "warning")
-            msg = issue.get("message", "Unknown issue")
-            line = issue.get("line", 0)
-            code = issue.get("code", "")
+    # Exit code 1 means "issues found"; anything else is a shellcheck failure
+    if result.returncode == 1:
+        for script_path, report in reports.items():
+            if script_path not in flagged:
+                report.passed(f"shellcheck: {script_path.name} OK")
 
-            if level == "error":
-                report.major(
-                    f"shellcheck SC{code}: {msg}",
-                    str(script_path),
-                    line,
-                )
-            elif level == "warning":
-                report.minor(
-                    f"shellcheck SC{code}: {msg}",
-                    str(script_path),
-                    line,
-                )
 
+def _ruff_check_scripts(ruff_cmd: list[str], reports: dict[Path, HookValidationReport]) -> None:
+    """Run one ruff check over all Python scripts."""
+    try:
+        result = subprocess.run(
+            ruff_cmd + ["check", "--output-format=json"] + [str(p) for p in reports],
+            capture_output=True,
+            text=True,
+            timeout=_batch_timeout(30, len(reports)),
+        )
     except subprocess.TimeoutExpired:
-        report.minor(f"shellcheck timeout for {script_path.name}")
+        for script_path, report in reports.items():
+            report.minor(f"ruff timeout for {script_path.name}")
+        return
     except Exception as e:
-        report.minor(f"shellcheck error: {e}")
+        for report in reports.values():
+            report.minor(f"ruff error: {e}")
+        return
 
+    if result.returncode == 0:
+        for script_path, report in reports.items():
+            report.passed(f"ruff check: {script_path.name} OK")
+        return
 
-def lint_python_script(script_path: Path, report: ValidationReport) -> None:
-    """Lint a Python script using ruff and mypy."""
-    # Ruff check
-    ruff_cmd = resolve_tool_command("ruff")
-    if ruff_cmd:
-        try:
-            result = subprocess.run(
-                ruff_cmd + ["check", "--output-format=json", str(script_path)],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+    try:
+        issues = json.loads(result.stdout) if result.stdout else []
+    except json.JSONDecodeError:
+        issues = []
+
+    by_key = {_script_key(p): p for p in reports}
+    flagged: set[Path] = set()
+    for issue in issues:
+        target = by_key.get(_script_key(issue.get("filename", "")))
+        if target is None:
+            continue
+        flagged.add(target)
+        code = issue.get("code", "")
+        msg = issue.get("message", "Unknown issue")
+        loc = issue.get("location", {})
+        line = loc.get("row", 0)
+
+        reports[target].major(
+            f"ruff {code}: {msg}",
+            str(target),
+            line,
+        )
 
-            if result.returncode == 0:
+    # Exit code 1 means "violations found"; anything else is a ruff failure
+    if result.returncode == 1:
+        for script_path, report in reports.items():
+            if script_path not in flagged:
                 report.passed(f"ruff check: {script_path.name} OK")
-            else:
-                try:
-                    issues = json.loads(result.stdout) if result.stdout else []
-                except json.JSONDecodeError:
-                    issues = []
-
-                for issue in issues:
-                    code = issue.get("code", "")
-                    msg = issue.get("message", "Unknown issue")
-                    loc = issue.get("location", {})
-                    line = loc.get("row", 0)
-
-                    report.major(
-                        f"ruff {code}: {msg}",
-                        str(script_path),
-                        line,
-                    )
 
-        except subprocess.TimeoutExpired:
-            report.minor(f"ruff timeout for {script_path.name}")
-        except Exception as e:
-            report.minor(f"ruff error: {e}")
-    else:
-        report.minor(f"ruff not available locally or via uvx, skipping lint for {script_path.name}")
 
-    # Mypy check
-    mypy_cmd = resolve_tool_command("mypy")
-    if mypy_cmd:
+def _mypy_check_scripts(mypy_cmd: list[str], reports: dict[Path, HookValidationReport]) -> None:
+    """Type-check Python scripts with as few mypy runs as possible.
+
+    mypy refuses to check two files with the same module name in one run, so
+    scripts are split into rounds with unique file stems. A syntax error in
+    one script aborts the whole run, so the other scripts of that round are
+    checked again without it.
+    """
+    rounds: list[dict[Path, HookValidationReport]] = []
+    for script_path, report in reports.items():
+        for batch in rounds:
+            if all(p.stem != script_path.stem for p in batch):
+                batch[script_path] = report
+                break
+        else:
+            rounds.append({script_path: report})
+
+    pending = rounds
+    while pending:
+        batch = pending.pop(0)
         try:
             result = subprocess.run(
                 mypy_cmd + [
                     "--ignore-missing-imports",
                     "--no-error-summary",
-                    str(script_path),
-                ],
+                ] + [str(p) for p in batch],
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=_batch_timeout(60, len(batch)),
             )
+        except subprocess.TimeoutExpired:
+            for script_path, report in batch.items():
+                report.minor(f"mypy timeout for {script_path.name}")
+            continue
+        except Exception as e:
+            for report in batch.values():
+                report.minor(f"mypy error: {e}")
+            continue
 
-            if result.returncode == 0:
+        if result.returncode == 0:
+            for script_path, report in batch.items():
                 report.passed(f"mypy: {script_path.name} OK")
-            else:
-                # Parse mypy output
-                for line in result.stdout.splitlines():
-                    if ": error:" in line:
-                        # Extract line number
-                        match = re.match(r".*:(\d+):\d*: error: (.+)", line)
-                        if match:
-                            lineno = int(match.group(1))
-                            msg = match.group(2)
-                            report.major(
-                                f"mypy: {msg}",
-                                str(script_path),
-                                lineno,
-                            )
+            continue
 
-        except subprocess.TimeoutExpired:
-            report.minor(f"mypy timeout for {script_path.name}")
-        except Exception as e:
-            report.minor(f"mypy error: {e}")
+        # Parse mypy output: "path:line: error: message" (column is optional)
+        by_key = {_script_key(p): p for p in batch}
+        flagged: set[Path] = set()
+        for line in result.stdout.splitlines():
+            match = re.match(r"(.+?):(\d+):(?:\d+:)? error: (.+)", line)
+            if not match:
+                continue
+            target = by_key.get(_script_key(match.group(1)))
+            if target is None:
+                continue
+            flagged.add(target)
+            batch[target].major(
+                f"mypy: {match.group(3)}",
+                str(target),
+                int(match.group(2)),
+            )
+
+        # Exit code 1 means "type errors found"
+        if result.returncode == 1:
+            for script_path, report in batch.items():
+                if script_path not in flagged:
+                    report.passed(f"mypy: {script_path.name} OK")
+            continue
+
+        # Any other exit code (2 for a syntax error or crash) stops mypy before
+        # the remaining scripts are checked: retry them without the scripts it
+        # reported on, or one at a time if it named none of them
+        unchecked = {p: r for p, r in batch.items() if p not in flagged}
+        if flagged and unchecked:
+            pending.append(unchecked)
+        elif len(unchecked) > 1:
+            pending.extend({script_path: report} for script_path, report in unchecked.items())
+        else:
+            for script_path, report in unchecked.items():
+                report.minor(f"mypy could not check {script_path.name} (exit code {result.returncode})")
+
+
+def lint_python_scripts(reports: dict[Path, HookValidationReport]) -> None:
+    """Lint Python scripts using one ruff run and batched mypy runs.
+
+    Args:
+        reports: Script path -> report receiving that script's findings
+    """
+    # Ruff check
+    ruff_cmd = resolve_tool_command("ruff")
+    if ruff_cmd:
+        _ruff_check_scripts(ruff_cmd, reports)
+    else:
+        for script_path, report in reports.items():
+            report.minor(f"ruff not available locally or via uvx, skipping lint for {script_path.name}")
+
+    # Mypy check
+    mypy_cmd = resolve_tool_command("mypy")
+    if mypy_cmd:
+        _mypy_check_scripts(mypy_cmd, reports)
     else:
-        report.minor(f"mypy not available locally or via uvx, skipping type check for {script_path.name}")
+        for script_path, report in reports.items():
+            report.minor(f"mypy not available locally or via uvx, skipping type check for {script_path.name}")
 
 
-def lint_js_script(script_path: Path, report: ValidationReport) -> None:
-    """Lint a JavaScript/TypeScript script using eslint."""
+def lint_js_scripts(reports: dict[Path, HookValidationReport]) -> None:
+    """Lint JavaScript/TypeScript scripts using a single eslint run.
+
+    Args:
+        reports: Script path -> report receiving that script's findings
+    """
     eslint_cmd = resolve_tool_command("eslint")
     if not eslint_cmd:
-        report.minor(f"eslint not available locally or via bunx/npx, skipping lint for {script_path.name}")
+        for script_path, report in reports.items():
+            report.minor(f"eslint not available locally or via bunx/npx, skipping lint for {script_path.name}")
         return
 
     try:
         result = subprocess.run(
-            eslint_cmd + ["--format=json", str(script_path)],
+            eslint_cmd + ["--format=json"] + [str(p) for p in reports],
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=_batch_timeout(30, len(reports)),
         )
+    except subprocess.TimeoutExpired:
+        for script_path, report in reports.items():
+            report.minor(f"eslint timeout for {script_path.name}")
+        return
+    except Exception as e:
+        for report in reports.values():
+            report.minor(f"eslint error: {e}")
+        return
 
-        if result.returncode == 0:
+    if result.returncode == 0:
+        for script_path, report in reports.items():
             report.passed(f"eslint: {script_path.name} OK")
-            return
+        return
 
-        try:
-            data = json.loads(result.stdout) if result.stdout else []
-        except json.JSONDecodeError:
-            data = []
-
-        for file_result in data:
-            for msg in file_result.get("messages", []):
-                severity = msg.get("severity", 1)
-                text = msg.get("message", "Unknown issue")
-                line = msg.get("line", 0)
-                rule = msg.get("ruleId", "")
-
-                if severity >= 2:
-                    report.major(
-                        f"eslint {rule}: {text}",
-                        str(script_path),
-                        line,
-                    )
-                else:
-                    report.minor(
-                        f"eslint {rule}: {text}",
-                        str(script_path),
-                        line,
-                    )
+    try:
+        data = json.loads(result.stdout) if result.stdout else []
+    except json.JSONDecodeError:
+        data = []
+
+    by_key = {_script_key(p): p for p in reports}
+    for file_result in data:
+        target = by_key.get(_script_key(file_result.get("filePath", "")))
+        if target is None:
+            continue
+        report = reports[target]
+        for msg in file_result.get("messages", []):
+            severity = msg.get("severity", 1)
+            text = msg.get("message", "Unknown issue")
+            line = msg.get("line", 0)
+            rule = msg.get("ruleId", "")
+
+            if severity >= 2:
+                report.major(
+                    f"eslint {rule}: {text}",
+                    str(target),
+                    line,
+                )
+            else:
+                report.minor(
+                    f"eslint {rule}: {text}",
+                    str(target),
+                    line,
+                )
 
-    except subprocess.TimeoutExpired:
-        report.minor(f"eslint timeout for {script_path.name}")
-    except Exception as e:
-        report.minor(f"eslint error: {e}")
+    # eslint reports every file it checked; clean files have no messages
+    for file_result in data:
+        target = by_key.get(_script_key(file_result.get("filePath", "")))
+        if target is not None and not file_result.get("messages"):
+            reports[target].passed(f"eslint: {target.name} OK")
 
 
-def validate_script(script_path: Path, report: ValidationReport) -> None:
-    """Validate and lint a script file."""
+def lint_bash_script(script_path: Path, report: HookValidationReport) -> None:
+    """Lint a bash script using shellcheck."""
+    lint_bash_scripts({script_path: report})
+
+
+def lint_python_script(script_path: Path, report: HookValidationReport) -> None:
+    """Lint a Python script using ruff and mypy."""
+    lint_python_scripts({script_path: report})
+
+
+def lint_js_script(script_path: Path, report: HookValidationReport) -> None:
+    """Lint a JavaScript/TypeScript script using eslint."""
+    lint_js_scripts({script_path: report})
+
+
+def lint_queued_scripts(lint_queue: list[tuple[int, Path]], report: HookValidationReport) -> None:
+    """Lint every queued script with one batched run per language.
+
+    Each script is linted once, however many hooks reference it. Its findings
+    report is spliced into the report at every queued position (chained, not
+    copied), so the report reads exactly as if each script had been linted
+    where it was validated.
+
+    Args:
+        lint_queue: (position in report.results, script path) pairs, in order
+        report: The hook report the queue positions refer to
+    """
+    findings: dict[str, HookValidationReport] = {}
+    by_lang: dict[str, dict[Path, HookValidationReport]] = {}
+    for _, script_path in lint_queue:
+        key = _script_key(script_path)
+        if key in findings:
+            continue
+        findings[key] = HookValidationReport(hook_path=report.hook_path)
+        lang = LINTABLE_EXTENSIONS.get(script_path.suffix.lower(), "")
+        by_lang.setdefault(lang, {})[script_path] = findings[key]
+
+    if "bash" in by_lang:
+        lint_bash_scripts(by_lang["bash"])
+    if "python" in by_lang:
+        lint_python_scripts(by_lang["python"])
+    js_reports = {**by_lang.get("javascript", {}), **by_lang.get("typescript", {})}
+    if js_reports:
+        lint_js_scripts(js_reports)
+
+    for position, script_path in lint_queue:
+        report.splice(position, findings[_script_key(script_path)])
+
+
+def validate_script(
+    script_path: Path,
+    report: HookValidationReport,
+    lint_queue: list[tuple[int, Path]] | None = None,
+) -> None:
+    """Validate and lint a script file.
+
+    When lint_queue is given, linting is deferred to lint_queued_scripts()
+    so all scripts of one language share a single linter run.
+    """
     if not script_path.exists():
         report.major(f"Script not found: {script_path}")
         return
@@ -526,7 +658,9 @@ def validate_script(script_path: Path, report: ValidationReport) -> None:
     suffix = script_path.suffix.lower()
     lang = LINTABLE_EXTENSIONS.get(suffix)
 
-    if lang == "bash":
+    if lang is not None and lint_queue is not None:
+        lint_queue.append((len(report.results), script_path))
+    elif lang == "bash":
         lint_bash_script(script_path, report)
     elif lang == "python":
         lint_python_script(script_path, report)
@@ -538,7 +672,8 @@ def validate_command_hook(
     hook: dict[str, Any],
     event_name: str,
     plugin_root: Path | None,
-    report: ValidationReport,
+    report: HookValidationReport,
+    lint_queue: list[tuple[int, Path]] | None = None,
 ) -> bool:
     """Validate a command-type hook."""
     if "command" not in hook:
@@ -574,7 +709,7 @@ def validate_command_hook(
     # Extract and validate script path
     script_path = extract_script_path(command, plugin_root)
     if script_path and script_path.exists():
-        validate_script(script_path, report)
+        validate_script(script_path, report, lint_queue)
     elif script_path:
         # Script path detected but doesn't exist
         if plugin_root and "${CLAUDE_PLUGIN_ROOT}" not in hook["command"]:
@@ -587,7 +722,7 @@ def validate_command_hook(
 def validate_prompt_hook(
     hook: dict[str, Any],
     event_name: str,
-    report: ValidationReport,
+    report: HookValidationReport,
 ) -> bool:
     """Validate a prompt-type hook."""
     if "prompt" not in hook:
@@ -634,7 +769,8 @@ def validate_single_hook(
     hook: Any,
     event_name: str,
     plugin_root: Path | None,
-    report: ValidationReport,
+    report: HookValidationReport,
+    lint_queue: list[tuple[int, Path]] | None = None,
 ) -> bool:
     """Validate a single hook definition."""
     if not isinstance(hook, dict):
@@ -653,7 +789,7 @@ def validate_single_hook(
 
     # Validate based on type
     if hook_type == "command":
-        if not validate_command_hook(hook, event_name, plugin_root, report):
+        if not validate_command_hook(hook, event_name, plugin_root, report, lint_queue):
             return False
     elif hook_type == "prompt":
         if not validate_prompt_hook(hook, event_name, report):
@@ -674,7 +810,8 @@ def validate_matcher_block(
     matcher_block: Any,
     event_name: str,
     plugin_root: Path | None,
-    report: ValidationReport,
+    report: HookValidationReport,
+    lint_queue: list[tuple[int, Path]] | None = None,
 ) -> bool:
     """Validate a matcher block (contains matcher and hooks array)."""
     if not isinstance(matcher_block, dict):
@@ -704,7 +841,7 @@ def validate_matcher_block(
     all_valid = True
     for i, hook in enumerate(hooks):
         report.info(f"Validating hook {i + 1} of {len(hooks)}...")
-        if not validate_single_hook(hook, event_name, plugin_root, report):
+        if not validate_single_hook(hook, event_name, plugin_root, report, lint_queue):
             all_valid = False
 
     return all_valid
@@ -714,7 +851,8 @@ def validate_event_hooks(
     event_name: str,
     event_config: Any,
     plugin_root: Path | None,
-    report: ValidationReport,
+    report: HookValidationReport,
+    lint_queue: list[tuple[int, Path]] | None = None,
 ) -> bool:
     """Validate all hooks for a specific event."""
     if not isinstance(event_config, list):
@@ -730,7 +868,7 @@ def validate_event_hooks(
     all_valid = True
     for i, matcher_block in enumerate(event_config):
         report.info(f"Matcher block {i + 1}...")
-        if not validate_matcher_block(matcher_block, event_name, plugin_root, report):
+        if not validate_matcher_block(matcher_block, event_name, plugin_root, report, lint_queue):
             all_valid = False
 
     if all_valid:
@@ -742,17 +880,20 @@ def validate_event_hooks(
 def validate_hooks(
     hook_path: Path,
     plugin_root: Path | None = None,
-) -> ValidationReport:
+    sink: NDJSONSink | None = None,
+) -> HookValidationReport:
     """Validate a complete hooks.json file.
 
     Args:
         hook_path: Path to the hooks.json file
         plugin_root: Optional plugin root directory for resolving paths
+        sink: Optional NDJSON sink; each result is streamed as soon as it is
+            added (script lint findings when the batched linters finish)
 
     Returns:
-        ValidationReport with all results
+        HookValidationReport with all results
     """
-    report = ValidationReport(hook_path=str(hook_path))
+    report = HookValidationReport(hook_path=str(hook_path), sink=sink)
 
     # Parse JSON
     data = validate_json_structure(hook_path, report)
@@ -763,18 +904,21 @@ def validate_hooks(
     if not validate_top_level_structure(data, report):
         return report
 
-    # Validate each event
+    # Validate each event; script linting is queued and run once per language
+    lint_queue: list[tuple[int, Path]] = []
     hooks = data["hooks"]
     for event_name, event_config in hooks.items():
         if not validate_event_name(event_name, report):
             continue
 
-        validate_event_hooks(event_name, event_config, plugin_root, report)
+        validate_event_hooks(event_name, event_config, plugin_root, report, lint_queue)
+
+    lint_queued_scripts(lint_queue, report)
 
     return report
 
 
-def print_results(report: ValidationReport, verbose: bool = False) -> None:
+def print_results(report: HookValidationReport, verbose: bool = False) -> None:
     """Print validation results in human-readable format."""
     # ANSI colors
     colors = {
@@ -839,7 +983,7 @@ def print_results(report: ValidationReport, verbose: bool = False) -> None:
     print()
 
 
-def print_json(report: ValidationReport) -> None:
+def print_json(report: HookValidationReport) -> None:
     """Print validation results as JSON."""
     output = {
         "hook_path": report.hook_path,
@@ -879,6 +1023,7 @@ def main() -> int:
         help="Show all results including passed checks",
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--ndjson", action="store_true", help="Stream results as NDJSON, then a summary record")
     args = parser.parse_args()
 
     hook_path = Path(args.hook_path)
@@ -888,9 +1033,12 @@ def main() -> int:
         print(f"Error: {hook_path} does not exist", file=sys.stderr)
         return 1
 
-    report = validate_hooks(hook_path, plugin_root)
+    sink = NDJSONSink(validator="hook") if args.ndjson else None
+    report = validate_hooks(hook_path, plugin_root, sink)
 
-    if args.json:
+    if sink is not None:
+        sink.close({"hook_path": report.hook_path})
+    elif args.json:
         print_json(report)
     else:
         print_results(report, args.verbose)
@@ -22,67 +22,38 @@ import configparser
 import json
 import os
 import re
-import subprocess
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+from validation_common import (
+    LineIndex,
+    NDJSONSink,
+    ValidationReport,
+    ValidationResult,
+    get_submodule_snapshot,
+)
+
 # =============================================================================
 # Data Classes
 # =============================================================================
 
 
 @dataclass
-class ValidationResult:
-    """Result of a single validation check."""
-
-    level: str  # "critical", "major", "minor", "info"
-    category: str  # "structure", "manifest", "plugin", "config"
-    message: str
-    file_path: str | None = None
-    line_number: int | None = None
-    suggestion: str | None = None
+class MarketplaceValidationReport(ValidationReport):
+    """Validation report for a marketplace, extends base ValidationReport.
 
+    Every result carries a category ("structure", "manifest", "plugin", "config", ...).
+    """
 
-@dataclass
-class ValidationReport:
-    """Complete validation report for a marketplace."""
-
-    marketplace_path: Path
+    marketplace_path: Path | None = None
     marketplace_name: str | None = None
-    results: list[ValidationResult] = field(default_factory=list)
     plugins_found: list[str] = field(default_factory=list)
     plugins_validated: int = 0
     plugins_failed: int = 0
 
-    def add(self, result: ValidationResult) -> None:
-        """Add a validation result."""
-        self.results.append(result)
-
-    def has_critical(self) -> bool:
-        """Check if there are critical issues."""
-        return any(r.level == "critical" for r in self.results)
-
-    def has_major(self) -> bool:
-        """Check if there are major issues."""
-        return any(r.level == "major" for r in self.results)
-
-    def has_minor(self) -> bool:
-        """Check if there are minor issues."""
-        return any(r.level == "minor" for r in self.results)
-
-    def exit_code(self) -> int:
-        """Return appropriate exit code based on results."""
-        if self.has_critical():
-            return 1
-        if self.has_major():
-            return 2
-        if self.has_minor():
-            return 3
-        return 0
-
 
 # =============================================================================
 # Constants
@@ -202,10 +173,10 @@ def validate_marketplace_file(
     if not json_path.exists():
         results.append(
             ValidationResult(
-                level="critical",
+                level="CRITICAL",
                 category="structure",
                 message=f"Marketplace configuration not found: {json_path}",
-                file_path=str(json_path),
+                file=str(json_path),
                 suggestion="Create a marketplace.json file with name and plugins fields",
             )
         )
@@ -218,11 +189,11 @@ def validate_marketplace_file(
     except json.JSONDecodeError as e:
         results.append(
             ValidationResult(
-                level="critical",
+                level="CRITICAL",
                 category="manifest",
                 message=f"Invalid JSON in marketplace.json: {e}",
-                file_path=str(json_path),
-                line_number=e.lineno,
+                file=str(json_path),
+                line=e.lineno,
                 suggestion="Fix JSON syntax error",
             )
         )
@@ -230,10 +201,10 @@ def validate_marketplace_file(
     except Exception as e:
         results.append(
             ValidationResult(
-                level="critical",
+                level="CRITICAL",
                 category="manifest",
                 message=f"Error reading marketplace.json: {e}",
-                file_path=str(json_path),
+                file=str(json_path),
             )
         )
         return None, results
@@ -242,10 +213,10 @@ def validate_marketplace_file(
     if not isinstance(data, dict):
         results.append(
             ValidationResult(
-                level="critical",
+                level="CRITICAL",
                 category="manifest",
                 message="marketplace.json must be a JSON object",
-                file_path=str(json_path),
+                file=str(json_path),
                 suggestion="Root element should be a JSON object with name and plugins fields",
             )
         )
@@ -265,10 +236,10 @@ def validate_marketplace_name(name: Any, json_path: str) -> list[ValidationResul
     if not isinstance(name, str):
         results.append(
             ValidationResult(
-                level="critical",
+                level="CRITICAL",
                 category="manifest",
                 message=f"Marketplace name must be a string, got {type(name).__name__}",
-                file_path=json_path,
+                file=json_path,
             )
         )
         return results
@@ -276,10 +247,10 @@ def validate_marketplace_name(name: Any, json_path: str) -> list[ValidationResul
     if not name:
         results.append(
             ValidationResult(
-                level="critical",
+                level="CRITICAL",
                 category="manifest",
                 message="Marketplace name cannot be empty",
-                file_path=json_path,
+                file=json_path,
             )
         )
         return results
@@ -288,10 +259,10 @@ def validate_marketplace_name(name: Any, json_path: str) -> list[ValidationResul
     if not NAME_PATTERN.match(name):
         results.append(
             ValidationResult(
-                level="minor",
+                level="MINOR",
                 category="manifest",
                 message=f"Marketplace name '{name}' should use kebab-case (lowercase with hyphens)",
-                file_path=json_path,
+                file=json_path,
                 suggestion="Use format: my-marketplace-name",
             )
         )
@@ -314,10 +285,10 @@ def validate_plugin_entry(
         if field_name not in plugin:
             results.append(
                 ValidationResult(
-                    level="critical",
+                    level="CRITICAL",
                     category="plugin",
                     message=f"Plugin '{plugin_id}' missing required field: {field_name}",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
 
@@ -327,10 +298,10 @@ def validate_plugin_entry(
         if not NAME_PATTERN.match(name):
             results.append(
                 ValidationResult(
-                    level="minor",
+                    level="MINOR",
                     category="plugin",
                     message=f"Plugin name '{name}' should use kebab-case",
-                    file_path=json_path,
+                    file=json_path,
                     suggestion="Use format: my-plugin-name",
                 )
             )
@@ -341,19 +312,19 @@ def validate_plugin_entry(
         if not isinstance(version, str):
             results.append(
                 ValidationResult(
-                    level="major",
+                    level="MAJOR",
                     category="plugin",
                     message=f"Plugin '{plugin_id}' version must be a string",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
         elif not VERSION_PATTERN.match(version):
             results.append(
                 ValidationResult(
-                    level="minor",
+                    level="MINOR",
                     category="plugin",
                     message=f"Plugin '{plugin_id}' version '{version}' should follow semver format",
-                    file_path=json_path,
+                    file=json_path,
                     suggestion="Use format: X.Y.Z (e.g., 1.0.0)",
                 )
             )
@@ -379,10 +350,10 @@ def validate_plugin_entry(
         if field_name not in known_fields:
             results.append(
                 ValidationResult(
-                    level="info",
+                    level="INFO",
                     category="plugin",
                     message=f"Plugin '{plugin_id}' has unknown field: {field_name}",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
 
@@ -392,19 +363,19 @@ def validate_plugin_entry(
         if not isinstance(tags, list):
             results.append(
                 ValidationResult(
-                    level="minor",
+                    level="MINOR",
                     category="plugin",
                     message=f"Plugin '{plugin_id}' tags must be an array",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
         elif not all(isinstance(t, str) for t in tags):
             results.append(
                 ValidationResult(
-                    level="minor",
+                    level="MINOR",
                     category="plugin",
                     message=f"Plugin '{plugin_id}' tags must be strings",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
 
@@ -414,19 +385,19 @@ def validate_plugin_entry(
         if not isinstance(deps, list):
             results.append(
                 ValidationResult(
-                    level="major",
+                    level="MAJOR",
                     category="plugin",
                     message=f"Plugin '{plugin_id}' dependencies must be an array",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
         elif not all(isinstance(d, str) for d in deps):
             results.append(
                 ValidationResult(
-                    level="major",
+                    level="MAJOR",
                     category="plugin",
                     message=f"Plugin '{plugin_id}' dependencies must be strings",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
 
@@ -453,20 +424,20 @@ def validate_plugin_source(
                 if not resolved.exists():
                     results.append(
                         ValidationResult(
-                            level="major",
+                            level="MAJOR",
                             category="plugin",
                             message=f"Plugin '{plugin_id}' source path does not exist: {resolved}",
-                            file_path=json_path,
+                            file=json_path,
                             suggestion="Ensure the plugin directory exists at the specified path",
                         )
                     )
             elif source not in VALID_SOURCE_TYPES:
                 results.append(
                     ValidationResult(
-                        level="major",
+                        level="MAJOR",
                         category="plugin",
                         message=f"Plugin '{plugin_id}' has invalid source type: {source}",
-                        file_path=json_path,
+                        file=json_path,
                         suggestion=(
                             f"Valid source types: {', '.join(sorted(VALID_SOURCE_TYPES))} or relative path (./path)"
                         ),
@@ -475,10 +446,10 @@ def validate_plugin_source(
         else:
             results.append(
                 ValidationResult(
-                    level="major",
+                    level="MAJOR",
                     category="plugin",
                     message=f"Plugin '{plugin_id}' source must be a string or object",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
         return results
@@ -488,20 +459,20 @@ def validate_plugin_source(
     if source_type is None:
         results.append(
             ValidationResult(
-                level="major",
+                level="MAJOR",
                 category="plugin",
                 message=f"Plugin '{plugin_id}' source missing 'source' field",
-                file_path=json_path,
+                file=json_path,
                 suggestion=f"Add source: {', '.join(sorted(VALID_SOURCE_TYPES))}",
             )
         )
     elif source_type not in VALID_SOURCE_TYPES:
         results.append(
             ValidationResult(
-                level="major",
+                level="MAJOR",
                 category="plugin",
                 message=f"Plugin '{plugin_id}' has invalid source type: {source_type}",
-                file_path=json_path,
+                file=json_path,
                 suggestion=f"Valid source types: {', '.join(sorted(VALID_SOURCE_TYPES))}",
             )
         )
@@ -512,10 +483,10 @@ def validate_plugin_source(
             if field_name not in source and field_name not in plugin:
                 results.append(
                     ValidationResult(
-                        level="major",
+                        level="MAJOR",
                         category="plugin",
                         message=f"Plugin '{plugin_id}' with source type '{source_type}' requires '{field_name}'",
-                        file_path=json_path,
+                        file=json_path,
                     )
                 )
 
@@ -528,10 +499,10 @@ def validate_plugin_source(
             if local_plugin_path.exists() and local_plugin_path.is_dir() and git_marker.exists():
                 results.append(
                     ValidationResult(
-                        level="major",
+                        level="MAJOR",
                         category="plugin",
                         message=f"Plugin '{plugin_id}' uses remote source but exists as local submodule",
-                        file_path=json_path,
+                        file=json_path,
                         suggestion=(
                             f"Remove the local submodule checkout at './{plugin_name}' "
                             f"or change source to a relative path string"
@@ -554,10 +525,10 @@ def validate_local_path(
     if not isinstance(local_path, str):
         results.append(
             ValidationResult(
-                level="major",
+                level="MAJOR",
                 category="plugin",
                 message=f"Plugin '{plugin_id}' path must be a string",
-                file_path=json_path,
+                file=json_path,
             )
         )
         return results
@@ -569,10 +540,10 @@ def validate_local_path(
         resolved = Path(local_path)
         results.append(
             ValidationResult(
-                level="critical",
+                level="CRITICAL",
                 category="plugin",
                 message=f"Plugin '{plugin_id}' uses absolute path: {local_path}",
-                file_path=json_path,
+                file=json_path,
                 suggestion=(
                     "Absolute paths expose local filesystem structure and may contain usernames. "
                     "Use relative paths (starting with ./) for local plugin references. "
@@ -588,20 +559,20 @@ def validate_local_path(
     if not resolved.exists():
         results.append(
             ValidationResult(
-                level="major",
+                level="MAJOR",
                 category="plugin",
                 message=f"Plugin '{plugin_id}' local path does not exist: {resolved}",
-                file_path=json_path,
+                file=json_path,
                 suggestion="Ensure the path is relative to the marketplace directory or use absolute path",
             )
         )
     elif not resolved.is_dir():
         results.append(
             ValidationResult(
-                level="major",
+                level="MAJOR",
                 category="plugin",
                 message=f"Plugin '{plugin_id}' local path is not a directory: {resolved}",
-                file_path=json_path,
+                file=json_path,
             )
         )
     else:
@@ -613,10 +584,10 @@ def validate_local_path(
             if not alt_plugin_json.exists():
                 results.append(
                     ValidationResult(
-                        level="major",
+                        level="MAJOR",
                         category="plugin",
                         message=f"Plugin '{plugin_id}' directory missing plugin.json",
-                        file_path=str(resolved),
+                        file=str(resolved),
                         suggestion="Add .claude-plugin/plugin.json to the plugin directory",
                     )
                 )
@@ -625,10 +596,10 @@ def validate_local_path(
     if ".." in local_path:
         results.append(
             ValidationResult(
-                level="minor",
+                level="MINOR",
                 category="plugin",
                 message=f"Plugin '{plugin_id}' path contains '..' (path traversal)",
-                file_path=json_path,
+                file=json_path,
                 suggestion="Use absolute paths or paths without parent directory references",
             )
         )
@@ -647,10 +618,10 @@ def validate_repository_url(
     if not isinstance(repository, str):
         results.append(
             ValidationResult(
-                level="minor",
+                level="MINOR",
                 category="plugin",
                 message=f"Plugin '{plugin_id}' repository must be a string",
-                file_path=json_path,
+                file=json_path,
             )
         )
         return results
@@ -665,29 +636,29 @@ def validate_repository_url(
             else:
                 results.append(
                     ValidationResult(
-                        level="minor",
+                        level="MINOR",
                         category="plugin",
                         message=f"Plugin '{plugin_id}' repository URL may be invalid: {repository}",
-                        file_path=json_path,
+                        file=json_path,
                         suggestion="Use full URL or GitHub shorthand (owner/repo)",
                     )
                 )
         elif parsed.scheme not in ("http", "https", "git", "ssh"):
             results.append(
                 ValidationResult(
-                    level="minor",
+                    level="MINOR",
                     category="plugin",
                     message=f"Plugin '{plugin_id}' repository has unusual scheme: {parsed.scheme}",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
     except Exception:
         results.append(
             ValidationResult(
-                level="minor",
+                level="MINOR",
                 category="plugin",
                 message=f"Plugin '{plugin_id}' repository URL could not be parsed",
-                file_path=json_path,
+                file=json_path,
             )
         )
 
@@ -706,10 +677,10 @@ def validate_plugins_array(
     if not isinstance(plugins, list):
         results.append(
             ValidationResult(
-                level="critical",
+                level="CRITICAL",
                 category="manifest",
                 message="plugins field must be an array",
-                file_path=json_path,
+                file=json_path,
                 suggestion="plugins: [{name: 'plugin-a'}, {name: 'plugin-b'}]",
             )
         )
@@ -718,10 +689,10 @@ def validate_plugins_array(
     if len(plugins) == 0:
         results.append(
             ValidationResult(
-                level="minor",
+                level="MINOR",
                 category="manifest",
                 message="plugins array is empty",
-                file_path=json_path,
+                file=json_path,
             )
         )
         return plugin_names, results
@@ -732,10 +703,10 @@ def validate_plugins_array(
         if not isinstance(plugin, dict):
             results.append(
                 ValidationResult(
-                    level="critical",
+                    level="CRITICAL",
                     category="plugin",
                     message=f"plugins[{i}] must be an object, got {type(plugin).__name__}",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
             continue
@@ -749,10 +720,10 @@ def validate_plugins_array(
             if name in seen_names:
                 results.append(
                     ValidationResult(
-                        level="major",
+                        level="MAJOR",
                         category="plugin",
                         message=f"Duplicate plugin name: {name}",
-                        file_path=json_path,
+                        file=json_path,
                         suggestion="Each plugin must have a unique name",
                     )
                 )
@@ -795,10 +766,10 @@ def validate_github_deployment(
     if not readme_path.exists():
         results.append(
             ValidationResult(
-                level="major",
+                level="MAJOR",
                 category="deployment",
                 message="Missing README.md at marketplace root",
-                file_path=str(marketplace_dir),
+                file=str(marketplace_dir),
                 suggestion="Create a README.md with installation instructions for users",
             )
         )
@@ -833,10 +804,10 @@ def validate_github_deployment(
             if not plugin_readme.exists():
                 results.append(
                     ValidationResult(
-                        level="minor",
+                        level="MINOR",
                         category="deployment",
                         message=f"Plugin '{plugin_name}' subfolder missing README.md",
-                        file_path=str(plugin_path),
+                        file=str(plugin_path),
                         suggestion="Add README.md to plugin subfolder describing the plugin",
                     )
                 )
@@ -861,10 +832,10 @@ def validate_readme_content(readme_path: Path) -> list[ValidationResult]:
     except Exception as e:
         results.append(
             ValidationResult(
-                level="major",
+                level="MAJOR",
                 category="deployment",
                 message=f"Could not read README.md: {e}",
-                file_path=str(readme_path),
+                file=str(readme_path),
             )
         )
         return results
@@ -878,10 +849,10 @@ def validate_readme_content(readme_path: Path) -> list[ValidationResult]:
     if missing_sections:
         results.append(
             ValidationResult(
-                level="major",
+                level="MAJOR",
                 category="deployment",
                 message=f"README.md missing required sections: {', '.join(missing_sections)}",
-                file_path=str(readme_path),
+                file=str(readme_path),
                 suggestion="Add sections: ## Installation, ## Update, ## Uninstall, ## Troubleshooting",
             )
         )
@@ -896,10 +867,10 @@ def validate_readme_content(readme_path: Path) -> list[ValidationResult]:
         if missing_steps:
             results.append(
                 ValidationResult(
-                    level="minor",
+                    level="MINOR",
                     category="deployment",
                     message=(f"README.md Installation section may be incomplete. Missing: {', '.join(missing_steps)}"),
-                    file_path=str(readme_path),
+                    file=str(readme_path),
                     suggestion=(
                         "Include steps for: add marketplace, install plugin, verify installation, restart Claude Code"
                     ),
@@ -918,10 +889,10 @@ def validate_readme_content(readme_path: Path) -> list[ValidationResult]:
         if re.search(placeholder_pattern, content, re.IGNORECASE):
             results.append(
                 ValidationResult(
-                    level="minor",
+                    level="MINOR",
                     category="deployment",
                     message="README.md contains placeholder content",
-                    file_path=str(readme_path),
+                    file=str(readme_path),
                     suggestion="Replace all placeholders with actual content before publishing",
                 )
             )
@@ -937,10 +908,10 @@ def validate_readme_content(readme_path: Path) -> list[ValidationResult]:
         if missing_topics:
             results.append(
                 ValidationResult(
-                    level="minor",
+                    level="MINOR",
                     category="deployment",
                     message=f"README.md Troubleshooting section missing important topics: {', '.join(missing_topics)}",
-                    file_path=str(readme_path),
+                    file=str(readme_path),
                     suggestion=(
                         "Document common issues: hook path not found after update, "
                         "old version after update, restart required after install/update"
@@ -978,10 +949,10 @@ def validate_git_submodules(
     if not git_dir.exists():
         results.append(
             ValidationResult(
-                level="info",
+                level="INFO",
                 category="submodule",
                 message="Marketplace is not a git repository, skipping submodule validation",
-                file_path=str(marketplace_dir),
+                file=str(marketplace_dir),
             )
         )
         return results
@@ -1006,20 +977,20 @@ def validate_git_submodules(
             # All plugins use URL-based git sources, submodules are not needed
             results.append(
                 ValidationResult(
-                    level="info",
+                    level="INFO",
                     category="submodule",
                     message="All plugins use URL-based git sources, no submodules required",
-                    file_path=str(marketplace_dir),
+                    file=str(marketplace_dir),
                 )
             )
         elif has_local_dirs:
             # Some plugins have local directories but no .gitmodules - likely misconfigured
             results.append(
                 ValidationResult(
-                    level="major",
+                    level="MAJOR",
                     category="submodule",
                     message="Missing .gitmodules file - local plugin directories exist but are not git submodules",
-                    file_path=str(marketplace_dir),
+                    file=str(marketplace_dir),
                     suggestion=(
                         "Either convert local directories to git submodules with "
                         "'git submodule add <repo-url> <plugin-name>', "
@@ -1036,10 +1007,10 @@ def validate_git_submodules(
     except Exception as e:
         results.append(
             ValidationResult(
-                level="major",
+                level="MAJOR",
                 category="submodule",
                 message=f"Could not parse .gitmodules file: {e}",
-                file_path=str(gitmodules_path),
+                file=str(gitmodules_path),
             )
         )
         return results
@@ -1053,6 +1024,9 @@ def validate_git_submodules(
             if path and url:
                 submodules[path] = url
 
+    # Submodule state for the whole marketplace, from one shared git call
+    snapshot = get_submodule_snapshot(marketplace_dir)
+
     # Check each plugin
     for plugin in plugins:
         plugin_name = plugin.get("name", "unknown")
@@ -1077,12 +1051,12 @@ def validate_git_submodules(
             if expected_repo:
                 results.append(
                     ValidationResult(
-                        level="info",
+                        level="INFO",
                         category="submodule",
                         message=(
                             f"Plugin '{plugin_name}' has git source but no local directory (acceptable for remote-only)"
                         ),
-                        file_path=str(plugin_path),
+                        file=str(plugin_path),
                     )
                 )
             continue
@@ -1099,10 +1073,10 @@ def validate_git_submodules(
             if not found:
                 results.append(
                     ValidationResult(
-                        level="major",
+                        level="MAJOR",
                         category="submodule",
                         message=f"Plugin '{plugin_name}' directory exists but is not a git submodule",
-                        file_path=str(plugin_path),
+                        file=str(plugin_path),
                         suggestion=(
                             f"Convert to submodule: 'git rm -r {plugin_name} && "
                             f"git submodule add <repo-url> {plugin_name}'"
@@ -1121,10 +1095,10 @@ def validate_git_submodules(
             if norm_submod != norm_expected:
                 results.append(
                     ValidationResult(
-                        level="minor",
+                        level="MINOR",
                         category="submodule",
                         message=f"Plugin '{plugin_name}' submodule URL differs from source repository",
-                        file_path=str(gitmodules_path),
+                        file=str(gitmodules_path),
                         suggestion=f"Submodule: {submod_url}, Source: {expected_repo}",
                     )
                 )
@@ -1134,37 +1108,28 @@ def validate_git_submodules(
         if not submod_git.exists():
             # For submodules, .git is a file pointing to the git directory
             # Check if it's an uninitialized submodule
-            try:
-                result = subprocess.run(
-                    ["git", "submodule", "status", plugin_name],
-                    cwd=str(marketplace_dir),
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                if result.stdout.startswith("-"):
-                    results.append(
-                        ValidationResult(
-                            level="minor",
-                            category="submodule",
-                            message=f"Plugin '{plugin_name}' submodule is not initialized",
-                            file_path=str(plugin_path),
-                            suggestion="Run 'git submodule update --init --recursive' to initialize",
-                        )
+            state = snapshot.get(plugin_name)
+            if state is not None and not state.initialized:
+                results.append(
+                    ValidationResult(
+                        level="MINOR",
+                        category="submodule",
+                        message=f"Plugin '{plugin_name}' submodule is not initialized",
+                        file=str(plugin_path),
+                        suggestion="Run 'git submodule update --init --recursive' to initialize",
                     )
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass  # Git command failed, skip this check
+                )
 
     # Info message if all checks passed
-    if not any(r.level in ("critical", "major") for r in results):
+    if not any(r.level in ("CRITICAL", "MAJOR") for r in results):
         submod_count = len([p for p in plugins if p.get("name") in submodules])
         if submod_count > 0:
             results.append(
                 ValidationResult(
-                    level="info",
+                    level="INFO",
                     category="submodule",
                     message=f"Found {submod_count} plugin(s) configured as git submodules",
-                    file_path=str(gitmodules_path),
+                    file=str(gitmodules_path),
                 )
             )
 
@@ -1195,31 +1160,20 @@ def validate_marketplace_private_info(
     """
     results: list[ValidationResult] = []
 
-    # Import the shared scanning functions
-    try:
-        from validation_common import (
-            ABSOLUTE_PATH_PATTERNS,
-            ALLOWED_DOC_PATH_PREFIXES,
-            EXAMPLE_USERNAMES,
-            PRIVATE_INFO_SKIP_DIRS,
-            PRIVATE_USERNAMES,
-            SCANNABLE_EXTENSIONS,
-            build_private_path_patterns,
-        )
-    except ImportError:
-        # Fallback if validation_common is not available
-        results.append(
-            ValidationResult(
-                level="info",
-                category="private-info",
-                message="Could not import validation_common, skipping private info scan",
-                file_path=str(marketplace_dir),
-            )
-        )
-        return results
+    # Imported here: validation_common builds these pattern tables on first
+    # access, so a marketplace.json without a plugins list never pays for them
+    from validation_common import (
+        ABSOLUTE_PATH_PATTERNS,
+        ALLOWED_DOC_PATH_PREFIXES,
+        EXAMPLE_USERNAMES,
+        PRIVATE_INFO_SKIP_DIRS,
+        PRIVATE_USERNAMES,
+        SCANNABLE_EXTENSIONS,
+        get_private_path_matcher,
+    )
 
-    # Build patterns for private usernames
-    private_patterns = build_private_path_patterns(PRIVATE_USERNAMES)
+    # Cached matcher for private usernames
+    private_matcher = get_private_path_matcher(PRIVATE_USERNAMES)
     # Store in local scope for nested function
     example_usernames = EXAMPLE_USERNAMES
     absolute_patterns = ABSOLUTE_PATH_PATTERNS
@@ -1232,21 +1186,22 @@ def validate_marketplace_private_info(
         except Exception:
             return
 
+        lines = LineIndex(content)
+
         # Check for private username patterns (CRITICAL)
-        for pattern, desc in private_patterns:
-            for match in pattern.finditer(content):
-                matched_text = match.group(0)
-                line_num = content[: match.start()].count("\n") + 1
-                results.append(
-                    ValidationResult(
-                        level="critical",
-                        category="private-info",
-                        message=f"Private path leaked: {desc} - '{matched_text}' "
-                        "(use relative path or ${CLAUDE_PLUGIN_ROOT})",
-                        file_path=rel_path,
-                        line_number=line_num,
-                    )
+        for match, desc in private_matcher.finditer(content):
+            matched_text = match.group(0)
+            line_num = lines.line_of(match.start())
+            results.append(
+                ValidationResult(
+                    level="CRITICAL",
+                    category="private-info",
+                    message=f"Private path leaked: {desc} - '{matched_text}' "
+                    "(use relative path or ${CLAUDE_PLUGIN_ROOT})",
+                    file=rel_path,
+                    line=line_num,
                 )
+            )
 
         # Check for ANY absolute paths (MAJOR) - stricter check
         for pattern, desc in absolute_patterns:
@@ -1273,15 +1228,15 @@ def validate_marketplace_private_info(
                     if extracted_username in example_usernames:
                         continue
 
-                line_num = content[: match.start()].count("\n") + 1
+                line_num = lines.line_of(match.start())
                 results.append(
                     ValidationResult(
-                        level="major",
+                        level="MAJOR",
                         category="private-info",
                         message=f"Absolute path found: '{matched_text[:60]}...' "
                         "(use relative path, ${CLAUDE_PLUGIN_ROOT}, or ${HOME})",
-                        file_path=rel_path,
-                        line_number=line_num,
+                        file=rel_path,
+                        line=line_num,
                     )
                 )
 
@@ -1340,16 +1295,16 @@ def validate_marketplace_private_info(
             total_files += scan_directory(plugin_path, plugin_name)
 
     # Summary
-    critical_count = sum(1 for r in results if r.level == "critical")
-    major_count = sum(1 for r in results if r.level == "major")
+    critical_count = sum(1 for r in results if r.level == "CRITICAL")
+    major_count = sum(1 for r in results if r.level == "MAJOR")
 
     if critical_count == 0 and major_count == 0:
         results.append(
             ValidationResult(
-                level="info",
+                level="INFO",
                 category="private-info",
                 message=f"No private info found in marketplace ({total_files} files scanned)",
-                file_path=str(marketplace_dir),
+                file=str(marketplace_dir),
             )
         )
 
@@ -1386,11 +1341,11 @@ def validate_github_source_required(
         if not repository:
             results.append(
                 ValidationResult(
-                    level="major",
+                    level="MAJOR",
                     category="github-source",
                     message=f"Plugin '{plugin_name}' missing 'repository' field - "
                     "required for GitHub marketplace publishing",
-                    file_path=json_path,
+                    file=json_path,
                     suggestion=f'Add: "repository": "https://github.com/OWNER/{plugin_name}"',
                 )
             )
@@ -1400,10 +1355,10 @@ def validate_github_source_required(
         if not isinstance(repository, str):
             results.append(
                 ValidationResult(
-                    level="major",
+                    level="MAJOR",
                     category="github-source",
                     message=f"Plugin '{plugin_name}' repository must be a string URL",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
             continue
@@ -1416,10 +1371,10 @@ def validate_github_source_required(
         ):  # Allow shorthand owner/repo
             results.append(
                 ValidationResult(
-                    level="minor",
+                    level="MINOR",
                     category="github-source",
                     message=f"Plugin '{plugin_name}' repository doesn't look like a GitHub URL: {repository}",
-                    file_path=json_path,
+                    file=json_path,
                     suggestion="Use format: https://github.com/OWNER/REPO",
                 )
             )
@@ -1431,21 +1386,21 @@ def validate_github_source_required(
                 # Remote source - this is OK but submodule is preferred
                 results.append(
                     ValidationResult(
-                        level="info",
+                        level="INFO",
                         category="github-source",
                         message=f"Plugin '{plugin_name}' uses remote source instead of local submodule",
-                        file_path=json_path,
+                        file=json_path,
                         suggestion="Consider using git submodules with source: './{plugin_name}'",
                     )
                 )
 
-    if not any(r.level in ("critical", "major") for r in results):
+    if not any(r.level in ("CRITICAL", "MAJOR") for r in results):
         results.append(
             ValidationResult(
-                level="info",
+                level="INFO",
                 category="github-source",
                 message=f"All {len(plugins)} plugins have valid repository URLs",
-                file_path=json_path,
+                file=json_path,
             )
         )
 
@@ -1505,6 +1460,7 @@ def validate_workflow_inline_python(
             continue
 
         rel_path = str(yaml_path.relative_to(marketplace_dir))
+        lines = LineIndex(content)
 
         # Find all inline Python blocks
         for match in _YAML_INLINE_PYTHON_RE.finditer(content):
@@ -1515,19 +1471,19 @@ def validate_workflow_inline_python(
             for bad_match in _FSTRING_DICT_BRACKET_RE.finditer(python_code):
                 # Calculate line number in the YAML file
                 abs_offset = block_start_offset + bad_match.start()
-                line_num = content[:abs_offset].count("\n") + 1
+                line_num = lines.line_of(abs_offset)
                 snippet = bad_match.group(0)
 
                 results.append(
                     ValidationResult(
-                        level="major",
+                        level="MAJOR",
                         category="workflow",
                         message=(
                             f"Inline Python uses dict bracket access in f-string: {snippet} "
                             "-- shell quoting will strip inner quotes causing NameError at runtime"
                         ),
-                        file_path=rel_path,
-                        line_number=line_num,
+                        file=rel_path,
+                        line=line_num,
                         suggestion=(
                             "Extract dict value into a local variable before using it in an f-string. "
                             "Example: val = mydict.get('key', ''); print(f'value: {val}')"
@@ -1538,31 +1494,32 @@ def validate_workflow_inline_python(
     if not results:
         results.append(
             ValidationResult(
-                level="info",
+                level="INFO",
                 category="workflow",
                 message=f"No dangerous inline Python patterns found in {len(yaml_files)} workflow file(s)",
-                file_path=str(workflows_dir),
+                file=str(workflows_dir),
             )
         )
 
     return results
 
 
-def validate_marketplace(marketplace_path: Path) -> ValidationReport:
+def validate_marketplace(marketplace_path: Path, sink: NDJSONSink | None = None) -> MarketplaceValidationReport:
     """
     Validate a complete marketplace configuration.
 
     Args:
         marketplace_path: Path to marketplace directory or marketplace.json
+        sink: Optional NDJSON sink; each finding is streamed as soon as it is added
 
     Returns:
         ValidationReport with all findings
     """
-    report = ValidationReport(marketplace_path=marketplace_path)
+    report = MarketplaceValidationReport(marketplace_path=marketplace_path, sink=sink)
 
     # Load and validate the marketplace.json file
     data, load_results = validate_marketplace_file(marketplace_path)
-    report.results.extend(load_results)
+    report.extend(load_results)
 
     if data is None:
         return report
@@ -1573,12 +1530,12 @@ def validate_marketplace(marketplace_path: Path) -> ValidationReport:
     # Check required fields
     for field_name in REQUIRED_MARKETPLACE_FIELDS:
         if field_name not in data:
-            report.add(
+            report.append(
                 ValidationResult(
-                    level="critical",
+                    level="CRITICAL",
                     category="manifest",
                     message=f"Missing required field: {field_name}",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
 
@@ -1586,66 +1543,66 @@ def validate_marketplace(marketplace_path: Path) -> ValidationReport:
     name = data.get("name")
     if name is not None:
         report.marketplace_name = name if isinstance(name, str) else None
-        report.results.extend(validate_marketplace_name(name, json_path))
+        report.extend(validate_marketplace_name(name, json_path))
 
     # Validate plugins
     plugins = data.get("plugins")
     if plugins is not None:
         plugin_names, plugin_results = validate_plugins_array(plugins, marketplace_dir, json_path)
         report.plugins_found = plugin_names
-        report.results.extend(plugin_results)
+        report.extend(plugin_results)
 
         # Validate GitHub deployment structure
         if isinstance(plugins, list):
             deployment_results = validate_github_deployment(marketplace_dir, plugins)
-            report.results.extend(deployment_results)
+            report.extend(deployment_results)
 
             # Validate git submodules
             submodule_results = validate_git_submodules(marketplace_dir, plugins)
-            report.results.extend(submodule_results)
+            report.extend(submodule_results)
 
             # Validate GitHub repository URLs for publishing
             github_source_results = validate_github_source_required(plugins, json_path)
-            report.results.extend(github_source_results)
+            report.extend(github_source_results)
 
             # Scan for private info leaks (usernames, home paths)
             private_info_results = validate_marketplace_private_info(marketplace_dir, plugins)
-            report.results.extend(private_info_results)
+            report.extend(private_info_results)
 
             # Scan GitHub Actions workflows for dangerous inline Python patterns
             # (dict bracket access in f-strings inside shell-quoted python3 -c blocks)
             workflow_results = validate_workflow_inline_python(marketplace_dir)
-            report.results.extend(workflow_results)
+            report.extend(workflow_results)
 
     # Validate optional fields
     if "description" in data and not isinstance(data["description"], str):
-        report.add(
+        report.append(
             ValidationResult(
-                level="minor",
+                level="MINOR",
                 category="manifest",
                 message="description field must be a string",
-                file_path=json_path,
+                file=json_path,
             )
         )
 
     if "version" in data:
         version = data["version"]
         if not isinstance(version, str):
-            report.add(
+            report.append(
                 ValidationResult(
-                    level="minor",
+                    level="MINOR",
                     category="manifest",
                     message="version field must be a string",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
         elif not VERSION_PATTERN.match(version):
-            report.add(
+            report.append(
                 ValidationResult(
-                    level="minor",
+                    level="MINOR",
                     category="manifest",
                     message=f"Marketplace version '{version}' should follow semver format",
-                    file_path=json_path,
+                    file=json_path,
                 )
             )
 
@@ -1657,7 +1614,7 @@ def validate_marketplace(marketplace_path: Path) -> ValidationReport:
 # =============================================================================
 
 
-def format_report(report: ValidationReport, verbose: bool = False) -> str:
+def format_report(report: MarketplaceValidationReport, verbose: bool = False) -> str:
     """Format the validation report for display."""
     lines: list[str] = []
 
@@ -1674,10 +1631,10 @@ def format_report(report: ValidationReport, verbose: bool = False) -> str:
     lines.append("")
 
     # Group results by level
-    critical = [r for r in report.results if r.level == "critical"]
-    major = [r for r in report.results if r.level == "major"]
-    minor = [r for r in report.results if r.level == "minor"]
-    info = [r for r in report.results if r.level == "info"]
+    critical = [r for r in report.results if r.level == "CRITICAL"]
+    major = [r for r in report.results if r.level == "MAJOR"]
+    minor = [r for r in report.results if r.level == "MINOR"]
+    info = [r for r in report.results if r.level == "INFO"]
 
     # Summary
     lines.append(f"Critical Issues: {len(critical)}")
@@ -1689,11 +1646,11 @@ def format_report(report: ValidationReport, verbose: bool = False) -> str:
 
     # Details
     def format_result(r: ValidationResult) -> list[str]:
-        result_lines = [f"  [{r.level.upper()}] [{r.category}] {r.message}"]
-        if r.file_path:
-            loc = r.file_path
-            if r.line_number:
-                loc += f":{r.line_number}"
+        result_lines = [f"  [{r.level}] [{r.category}] {r.message}"]
+        if r.file:
+            loc = r.file
+            if r.line:
+                loc += f":{r.line}"
             result_lines.append(f"    Location: {loc}")
         if r.suggestion:
             result_lines.append(f"    Suggestion: {r.suggestion}")
@@ -1725,11 +1682,11 @@ def format_report(report: ValidationReport, verbose: bool = False) -> str:
 
     # Final status
     lines.append("=" * 60)
-    if report.has_critical():
+    if report.has_critical:
         lines.append("RESULT: FAILED (critical issues found)")
-    elif report.has_major():
+    elif report.has_major:
         lines.append("RESULT: FAILED (major issues found)")
-    elif report.has_minor():
+    elif report.has_minor:
         lines.append("RESULT: PASSED with warnings")
     else:
         lines.append("RESULT: PASSED")
@@ -1754,6 +1711,7 @@ Examples:
   %(prog)s ./my-marketplace
   %(prog)s ./my-marketplace/marketplace.json --verbose
   %(prog)s ./my-marketplace --json
+  %(prog)s ./my-marketplace --ndjson
         """,
     )
     parser.add_argument(
@@ -1772,42 +1730,51 @@ Examples:
         action="store_true",
         help="Output results as JSON",
     )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream results as NDJSON, then a summary record",
+    )
 
     args = parser.parse_args()
 
     # Run validation
-    report = validate_marketplace(args.marketplace_path)
+    sink = NDJSONSink(validator="marketplace") if args.ndjson else None
+    report = validate_marketplace(args.marketplace_path, sink)
 
     # Output results
-    if args.json:
+    if sink is not None:
+        sink.close({"marketplace_path": str(report.marketplace_path), "marketplace_name": report.marketplace_name})
+    elif args.json:
+        counts = report.count_by_level()
         output = {
             "marketplace_path": str(report.marketplace_path),
             "marketplace_name": report.marketplace_name,
             "plugins_found": report.plugins_found,
             "results": [
                 {
-                    "level": r.level,
+                    "level": r.level.lower(),
                     "category": r.category,
                     "message": r.message,
-                    "file_path": r.file_path,
-                    "line_number": r.line_number,
+                    "file_path": r.file,
+                    "line_number": r.line,
                     "suggestion": r.suggestion,
                 }
                 for r in report.results
             ],
             "summary": {
-                "critical": sum(1 for r in report.results if r.level == "critical"),
-                "major": sum(1 for r in report.results if r.level == "major"),
-                "minor": sum(1 for r in report.results if r.level == "minor"),
-                "info": sum(1 for r in report.results if r.level == "info"),
+                "critical": counts["CRITICAL"],
+                "major": counts["MAJOR"],
+                "minor": counts["MINOR"],
+                "info": counts["INFO"],
             },
-            "exit_code": report.exit_code(),
+            "exit_code": report.exit_code,
         }
         print(json.dumps(output, indent=2))
     else:
         print(format_report(report, args.verbose))
 
-    return report.exit_code()
+    return report.exit_code
 
 
 if __name__ == "__main__":
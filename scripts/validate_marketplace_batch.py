@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Marketplace Batch Validator for Claude Code Plugins.
+
+Deep-validates every plugin submodule of a marketplace by running the full
+quality scoring (validate_scoring.compute_quality_score) on each one. Plugins
+are scored in a process pool, each result is printed as soon as its plugin
+finishes, and an aggregated leaderboard is printed at the end.
+
+Plugins are discovered from the marketplace .gitmodules file. Submodules that
+are not checked out (missing or empty directory) are reported as skipped.
+
+Usage:
+    uv run python scripts/validate_marketplace_batch.py /path/to/marketplace
+    uv run python scripts/validate_marketplace_batch.py /path/to/marketplace --workers 8
+    uv run python scripts/validate_marketplace_batch.py /path/to/marketplace --json
+
+Exit codes (standard severity-based convention, worst plugin wins):
+    0 - PASS: No issues found
+    1 - CRITICAL: Critical issues found in at least one plugin
+    2 - MAJOR: Major issues found (no critical)
+    3 - MINOR: Minor issues only
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from validate_marketplace_pipeline import parse_gitmodules
+from validate_scoring import (
+    EXIT_CRITICAL,
+    EXIT_MAJOR,
+    EXIT_MINOR,
+    EXIT_PASS,
+    compute_quality_score,
+)
+from validation_common import COLORS
+
+# =============================================================================
+# Data Classes
+# =============================================================================
+
+
+@dataclass
+class PluginBatchResult:
+    """Quality score summary for one plugin of the batch.
+
+    Only the summary crosses the process boundary; the full per-validator
+    reports stay in the worker.
+
+    Attributes:
+        name: Submodule name from .gitmodules
+        path: Plugin directory relative to the marketplace root
+        status: PASS, CONDITIONAL_PASS, FAIL, SKIPPED or ERROR
+        overall_score: Overall quality score (0-100)
+        letter_grade: Letter grade (A+, A, B, etc.)
+        critical: Total critical issues across all categories
+        major: Total major issues across all categories
+        minor: Total minor issues across all categories
+        duration: Wall-clock seconds spent scoring the plugin
+        error: Error or skip reason, if the plugin was not scored
+    """
+
+    name: str
+    path: str
+    status: str
+    overall_score: float = 0.0
+    letter_grade: str = "F"
+    critical: int = 0
+    major: int = 0
+    minor: int = 0
+    duration: float = 0.0
+    error: str | None = None
+
+    @property
+    def scored(self) -> bool:
+        """Whether the plugin was actually scored."""
+        return self.status not in ("SKIPPED", "ERROR")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        data = asdict(self)
+        data["overall_score"] = round(self.overall_score, 2)
+        data["duration"] = round(self.duration, 3)
+        return data
+
+
+# =============================================================================
+# Plugin Discovery
+# =============================================================================
+
+
+def discover_plugin_submodules(marketplace_path: Path) -> list[tuple[str, str]]:
+    """List the plugin submodules of a marketplace.
+
+    Args:
+        marketplace_path: Path to marketplace root directory
+
+    Returns:
+        List of (submodule name, relative path) tuples, sorted by path
+    """
+    submodules = parse_gitmodules(marketplace_path / ".gitmodules")
+    plugins = [(name, info["path"]) for name, info in submodules.items() if info.get("path")]
+    return sorted(plugins, key=lambda plugin: plugin[1])
+
+
+def score_plugin(marketplace_path: Path, name: str, rel_path: str) -> PluginBatchResult:
+    """Score a single plugin submodule.
+
+    Runs in a worker process. Never raises: failures are returned as an
+    ERROR result so one broken plugin cannot abort the batch.
+
+    Args:
+        marketplace_path: Path to marketplace root directory
+        name: Submodule name from .gitmodules
+        rel_path: Plugin directory relative to the marketplace root
+
+    Returns:
+        PluginBatchResult summarizing the plugin's quality score
+    """
+    plugin_path = marketplace_path / rel_path
+    if not plugin_path.is_dir() or not any(plugin_path.iterdir()):
+        return PluginBatchResult(
+            name=name,
+            path=rel_path,
+            status="SKIPPED",
+            error="Submodule not checked out (run 'git submodule update --init')",
+        )
+
+    start = time.perf_counter()
+    try:
+        report = compute_quality_score(plugin_path)
+    except Exception as e:
+        return PluginBatchResult(
+            name=name,
+            path=rel_path,
+            status="ERROR",
+            duration=time.perf_counter() - start,
+            error=str(e),
+        )
+
+    categories = report.category_scores.values()
+    return PluginBatchResult(
+        name=name,
+        path=rel_path,
+        status=report.status,
+        overall_score=report.overall_score,
+        letter_grade=report.letter_grade,
+        critical=sum(cat.issues_critical for cat in categories),
+        major=sum(cat.issues_major for cat in categories),
+        minor=sum(cat.issues_minor for cat in categories),
+        duration=time.perf_counter() - start,
+    )
+
+
+# =============================================================================
+# Batch Validation
+# =============================================================================
+
+
+def validate_marketplace_batch(
+    marketplace_path: Path,
+    workers: int | None = None,
+    on_result: Callable[[PluginBatchResult], None] | None = None,
+) -> list[PluginBatchResult]:
+    """Score every plugin submodule of a marketplace across a process pool.
+
+    Each plugin is scored serially inside its own worker, so the pool
+    parallelizes across plugins rather than across validators.
+
+    Args:
+        marketplace_path: Path to marketplace root directory
+        workers: Worker processes (None = one per CPU, 1 = run serially)
+        on_result: Optional callable invoked with each PluginBatchResult as
+            soon as its plugin finishes (completion order)
+
+    Returns:
+        Results for all plugins, in completion order
+    """
+    plugins = discover_plugin_submodules(marketplace_path)
+    results: list[PluginBatchResult] = []
+
+    def collect(result: PluginBatchResult) -> None:
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(plugins))
+
+    if workers <= 1:
+        for name, rel_path in plugins:
+            collect(score_plugin(marketplace_path, name, rel_path))
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures: dict[Future[PluginBatchResult], tuple[str, str]] = {
+            pool.submit(score_plugin, marketplace_path, name, rel_path): (name, rel_path)
+            for name, rel_path in plugins
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # score_plugin catches its own errors; this covers a broken worker pool
+                name, rel_path = futures[future]
+                result = PluginBatchResult(name=name, path=rel_path, status="ERROR", error=str(e))
+            collect(result)
+
+    return results
+
+
+def rank_results(results: list[PluginBatchResult]) -> list[PluginBatchResult]:
+    """Order results for the leaderboard.
+
+    Scored plugins come first, best score first; ties are broken by fewer
+    critical and major issues, then by name. Skipped and failed plugins
+    follow, by name.
+
+    Args:
+        results: Batch results in any order
+
+    Returns:
+        New list in leaderboard order
+    """
+    return sorted(
+        results,
+        key=lambda r: (not r.scored, -r.overall_score, r.critical, r.major, r.name),
+    )
+
+
+def batch_exit_code(results: list[PluginBatchResult]) -> int:
+    """Compute the batch exit code from the worst plugin.
+
+    Args:
+        results: Batch results
+
+    Returns:
+        Exit code following the severity-based convention
+    """
+    if any(r.critical > 0 or r.status == "ERROR" for r in results):
+        return EXIT_CRITICAL
+    if any(r.major > 0 for r in results):
+        return EXIT_MAJOR
+    if any(r.minor > 0 for r in results):
+        return EXIT_MINOR
+    return EXIT_PASS
+
+
+# =============================================================================
+# Output Formatting
+# =============================================================================
+
+
+def _status_color(status: str) -> str:
+    """Pick the display color for a plugin status."""
+    if status == "PASS":
+        return COLORS["PASSED"]
+    if status in ("CONDITIONAL_PASS", "SKIPPED"):
+        return COLORS["MAJOR"]
+    return COLORS["CRITICAL"]
+
+
+def format_progress_line(result: PluginBatchResult, done: int, total: int) -> str:
+    """Format the streamed line for a finished plugin.
+
+    Args:
+        result: Result of the plugin that just finished
+        done: Number of plugins finished so far
+        total: Number of plugins in the batch
+
+    Returns:
+        Single progress line
+    """
+    width = len(str(total))
+    color = _status_color(result.status)
+    prefix = f"[{done:>{width}}/{total}] {color}{result.status:16}{COLORS['RESET']} {result.name}"
+    if not result.scored:
+        return f"{prefix} - {result.error}"
+    return (
+        f"{prefix} - {result.overall_score:.1f}/100 ({result.letter_grade}) "
+        f"C:{result.critical} M:{result.major} m:{result.minor} in {result.duration:.1f}s"
+    )
+
+
+def format_leaderboard(results: list[PluginBatchResult], elapsed: float) -> str:
+    """Format the aggregated leaderboard.
+
+    Args:
+        results: Batch results in any order
+        elapsed: Total wall-clock seconds for the batch
+
+    Returns:
+        Formatted leaderboard text
+    """
+    ranked = rank_results(results)
+    scored = [r for r in ranked if r.scored]
+    name_width = max([len(r.name) for r in ranked] + [len("Plugin")])
+
+    lines = [f"\n{'=' * 70}", f"{COLORS['BOLD']}Marketplace Plugin Leaderboard{COLORS['RESET']}", "=" * 70]
+    lines.append(f"  {'#':>4}  {'Plugin':{name_width}}  {'Score':>6}  Grade  {'Status':16}  Crit  Major  Minor")
+    lines.append("-" * 70)
+    for rank, r in enumerate(ranked, start=1):
+        color = _status_color(r.status)
+        position = f"{rank:>4}" if r.scored else f"{'-':>4}"
+        score = f"{r.overall_score:6.1f}" if r.scored else f"{'-':>6}"
+        grade = r.letter_grade if r.scored else "-"
+        lines.append(
+            f"  {position}  {r.name:{name_width}}  {score}  {grade:5}  "
+            f"{color}{r.status:16}{COLORS['RESET']}  {r.critical:>4}  {r.major:>5}  {r.minor:>5}"
+        )
+    lines.append("-" * 70)
+
+    counts = {status: sum(1 for r in results if r.status == status) for status in ("PASS", "CONDITIONAL_PASS", "FAIL")}
+    skipped = sum(1 for r in results if r.status == "SKIPPED")
+    errors = sum(1 for r in results if r.status == "ERROR")
+    average = sum(r.overall_score for r in scored) / len(scored) if scored else 0.0
+    lines.append(
+        f"Plugins: {len(results)} | PASS: {counts['PASS']} | CONDITIONAL: {counts['CONDITIONAL_PASS']} | "
+        f"FAIL: {counts['FAIL']} | SKIPPED: {skipped} | ERROR: {errors}"
+    )
+    lines.append(f"Average score: {average:.1f}/100 | Elapsed: {elapsed:.1f}s")
+    lines.append("=" * 70)
+    return "\n".join(lines)
+
+
+# =============================================================================
+# CLI Entry Point
+# =============================================================================
+
+
+def main() -> int:
+    """CLI entry point for batch marketplace validation.
+
+    Returns:
+        Exit code based on the highest severity issue in any plugin
+    """
+    parser = argparse.ArgumentParser(
+        description="Score every plugin submodule of a Claude Code marketplace",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s /path/to/marketplace
+  %(prog)s /path/to/marketplace --workers 8
+  %(prog)s /path/to/marketplace --json
+
+Exit codes (worst plugin wins):
+    0 - PASS: No issues found
+    1 - CRITICAL: Critical issues found (or a plugin could not be scored)
+    2 - MAJOR: Major issues found (no critical)
+    3 - MINOR: Minor issues only
+        """,
+    )
+    parser.add_argument(
+        "marketplace_path",
+        type=Path,
+        help="Path to marketplace root directory",
+    )
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Score up to N plugins concurrently (default: one per CPU, 1 = serial)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output one JSON line per finished plugin, then one line with the leaderboard",
+    )
+
+    args = parser.parse_args()
+
+    if not args.marketplace_path.is_dir():
+        print(f"Error: Marketplace path is not a directory: {args.marketplace_path}", file=sys.stderr)
+        return EXIT_CRITICAL
+
+    total = len(discover_plugin_submodules(args.marketplace_path))
+    if total == 0:
+        print(f"Error: No plugin submodules found in {args.marketplace_path / '.gitmodules'}", file=sys.stderr)
+        return EXIT_CRITICAL
+
+    done = 0
+
+    def stream(result: PluginBatchResult) -> None:
+        nonlocal done
+        done += 1
+        if args.json:
+            print(json.dumps(result.to_dict()), flush=True)
+        else:
+            print(format_progress_line(result, done, total), flush=True)
+
+    start = time.perf_counter()
+    results = validate_marketplace_batch(args.marketplace_path, workers=args.workers, on_result=stream)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        leaderboard = {
+            "marketplace_path": str(args.marketplace_path),
+            "elapsed": round(elapsed, 3),
+            "leaderboard": [r.to_dict() for r in rank_results(results)],
+        }
+        print(json.dumps(leaderboard))
+    else:
+        print(format_leaderboard(results, elapsed))
+
+    return batch_exit_code(results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
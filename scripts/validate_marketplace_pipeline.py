@@ -38,9 +38,16 @@ import subprocess
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any
 
 import yaml
+from validation_common import (
+    Level,
+    NDJSONSink,
+    ValidationReport,
+    ValidationResult,
+    get_submodule_snapshot,
+)
 
 # Exit codes (matching other validators)
 EXIT_OK = 0
@@ -48,9 +55,6 @@ EXIT_CRITICAL = 1
 EXIT_MAJOR = 2
 EXIT_MINOR = 3
 
-# Type alias for validation levels
-Level = Literal["CRITICAL", "MAJOR", "MINOR", "INFO", "PASSED"]
-
 # =============================================================================
 # Constants
 # =============================================================================
@@ -80,15 +84,10 @@ VERSION_PATTERN = re.compile(r"^\d+\.\d+\.\d+(-[a-zA-Z0-9.]+)?(\+[a-zA-Z0-9.]+)?
 # =============================================================================
 
 
-@dataclass
-class ValidationResult:
+@dataclass(slots=True)
+class PipelineResult(ValidationResult):
     """Result of a single validation check with weighted scoring."""
 
-    level: Level  # "CRITICAL", "MAJOR", "MINOR", "INFO", "PASSED"
-    category: str  # Category name for grouping
-    message: str
-    file_path: str = ""
-    suggestion: str = ""
     points_earned: float = 0.0
     points_possible: float = 0.0
 
@@ -98,8 +97,8 @@ class ValidationResult:
             "level": self.level,
             "category": self.category,
             "message": self.message,
-            "file_path": self.file_path if self.file_path else None,
-            "suggestion": self.suggestion if self.suggestion else None,
+            "file_path": self.file,
+            "suggestion": self.suggestion,
             "points_earned": self.points_earned,
             "points_possible": self.points_possible,
         }
@@ -107,13 +106,22 @@ class ValidationResult:
 
 @dataclass
 class CategoryScore:
-    """Score tracking for a validation category."""
+    """Score tracking for a validation category.
+
+    The category's results are kept in a shared ValidationReport, which
+    maintains their per-level counts.
+    """
 
     name: str
     weight: int
     points_earned: float = 0.0
     points_possible: float = 0.0
-    results: list[ValidationResult] = field(default_factory=list)
+    report: ValidationReport = field(default_factory=ValidationReport)
+
+    @property
+    def results(self) -> list[ValidationResult]:
+        """Results recorded for this category, in order."""
+        return self.report.results
 
     @property
     def percentage(self) -> float:
@@ -130,18 +138,22 @@ class CategoryScore:
 
 @dataclass
 class PipelineValidationReport:
-    """Complete validation report for marketplace pipeline."""
+    """Complete validation report for marketplace pipeline.
+
+    With a sink attached, every category report streams its results to it.
+    """
 
     marketplace_path: Path
     marketplace_name: str | None = None
     categories: dict[str, CategoryScore] = field(default_factory=dict)
     plugins_found: list[str] = field(default_factory=list)
     submodules_found: list[str] = field(default_factory=list)
+    sink: NDJSONSink | None = field(default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Initialize category scores."""
         for name, weight in CATEGORY_WEIGHTS.items():
-            self.categories[name] = CategoryScore(name=name, weight=weight)
+            self.categories[name] = CategoryScore(name=name, weight=weight, report=ValidationReport(sink=self.sink))
 
     def add(
         self,
@@ -158,18 +170,18 @@ class PipelineValidationReport:
         if points_earned is None:
             points_earned = points_possible if level == "PASSED" else 0.0
 
-        result = ValidationResult(
+        result = PipelineResult(
             level=level,
-            category=category,
             message=message,
-            file_path=file_path,
-            suggestion=suggestion,
+            file=file_path or None,
+            category=category,
+            suggestion=suggestion or None,
             points_earned=points_earned,
             points_possible=points_possible,
         )
 
         if category in self.categories:
-            self.categories[category].results.append(result)
+            self.categories[category].report.append(result)
             self.categories[category].points_earned += points_earned
             self.categories[category].points_possible += points_possible
 
@@ -257,18 +269,30 @@ class PipelineValidationReport:
         }
         return descriptions.get(self.grade, "Unknown")
 
+    def count_by_level(self) -> dict[str, int]:
+        """Get count of results by level, over all categories."""
+        counts = {"CRITICAL": 0, "MAJOR": 0, "MINOR": 0, "INFO": 0, "PASSED": 0}
+        for cat in self.categories.values():
+            for level, n in cat.report.count_by_level().items():
+                counts[level] = counts.get(level, 0) + n
+        return counts
+
+    @property
     def has_critical(self) -> bool:
         """Check if there are critical issues."""
-        return any(r.level == "CRITICAL" for cat in self.categories.values() for r in cat.results)
+        return any(cat.report.has_critical for cat in self.categories.values())
 
+    @property
     def has_major(self) -> bool:
         """Check if there are major issues."""
-        return any(r.level == "MAJOR" for cat in self.categories.values() for r in cat.results)
+        return any(cat.report.has_major for cat in self.categories.values())
 
+    @property
     def has_minor(self) -> bool:
         """Check if there are minor issues."""
-        return any(r.level == "MINOR" for cat in self.categories.values() for r in cat.results)
+        return any(cat.report.has_minor for cat in self.categories.values())
 
+    @property
     def exit_code(self) -> int:
         """Return appropriate exit code based on score."""
         score = self.total_score
@@ -666,26 +690,22 @@ def validate_submodule_health(
         report.passed(category, "No submodules to validate", 2.0)
         return
 
+    # Submodule state from one shared "git submodule status --recursive" call;
+    # only the submodules declared in this .gitmodules are checked here
+    snapshot = get_submodule_snapshot(marketplace_path)
+    declared_paths = {config.get("path") or name for name, config in submodules.items()}
+    states = [state for path, state in snapshot.states.items() if path in declared_paths]
+
     # Check 1: All submodules initialized (5 pts, CRITICAL)
-    success, output = run_git_command(marketplace_path, "submodule", "status")
-    if not success:
+    if not snapshot.ok:
         report.critical(
             category,
-            f"Failed to get submodule status: {output}",
+            f"Failed to get submodule status: {snapshot.output}",
             5.0,
             suggestion="Run 'git submodule init' and 'git submodule update'",
         )
-        uninitialized = list(submodules.keys())
     else:
-        # Parse submodule status - lines starting with '-' are uninitialized
-        uninitialized = []
-        for line in output.strip().split("\n"):
-            if line.startswith("-"):
-                # Format: -<sha> <path> (optional description)
-                parts = line[1:].split()
-                if len(parts) >= 2:
-                    uninitialized.append(parts[1])
-
+        uninitialized = [state.path for state in states if not state.initialized]
         if uninitialized:
             report.critical(
                 category,
@@ -751,14 +771,8 @@ def validate_submodule_health(
         report.passed(category, "All submodules use HTTPS GitHub URLs", 4.0)
 
     # Check 5: No detached HEAD warnings (2 pts, MINOR)
-    detached_heads = []
-    if success and output:
-        for line in output.strip().split("\n"):
-            # Lines with '+' indicate the submodule HEAD doesn't match recorded commit
-            if line.startswith("+"):
-                parts = line[1:].split()
-                if len(parts) >= 2:
-                    detached_heads.append(parts[1])
+    # A '+' status means the submodule HEAD doesn't match the recorded commit
+    detached_heads = [state.path for state in states if state.modified]
 
     if detached_heads:
         report.minor(
@@ -1345,17 +1359,19 @@ def validate_documentation(
 def validate_marketplace_pipeline(
     marketplace_path: Path,
     _verbose: bool = False,
+    sink: NDJSONSink | None = None,
 ) -> PipelineValidationReport:
     """Run all pipeline validation checks.
 
     Args:
         marketplace_path: Path to marketplace root directory
         _verbose: Reserved for future use (currently unused)
+        sink: Optional NDJSON sink; each result is streamed as soon as it is added
 
     Returns:
         Complete validation report
     """
-    report = PipelineValidationReport(marketplace_path=marketplace_path)
+    report = PipelineValidationReport(marketplace_path=marketplace_path, sink=sink)
 
     # Run all category validations
     validate_marketplace_structure(marketplace_path, report)
@@ -1430,8 +1446,8 @@ def format_text_report(report: PipelineValidationReport, verbose: bool = False)
             for result in issues:
                 icon = {"CRITICAL": "[X]", "MAJOR": "[!]", "MINOR": "[~]"}.get(result.level, "[-]")
                 lines.append(f"  {icon} {result.level}: {result.message}")
-                if result.file_path:
-                    lines.append(f"      File: {result.file_path}")
+                if result.file:
+                    lines.append(f"      File: {result.file}")
                 if result.suggestion:
                     lines.append(f"      Fix: {result.suggestion}")
 
@@ -1443,10 +1459,11 @@ def format_text_report(report: PipelineValidationReport, verbose: bool = False)
 
     # Summary
     lines.append("=" * 70)
-    total_critical = sum(1 for cat in report.categories.values() for r in cat.results if r.level == "CRITICAL")
-    total_major = sum(1 for cat in report.categories.values() for r in cat.results if r.level == "MAJOR")
-    total_minor = sum(1 for cat in report.categories.values() for r in cat.results if r.level == "MINOR")
-    total_passed = sum(1 for cat in report.categories.values() for r in cat.results if r.level == "PASSED")
+    counts = report.count_by_level()
+    total_critical = counts["CRITICAL"]
+    total_major = counts["MAJOR"]
+    total_minor = counts["MINOR"]
+    total_passed = counts["PASSED"]
 
     lines.append(f"SUMMARY: {total_critical} CRITICAL, {total_major} MAJOR, {total_minor} MINOR, {total_passed} PASSED")
     lines.append("=" * 70)
@@ -1469,6 +1486,7 @@ Examples:
   %(prog)s /path/to/marketplace
   %(prog)s /path/to/marketplace --verbose
   %(prog)s /path/to/marketplace --json
+  %(prog)s /path/to/marketplace --ndjson
 
 Exit Codes:
   0 - Score >= 90 (A grade) - Pipeline fully operational
@@ -1493,6 +1511,11 @@ Exit Codes:
         action="store_true",
         help="Output results as JSON",
     )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream results as NDJSON, then a summary record",
+    )
 
     args = parser.parse_args()
 
@@ -1506,15 +1529,26 @@ Exit Codes:
         return EXIT_MINOR
 
     # Run validation
-    report = validate_marketplace_pipeline(args.marketplace_path, _verbose=args.verbose)
+    sink = NDJSONSink(validator="pipeline") if args.ndjson else None
+    report = validate_marketplace_pipeline(args.marketplace_path, _verbose=args.verbose, sink=sink)
 
     # Output results
-    if args.json:
+    if sink is not None:
+        # The pipeline is graded by its weighted score, not by severity counts
+        sink.close(
+            {
+                "marketplace_path": str(report.marketplace_path),
+                "score": round(report.total_score, 2),
+                "grade": report.grade,
+                "exit_code": report.exit_code,
+            }
+        )
+    elif args.json:
         print(json.dumps(report.to_dict(), indent=2))
     else:
         print(format_text_report(report, verbose=args.verbose))
 
-    return report.exit_code()
+    return report.exit_code
 
 
 if __name__ == "__main__":
@@ -30,82 +30,10 @@ import os
 import re
 import shutil
 import sys
-from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Literal
-
-# Validation result levels
-Level = Literal["CRITICAL", "MAJOR", "MINOR", "INFO", "PASSED"]
-
-
-@dataclass
-class ValidationResult:
-    """Single validation result."""
-
-    level: Level
-    message: str
-    file: str | None = None
-    line: int | None = None
-
-
-@dataclass
-class ValidationReport:
-    """Complete validation report."""
-
-    results: list[ValidationResult] = field(default_factory=list)
-
-    def add(
-        self,
-        level: Level,
-        message: str,
-        file: str | None = None,
-        line: int | None = None,
-    ) -> None:
-        """Add a validation result."""
-        self.results.append(ValidationResult(level, message, file, line))
-
-    def passed(self, message: str, file: str | None = None) -> None:
-        """Add a passed check."""
-        self.add("PASSED", message, file)
-
-    def info(self, message: str, file: str | None = None) -> None:
-        """Add an info message."""
-        self.add("INFO", message, file)
-
-    def minor(self, message: str, file: str | None = None, line: int | None = None) -> None:
-        """Add a minor issue."""
-        self.add("MINOR", message, file, line)
-
-    def major(self, message: str, file: str | None = None, line: int | None = None) -> None:
-        """Add a major issue."""
-        self.add("MAJOR", message, file, line)
-
-    def critical(self, message: str, file: str | None = None, line: int | None = None) -> None:
-        """Add a critical issue."""
-        self.add("CRITICAL", message, file, line)
-
-    @property
-    def has_critical(self) -> bool:
-        return any(r.level == "CRITICAL" for r in self.results)
-
-    @property
-    def has_major(self) -> bool:
-        return any(r.level == "MAJOR" for r in self.results)
-
-    @property
-    def has_minor(self) -> bool:
-        return any(r.level == "MINOR" for r in self.results)
-
-    @property
-    def exit_code(self) -> int:
-        if self.has_critical:
-            return 1
-        if self.has_major:
-            return 2
-        if self.has_minor:
-            return 3
-        return 0
+from typing import Any
 
+from validation_common import NDJSONSink, ValidationReport
 
 # Valid transport types
 VALID_TRANSPORTS = {"stdio", "sse", "http"}
@@ -342,6 +270,7 @@ def validate_mcp_config(
     config_path: Path,
     plugin_root: Path | None = None,
     report: ValidationReport | None = None,
+    sink: NDJSONSink | None = None,
 ) -> ValidationReport:
     """Validate an MCP configuration file (.mcp.json).
 
@@ -349,12 +278,13 @@ def validate_mcp_config(
         config_path: Path to the .mcp.json file
         plugin_root: Optional path to plugin root for path resolution
         report: Optional existing report to add to
+        sink: Optional NDJSON sink for a new report (results are streamed as they are added)
 
     Returns:
         ValidationReport with all validation results
     """
     if report is None:
-        report = ValidationReport()
+        report = ValidationReport(sink=sink)
 
     rel_path = config_path.name
     if plugin_root:
@@ -414,7 +344,11 @@ def validate_mcp_config(
     return report
 
 
-def validate_plugin_mcp(plugin_root: Path, report: ValidationReport | None = None) -> ValidationReport:
+def validate_plugin_mcp(
+    plugin_root: Path,
+    report: ValidationReport | None = None,
+    sink: NDJSONSink | None = None,
+) -> ValidationReport:
     """Validate all MCP configurations in a plugin.
 
     Checks both .mcp.json and inline mcpServers in plugin.json.
@@ -422,12 +356,13 @@ def validate_plugin_mcp(plugin_root: Path, report: ValidationReport | None = Non
     Args:
         plugin_root: Path to the plugin root directory
         report: Optional existing report to add to
+        sink: Optional NDJSON sink for a new report (results are streamed as they are added)
 
     Returns:
         ValidationReport with all validation results
     """
     if report is None:
-        report = ValidationReport()
+        report = ValidationReport(sink=sink)
 
     # Check for .mcp.json
     mcp_json = plugin_root / ".mcp.json"
@@ -543,6 +478,7 @@ def main() -> int:
     parser = argparse.ArgumentParser(description="Validate MCP configuration")
     parser.add_argument("--verbose", "-v", action="store_true", help="Show all results")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--ndjson", action="store_true", help="Stream results as NDJSON, then a summary record")
     parser.add_argument(
         "path",
         nargs="?",
@@ -561,13 +497,16 @@ def main() -> int:
         return 1
 
     # Determine if it's a file or directory
+    sink = NDJSONSink(validator="mcp") if args.ndjson else None
     if path.is_file():
-        report = validate_mcp_config(path, path.parent)
+        report = validate_mcp_config(path, path.parent, sink=sink)
     else:
-        report = validate_plugin_mcp(path)
+        report = validate_plugin_mcp(path, sink=sink)
 
     # Output
-    if args.json:
+    if sink is not None:
+        sink.close({"path": str(path)})
+    elif args.json:
         output = {
             "exit_code": report.exit_code,
             "counts": {
@@ -9,6 +9,7 @@ Usage:
     uv run python scripts/validate_plugin.py /path/to/plugin
     uv run python scripts/validate_plugin.py --verbose
     uv run python scripts/validate_plugin.py --json
+    uv run python scripts/validate_plugin.py --ndjson
     uv run python scripts/validate_plugin.py --marketplace-only
     uv run python scripts/validate_plugin.py --skip-platform-checks windows
 
@@ -38,89 +39,24 @@ import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Literal, cast
+from typing import Any, cast
 
 import yaml
-from validate_hook import validate_hooks as validate_hook_file
-from validate_mcp import validate_plugin_mcp
 
-# Import comprehensive skill validator (84+ rules from AgentSkills OpenSpec, Nixtla, Meta-Skills)
-from validate_skill_comprehensive import validate_skill as validate_skill_comprehensive
-from validation_common import resolve_tool_command
-
-# Validation result levels
-Level = Literal["CRITICAL", "MAJOR", "MINOR", "INFO", "PASSED"]
-
-
-@dataclass
-class ValidationResult:
-    """Single validation result."""
-
-    level: Level
-    message: str
-    file: str | None = None
-    line: int | None = None
-
-
-@dataclass
-class ValidationReport:
-    """Complete validation report."""
-
-    results: list[ValidationResult] = field(default_factory=list)
-
-    def add(
-        self,
-        level: Level,
-        message: str,
-        file: str | None = None,
-        line: int | None = None,
-    ) -> None:
-        """Add a validation result."""
-        self.results.append(ValidationResult(level, message, file, line))
-
-    def passed(self, message: str, file: str | None = None) -> None:
-        """Add a passed check."""
-        self.add("PASSED", message, file)
-
-    def info(self, message: str, file: str | None = None) -> None:
-        """Add an info message."""
-        self.add("INFO", message, file)
-
-    def minor(self, message: str, file: str | None = None, line: int | None = None) -> None:
-        """Add a minor issue."""
-        self.add("MINOR", message, file, line)
-
-    def major(self, message: str, file: str | None = None, line: int | None = None) -> None:
-        """Add a major issue."""
-        self.add("MAJOR", message, file, line)
-
-    def critical(self, message: str, file: str | None = None, line: int | None = None) -> None:
-        """Add a critical issue."""
-        self.add("CRITICAL", message, file, line)
-
-    @property
-    def has_critical(self) -> bool:
-        return any(r.level == "CRITICAL" for r in self.results)
-
-    @property
-    def has_major(self) -> bool:
-        return any(r.level == "MAJOR" for r in self.results)
-
-    @property
-    def has_minor(self) -> bool:
-        return any(r.level == "MINOR" for r in self.results)
-
-    @property
-    def exit_code(self) -> int:
-        if self.has_critical:
-            return 1
-        if self.has_major:
-            return 2
-        if self.has_minor:
-            return 3
-        return 0
+# The hook, MCP and comprehensive skill validators are imported by the
+# functions that use them, so skipped checks never load them.
+from validation_common import (
+    ChangeScope,
+    LineIndex,
+    NDJSONSink,
+    PluginTreeIndex,
+    ResultCache,
+    ValidationReport,
+    get_change_scope,
+    load_frontmatter_yaml,
+    resolve_tool_command,
+)
 
 
 def validate_manifest(
@@ -333,8 +269,8 @@ def validate_structure(plugin_root: Path, report: ValidationReport, marketplace_
                 report.minor(f"Directory {d}/ not found")
 
 
-def validate_commands(plugin_root: Path, report: ValidationReport) -> None:
-    """Validate command definitions."""
+def validate_commands(plugin_root: Path, report: ValidationReport, scope: ChangeScope | None = None) -> None:
+    """Validate command definitions (only those in scope, if given)."""
     commands_dir = plugin_root / "commands"
 
     if not commands_dir.is_dir():
@@ -350,6 +286,8 @@ def validate_commands(plugin_root: Path, report: ValidationReport) -> None:
     report.info(f"Found {len(cmd_files)} command file(s)")
 
     for cmd_path in cmd_files:
+        if scope is not None and not scope.includes(f"commands/{cmd_path.name}"):
+            continue
         validate_command_file(cmd_path, report)
 
 
@@ -369,7 +307,7 @@ def validate_command_file(cmd_path: Path, report: ValidationReport) -> None:
             report.critical("Malformed frontmatter (missing closing ---)", rel_path)
             return
 
-        frontmatter = yaml.safe_load(parts[1])
+        frontmatter = load_frontmatter_yaml(parts[1])
     except yaml.YAMLError as e:
         report.critical(f"Invalid YAML frontmatter: {e}", rel_path)
         return
@@ -395,8 +333,8 @@ def validate_command_file(cmd_path: Path, report: ValidationReport) -> None:
         report.major("Missing 'description' in frontmatter", rel_path)
 
 
-def validate_agents(plugin_root: Path, report: ValidationReport) -> None:
-    """Validate agent definitions."""
+def validate_agents(plugin_root: Path, report: ValidationReport, scope: ChangeScope | None = None) -> None:
+    """Validate agent definitions (only those in scope, if given)."""
     agents_dir = plugin_root / "agents"
 
     if not agents_dir.is_dir():
@@ -412,6 +350,8 @@ def validate_agents(plugin_root: Path, report: ValidationReport) -> None:
     report.info(f"Found {len(agent_files)} agent file(s)")
 
     for agent_path in agent_files:
+        if scope is not None and not scope.includes(f"agents/{agent_path.name}"):
+            continue
         validate_agent_file(agent_path, report)
 
 
@@ -431,7 +371,7 @@ def validate_agent_file(agent_path: Path, report: ValidationReport) -> None:
             report.critical("Malformed frontmatter (missing closing ---)", rel_path)
             return
 
-        frontmatter = yaml.safe_load(parts[1])
+        frontmatter = load_frontmatter_yaml(parts[1])
     except yaml.YAMLError as e:
         report.critical(f"Invalid YAML frontmatter: {e}", rel_path)
         return
@@ -450,8 +390,15 @@ def validate_agent_file(agent_path: Path, report: ValidationReport) -> None:
         report.major("Missing 'description' in frontmatter", rel_path)
 
 
-def validate_hooks(plugin_root: Path, report: ValidationReport) -> None:
-    """Validate hook configuration using comprehensive hook validator."""
+def validate_hooks(plugin_root: Path, report: ValidationReport, scope: ChangeScope | None = None) -> None:
+    """Validate hook configuration using comprehensive hook validator.
+
+    With a change scope, hooks are skipped unless something under hooks/ is
+    in scope (a changed hook script brings hooks.json in as a dependent).
+    """
+    if scope is not None and not scope.touches("hooks"):
+        return
+
     hooks_dir = plugin_root / "hooks"
 
     if not hooks_dir.is_dir():
@@ -464,6 +411,8 @@ def validate_hooks(plugin_root: Path, report: ValidationReport) -> None:
         return
 
     # Use comprehensive hook validator
+    from validate_hook import validate_hooks as validate_hook_file
+
     hook_report = validate_hook_file(hooks_json, plugin_root)
 
     # Transfer all results to main report
@@ -480,18 +429,19 @@ def validate_hooks(plugin_root: Path, report: ValidationReport) -> None:
         report.add(result.level, result.message, file_path, result.line)
 
 
-def validate_mcp(plugin_root: Path, report: ValidationReport) -> None:
-    """Validate MCP server configurations."""
-    # Use comprehensive MCP validator
-    mcp_report = validate_plugin_mcp(plugin_root)
+def validate_mcp(plugin_root: Path, report: ValidationReport, scope: ChangeScope | None = None) -> None:
+    """Validate MCP server configurations (skipped if no MCP config file is in scope)."""
+    if scope is not None and not (scope.includes(".mcp.json") or scope.includes(".claude-plugin/plugin.json")):
+        return
 
-    # Transfer all results to main report
-    for result in mcp_report.results:
-        report.add(result.level, result.message, result.file, result.line)
+    # Use comprehensive MCP validator, adding straight to the main report
+    from validate_mcp import validate_plugin_mcp
+
+    validate_plugin_mcp(plugin_root, report)
 
 
-def validate_scripts(plugin_root: Path, report: ValidationReport) -> None:
-    """Validate Python and shell scripts."""
+def validate_scripts(plugin_root: Path, report: ValidationReport, scope: ChangeScope | None = None) -> None:
+    """Validate Python and shell scripts (only those in scope, if given)."""
     scripts_dir = plugin_root / "scripts"
 
     if not scripts_dir.is_dir():
@@ -500,6 +450,8 @@ def validate_scripts(plugin_root: Path, report: ValidationReport) -> None:
 
     # Python scripts
     py_files = list(scripts_dir.glob("*.py"))
+    if scope is not None:
+        py_files = [f for f in py_files if scope.includes(f"scripts/{f.name}")]
     if py_files:
         # Ruff check - exclude E501 (line length) as it's configurable per project
         ruff_cmd = resolve_tool_command("ruff")
@@ -551,6 +503,8 @@ def validate_scripts(plugin_root: Path, report: ValidationReport) -> None:
 
     # Shell scripts
     sh_files = list(scripts_dir.glob("*.sh"))
+    if scope is not None:
+        sh_files = [f for f in sh_files if scope.includes(f"scripts/{f.name}")]
     for sh_file in sh_files:
         if not os.access(sh_file, os.X_OK):
             report.major(
@@ -577,13 +531,21 @@ def validate_scripts(plugin_root: Path, report: ValidationReport) -> None:
             report.minor("shellcheck not available locally or via bunx/npx, skipping shell lint")
 
 
-def validate_skills(plugin_root: Path, report: ValidationReport, skip_platform_checks: list[str] | None = None) -> None:
+def validate_skills(
+    plugin_root: Path,
+    report: ValidationReport,
+    skip_platform_checks: list[str] | None = None,
+    cache: ResultCache | None = None,
+    scope: ChangeScope | None = None,
+) -> None:
     """Validate all skills in the plugin's skills/ directory.
 
     Args:
         plugin_root: Path to plugin root directory
         report: ValidationReport to add results to
         skip_platform_checks: List of platforms to skip checks for (e.g., ['windows'])
+        cache: Optional result cache; unchanged skills replay their cached reports
+        scope: Optional change scope; only skills with a file in scope are validated
     """
     skills_dir = plugin_root / "skills"
 
@@ -600,9 +562,16 @@ def validate_skills(plugin_root: Path, report: ValidationReport, skip_platform_c
 
     report.info(f"Found {len(skill_dirs)} skill(s) to validate")
 
+    # Import comprehensive skill validator (84+ rules from AgentSkills OpenSpec, Nixtla, Meta-Skills)
+    from validate_skill_comprehensive import (
+        validate_skill as validate_skill_comprehensive,
+    )
+
     # Validate each skill using comprehensive validator (84+ rules)
     for skill_dir in sorted(skill_dirs):
         skill_name = skill_dir.name
+        if scope is not None and not scope.touches(f"skills/{skill_name}"):
+            continue
         # Use comprehensive validator with all checks enabled
         skill_report = validate_skill_comprehensive(
             skill_dir,
@@ -610,6 +579,7 @@ def validate_skills(plugin_root: Path, report: ValidationReport, skip_platform_c
             strict_openspec=False,  # Don't require OpenSpec 6-field whitelist for plugins
             validate_pillars_flag=skill_name.startswith(("lang-", "convert-")),  # Auto-enable for lang-*/convert-*
             skip_platform_checks=skip_platform_checks,
+            cache=cache,
         )
 
         # Transfer results to main report with skill path prefix
@@ -637,7 +607,12 @@ def validate_license(plugin_root: Path, report: ValidationReport) -> None:
     report.minor("No LICENSE file found")
 
 
-def validate_no_local_paths(plugin_root: Path, report: ValidationReport) -> None:
+def validate_no_local_paths(
+    plugin_root: Path,
+    report: ValidationReport,
+    index: PluginTreeIndex | None = None,
+    scope: ChangeScope | None = None,
+) -> None:
     """Validate that plugin files don't contain hardcoded local or absolute paths.
 
     Uses the stricter absolute path validation from validation_common.py.
@@ -657,6 +632,9 @@ def validate_no_local_paths(plugin_root: Path, report: ValidationReport) -> None
     - .git/ directory
     - Allowed system paths (/tmp/, /dev/, /proc/, /sys/)
     - Generic example usernames in documentation
+
+    Pass the run's shared PluginTreeIndex as index to avoid re-reading files,
+    and a ChangeScope as scope to only scan the files in it.
     """
     # Import the stricter absolute path validation from validation_common
     from validation_common import validate_no_absolute_paths
@@ -664,8 +642,7 @@ def validate_no_local_paths(plugin_root: Path, report: ValidationReport) -> None
     # Use the strict absolute path validator which checks for:
     # - Current user's username (auto-detected) - CRITICAL
     # - ANY absolute paths that don't use env vars - MAJOR
-    # We pass our local report since both have compatible interfaces
-    validate_no_absolute_paths(plugin_root, report)  # type: ignore[arg-type]
+    validate_no_absolute_paths(plugin_root, report, index=index, scope=scope)
 
 
 # Regex to find inline Python blocks inside YAML: `python3 -c "..."`  or `python -c "..."`
@@ -683,7 +660,9 @@ _FSTRING_DICT_BRACKET_RE = re.compile(
 )
 
 
-def validate_workflow_inline_python(plugin_root: Path, report: ValidationReport) -> None:
+def validate_workflow_inline_python(
+    plugin_root: Path, report: ValidationReport, scope: ChangeScope | None = None
+) -> None:
     """Scan GitHub Actions workflow files for dangerous inline Python patterns.
 
     When a YAML workflow uses ``python3 -c "..."`` (double-quoted shell string),
@@ -692,13 +671,16 @@ def validate_workflow_inline_python(plugin_root: Path, report: ValidationReport)
     sees the code.  Python then interprets the bare word as an undefined
     variable name, causing NameError.
 
-    This validator catches that pattern and reports it as MAJOR.
+    This validator catches that pattern and reports it as MAJOR. With a
+    change scope, only workflow files in scope are scanned.
     """
     workflows_dir = plugin_root / ".github" / "workflows"
     if not workflows_dir.is_dir():
         return
 
     yaml_files = list(workflows_dir.glob("*.yml")) + list(workflows_dir.glob("*.yaml"))
+    if scope is not None:
+        yaml_files = [f for f in yaml_files if scope.includes(f".github/workflows/{f.name}")]
     if not yaml_files:
         return
 
@@ -710,6 +692,7 @@ def validate_workflow_inline_python(plugin_root: Path, report: ValidationReport)
             continue
 
         rel_path = str(yaml_path.relative_to(plugin_root))
+        lines = LineIndex(content)
 
         # Find all inline Python blocks
         for match in _YAML_INLINE_PYTHON_RE.finditer(content):
@@ -719,7 +702,7 @@ def validate_workflow_inline_python(plugin_root: Path, report: ValidationReport)
             # Search for f-strings with dict bracket access
             for bad_match in _FSTRING_DICT_BRACKET_RE.finditer(python_code):
                 abs_offset = block_start_offset + bad_match.start()
-                line_num = content[:abs_offset].count("\n") + 1
+                line_num = lines.line_of(abs_offset)
                 snippet = bad_match.group(0)
                 found_any = True
                 report.major(
@@ -813,6 +796,7 @@ def main() -> int:
         help="Show all results including passed checks",
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--ndjson", action="store_true", help="Stream results as NDJSON, then a summary record")
     parser.add_argument(
         "--marketplace-only",
         action="store_true",
@@ -825,6 +809,16 @@ def main() -> int:
         help="Skip platform-specific checks (e.g., --skip-platform-checks windows). "
         "Valid platforms: windows, macos, linux. Use without args to skip all.",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse cached results for skills unchanged since the last cached run",
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REV",
+        help="Only validate files changed since git revision REV, plus the files that reference them",
+    )
     parser.add_argument("path", nargs="?", help="Plugin root path (default: parent of scripts/)")
     args = parser.parse_args()
 
@@ -839,25 +833,41 @@ def main() -> int:
         return 1
 
     # Run validation
-    report = ValidationReport()
+    sink = NDJSONSink(validator="plugin") if args.ndjson else None
+    report = ValidationReport(sink=sink)
+    index = PluginTreeIndex(plugin_root)
+    cache = ResultCache(plugin_root) if args.cache else None
     marketplace_only = args.marketplace_only
     skip_platform_checks = args.skip_platform_checks
+    scope = None
+    if args.changed_since:
+        try:
+            scope = get_change_scope(plugin_root, args.changed_since, index)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
 
+    # Manifest, structure, README and license checks are cheap and always run
     validate_manifest(plugin_root, report, marketplace_only)
     validate_structure(plugin_root, report, marketplace_only)
-    validate_commands(plugin_root, report)
-    validate_agents(plugin_root, report)
-    validate_hooks(plugin_root, report)
-    validate_mcp(plugin_root, report)
-    validate_scripts(plugin_root, report)
-    validate_skills(plugin_root, report, skip_platform_checks)
+    validate_commands(plugin_root, report, scope)
+    validate_agents(plugin_root, report, scope)
+    validate_hooks(plugin_root, report, scope)
+    validate_mcp(plugin_root, report, scope)
+    validate_scripts(plugin_root, report, scope)
+    validate_skills(plugin_root, report, skip_platform_checks, cache, scope)
     validate_readme(plugin_root, report)
     validate_license(plugin_root, report)
-    validate_no_local_paths(plugin_root, report)
-    validate_workflow_inline_python(plugin_root, report)
+    validate_no_local_paths(plugin_root, report, index, scope)
+    validate_workflow_inline_python(plugin_root, report, scope)
+
+    if cache is not None:
+        cache.save()
 
     # Output
-    if args.json:
+    if sink is not None:
+        sink.close({"plugin_path": str(plugin_root)})
+    elif args.json:
         print_json(report)
     else:
         print_results(report, args.verbose)
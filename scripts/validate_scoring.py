@@ -9,6 +9,7 @@ Usage:
     uv run python scripts/validate_scoring.py /path/to/plugin
     uv run python scripts/validate_scoring.py /path/to/plugin --verbose
     uv run python scripts/validate_scoring.py /path/to/plugin --json
+    uv run python scripts/validate_scoring.py /path/to/plugin --workers 4
 
 Exit codes (standard severity-based convention):
     0 - PASS: No issues found
@@ -24,44 +25,20 @@ import json
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
-
-# Import all validators
-from validate_agent import validate_agent
-from validate_command import validate_command
-from validate_hook import validate_hooks
-from validate_mcp import validate_plugin_mcp
-from validate_plugin import (
-    validate_agents as plugin_validate_agents,
-)
-from validate_plugin import (
-    validate_commands as plugin_validate_commands,
-)
-from validate_plugin import (
-    validate_hooks as plugin_validate_hooks,
-)
-from validate_plugin import (
-    validate_license,
-    validate_manifest,
-    validate_readme,
-    validate_scripts,
-    validate_structure,
-)
-from validate_plugin import (
-    validate_mcp as plugin_validate_mcp,
-)
-from validate_plugin import (
-    validate_skills as plugin_validate_skills,
-)
-from validate_security import validate_security
-from validate_skill import validate_skill
+from typing import Any, Callable
 
-# Import shared validation infrastructure
+# Import shared validation infrastructure. The validator modules (and yaml,
+# which they use) are imported by their runners below, so startup only pays
+# for the validators that actually run.
 from validation_common import (
     COLORS,
+    ChangeScope,
+    NDJSONSink,
+    PluginTreeIndex,
     ValidationReport,
     ValidationResult,
     calculate_letter_grade,
+    get_change_scope,
 )
 
 # =============================================================================
@@ -340,7 +317,7 @@ def categorize_results(
 
     # Process all results from all validators
     for validator_name, report in reports.items():
-        for result in report.results:
+        for result in report.iter_results():
             categorize_result(result, validator_name)
 
     return categories
@@ -402,113 +379,282 @@ def generate_recommendations(category_scores: dict[str, CategoryScore]) -> list[
 # =============================================================================
 
 
-def run_all_validators(plugin_path: Path) -> dict[str, ValidationReport]:
-    """Run all validators and collect their reports.
+# Validators dominated by regex scanning of every file run in a process pool
+# when --workers > 1; the rest spend their time in file I/O and linter
+# subprocesses and share a thread pool.
+PROCESS_VALIDATORS = frozenset({"security"})
 
-    Args:
-        plugin_path: Path to the plugin directory
 
-    Returns:
-        Dictionary of validator name -> ValidationReport
-    """
-    reports: dict[str, ValidationReport] = {}
+def _run_plugin_validator(
+    plugin_path: Path, index: PluginTreeIndex | None, scope: ChangeScope | None = None
+) -> ValidationReport | None:
+    """Run the plugin validator (main manifest and structure).
 
-    # Run plugin validator (main manifest and structure)
-    # Uses multiple functions from validate_plugin.py
-    # Note: validate_plugin uses its own ValidationReport class with compatible interface
+    Uses multiple functions from validate_plugin.py.
+    """
     try:
+        from validate_plugin import (
+            validate_agents as plugin_validate_agents,
+        )
+        from validate_plugin import (
+            validate_commands as plugin_validate_commands,
+        )
+        from validate_plugin import (
+            validate_hooks as plugin_validate_hooks,
+        )
+        from validate_plugin import (
+            validate_license,
+            validate_manifest,
+            validate_readme,
+            validate_scripts,
+            validate_structure,
+        )
+        from validate_plugin import (
+            validate_mcp as plugin_validate_mcp,
+        )
+        from validate_plugin import (
+            validate_skills as plugin_validate_skills,
+        )
+
         plugin_report = ValidationReport()
-        _ = validate_manifest(plugin_path, plugin_report)  # type: ignore[arg-type]
-        validate_structure(plugin_path, plugin_report)  # type: ignore[arg-type]
-        plugin_validate_commands(plugin_path, plugin_report)  # type: ignore[arg-type]
-        plugin_validate_agents(plugin_path, plugin_report)  # type: ignore[arg-type]
-        plugin_validate_hooks(plugin_path, plugin_report)  # type: ignore[arg-type]
-        plugin_validate_mcp(plugin_path, plugin_report)  # type: ignore[arg-type]
-        validate_scripts(plugin_path, plugin_report)  # type: ignore[arg-type]
-        plugin_validate_skills(plugin_path, plugin_report)  # type: ignore[arg-type]
-        validate_readme(plugin_path, plugin_report)  # type: ignore[arg-type]
-        validate_license(plugin_path, plugin_report)  # type: ignore[arg-type]
-        reports["plugin"] = plugin_report
+        _ = validate_manifest(plugin_path, plugin_report)
+        validate_structure(plugin_path, plugin_report)
+        plugin_validate_commands(plugin_path, plugin_report, scope)
+        plugin_validate_agents(plugin_path, plugin_report, scope)
+        plugin_validate_hooks(plugin_path, plugin_report, scope)
+        plugin_validate_mcp(plugin_path, plugin_report, scope)
+        validate_scripts(plugin_path, plugin_report, scope)
+        plugin_validate_skills(plugin_path, plugin_report, scope=scope)
+        validate_readme(plugin_path, plugin_report)
+        validate_license(plugin_path, plugin_report)
+        return plugin_report
     except Exception as e:
         error_report = ValidationReport()
         error_report.critical(f"Plugin validation failed: {e}")
-        reports["plugin"] = error_report
+        return error_report
+
 
-    # Run security validator (comprehensive security scan)
+def _run_security_validator(
+    plugin_path: Path, index: PluginTreeIndex | None, scope: ChangeScope | None = None
+) -> ValidationReport | None:
+    """Run the security validator (comprehensive security scan)."""
     try:
-        security_report = validate_security(plugin_path)
-        reports["security"] = security_report
+        from validate_security import validate_security
+
+        return validate_security(plugin_path, index=index, scope=scope)
     except Exception as e:
         error_report = ValidationReport()
         error_report.critical(f"Security validation failed: {e}")
-        reports["security"] = error_report
+        return error_report
+
 
-    # Run hook validator if hooks.json exists (detailed hook validation)
-    # Note: validate_hooks returns its own ValidationReport with compatible interface
+def _run_hooks_validator(
+    plugin_path: Path, index: PluginTreeIndex | None, scope: ChangeScope | None = None
+) -> ValidationReport | None:
+    """Run the hook validator if hooks.json exists (detailed hook validation)."""
     hooks_path = plugin_path / "hooks" / "hooks.json"
-    if hooks_path.exists():
-        try:
-            hook_report = validate_hooks(hooks_path, plugin_path)
-            reports["hooks"] = hook_report  # type: ignore[assignment]
-        except Exception as e:
-            error_report = ValidationReport()
-            error_report.critical(f"Hook validation failed: {e}")
-            reports["hooks"] = error_report
+    if not hooks_path.exists():
+        return None
+    if scope is not None and not scope.touches("hooks"):
+        return None
+    try:
+        from validate_hook import validate_hooks
 
-    # Run MCP validator if .mcp.json exists
-    # Note: validate_plugin_mcp returns its own ValidationReport with compatible interface
+        return validate_hooks(hooks_path, plugin_path)
+    except Exception as e:
+        error_report = ValidationReport()
+        error_report.critical(f"Hook validation failed: {e}")
+        return error_report
+
+
+def _run_mcp_validator(
+    plugin_path: Path, index: PluginTreeIndex | None, scope: ChangeScope | None = None
+) -> ValidationReport | None:
+    """Run the MCP validator if .mcp.json exists."""
     mcp_path = plugin_path / ".mcp.json"
-    if mcp_path.exists():
+    if not mcp_path.exists():
+        return None
+    if scope is not None and not scope.includes(".mcp.json"):
+        return None
+    try:
+        from validate_mcp import validate_plugin_mcp
+
+        return validate_plugin_mcp(plugin_path)
+    except Exception as e:
+        error_report = ValidationReport()
+        error_report.critical(f"MCP validation failed: {e}")
+        return error_report
+
+
+def _run_agents_validator(
+    plugin_path: Path, index: PluginTreeIndex | None, scope: ChangeScope | None = None
+) -> ValidationReport | None:
+    """Run the detailed agent validator for each agent file."""
+    agents_dir = plugin_path / "agents"
+    if not agents_dir.exists():
+        return None
+    from validate_agent import validate_agent
+
+    agent_report = ValidationReport()
+    for agent_file in agents_dir.glob("*.md"):
+        if scope is not None and not scope.includes(f"agents/{agent_file.name}"):
+            continue
         try:
-            mcp_report = validate_plugin_mcp(plugin_path)
-            reports["mcp"] = mcp_report  # type: ignore[assignment]
+            agent_single_report = validate_agent(agent_file)
+            agent_report.merge(agent_single_report)
         except Exception as e:
-            error_report = ValidationReport()
-            error_report.critical(f"MCP validation failed: {e}")
-            reports["mcp"] = error_report
+            agent_report.critical(f"Agent validation failed for {agent_file.name}: {e}")
+    return agent_report
 
-    # Run detailed agent validator for each agent file
-    agents_dir = plugin_path / "agents"
-    if agents_dir.exists():
-        agent_report = ValidationReport()
-        for agent_file in agents_dir.glob("*.md"):
+
+def _run_skills_validator(
+    plugin_path: Path, index: PluginTreeIndex | None, scope: ChangeScope | None = None
+) -> ValidationReport | None:
+    """Run the detailed skill validator for each skill directory."""
+    skills_dir = plugin_path / "skills"
+    if not skills_dir.exists():
+        return None
+    from validate_skill import validate_skill
+
+    skill_report = ValidationReport()
+    for skill_dir in skills_dir.iterdir():
+        if scope is not None and not scope.touches(f"skills/{skill_dir.name}"):
+            continue
+        if skill_dir.is_dir() and not skill_dir.name.startswith("."):
             try:
-                agent_single_report = validate_agent(agent_file)
-                agent_report.merge(agent_single_report)
+                skill_single_report = validate_skill(skill_dir)
+                skill_report.merge(skill_single_report)
             except Exception as e:
-                agent_report.critical(f"Agent validation failed for {agent_file.name}: {e}")
-        reports["agents"] = agent_report
+                skill_report.critical(f"Skill validation failed for {skill_dir.name}: {e}")
+    return skill_report
 
-    # Run detailed skill validator for each skill directory
-    # Note: validate_skill returns its own ValidationReport with compatible interface
-    skills_dir = plugin_path / "skills"
-    if skills_dir.exists():
-        skill_report = ValidationReport()
-        for skill_dir in skills_dir.iterdir():
-            if skill_dir.is_dir() and not skill_dir.name.startswith("."):
-                try:
-                    skill_single_report = validate_skill(skill_dir)
-                    skill_report.merge(skill_single_report)  # type: ignore[arg-type]
-                except Exception as e:
-                    skill_report.critical(f"Skill validation failed for {skill_dir.name}: {e}")
-        reports["skills"] = skill_report
-
-    # Run detailed command validator for each command file
+
+def _run_commands_validator(
+    plugin_path: Path, index: PluginTreeIndex | None, scope: ChangeScope | None = None
+) -> ValidationReport | None:
+    """Run the detailed command validator for each command file."""
     commands_dir = plugin_path / "commands"
-    if commands_dir.exists():
-        command_report = ValidationReport()
-        for cmd_file in commands_dir.glob("*.md"):
+    if not commands_dir.exists():
+        return None
+    from validate_command import validate_command
+
+    command_report = ValidationReport()
+    for cmd_file in commands_dir.glob("*.md"):
+        if scope is not None and not scope.includes(f"commands/{cmd_file.name}"):
+            continue
+        try:
+            cmd_single_report = validate_command(cmd_file)
+            command_report.merge(cmd_single_report)
+        except Exception as e:
+            command_report.critical(f"Command validation failed for {cmd_file.name}: {e}")
+    return command_report
+
+
+# Validator name -> runner, in the order reports are merged (and run when serial)
+VALIDATOR_RUNNERS: dict[
+    str, Callable[[Path, PluginTreeIndex | None, ChangeScope | None], ValidationReport | None]
+] = {
+    "plugin": _run_plugin_validator,
+    "security": _run_security_validator,
+    "hooks": _run_hooks_validator,
+    "mcp": _run_mcp_validator,
+    "agents": _run_agents_validator,
+    "skills": _run_skills_validator,
+    "commands": _run_commands_validator,
+}
+
+
+def run_all_validators(
+    plugin_path: Path,
+    workers: int = 1,
+    scope: ChangeScope | None = None,
+    sink: NDJSONSink | None = None,
+) -> dict[str, ValidationReport]:
+    """Run all validators and collect their reports.
+
+    The validators are independent, so with workers > 1 they run
+    concurrently: PROCESS_VALIDATORS in a process pool, the rest in a thread
+    pool. Reports are still collected in VALIDATOR_RUNNERS order, so the
+    result is identical to a serial run.
+
+    Only a serial run shares one PluginTreeIndex, so each file is read at
+    most once. The index fills its caches lazily without locking, so it is
+    not safe to share across the thread pool (and a process pool worker
+    cannot see it at all): in parallel mode each validator walks and reads
+    the tree itself.
+
+    With a sink, each validator's results are streamed as soon as that
+    validator finishes (in completion order when running concurrently).
+
+    Args:
+        plugin_path: Path to the plugin directory
+        workers: Maximum concurrent validators (1 = run serially)
+        scope: Optional change scope; validators only check the files in it
+        sink: Optional NDJSON sink, records are tagged with the validator name
+
+    Returns:
+        Dictionary of validator name -> ValidationReport
+    """
+    reports: dict[str, ValidationReport] = {}
+
+    if workers <= 1:
+        # Shared tree index: every file-walking validator reads each file at most once per run
+        index = PluginTreeIndex(plugin_path)
+        for name, runner in VALIDATOR_RUNNERS.items():
+            report = runner(plugin_path, index, scope)
+            if report is not None:
+                reports[name] = report
+                if sink is not None:
+                    sink.write_all(report.iter_results(), name)
+        return reports
+
+    from concurrent.futures import (
+        Future,
+        ProcessPoolExecutor,
+        ThreadPoolExecutor,
+        as_completed,
+    )
+
+    futures: dict[str, Future[ValidationReport | None]] = {}
+    process_workers = min(workers, len(PROCESS_VALIDATORS))
+    with (
+        ThreadPoolExecutor(max_workers=workers) as thread_pool,
+        ProcessPoolExecutor(max_workers=process_workers) as process_pool,
+    ):
+        # No shared index: PluginTreeIndex is not thread-safe, and worker
+        # processes could not share it anyway
+        for name, runner in VALIDATOR_RUNNERS.items():
+            pool = process_pool if name in PROCESS_VALIDATORS else thread_pool
+            futures[name] = pool.submit(runner, plugin_path, None, scope)
+
+        names = {future: name for name, future in futures.items()}
+        completed: dict[str, ValidationReport | None] = {}
+        for future in as_completed(names):
+            name = names[future]
             try:
-                cmd_single_report = validate_command(cmd_file)
-                command_report.merge(cmd_single_report)
+                report = future.result()
             except Exception as e:
-                command_report.critical(f"Command validation failed for {cmd_file.name}: {e}")
-        reports["commands"] = command_report
+                # Runners catch their own errors; this covers a broken worker pool
+                report = ValidationReport()
+                report.critical(f"{name.capitalize()} validation failed: {e}")
+            completed[name] = report
+            if report is not None and sink is not None:
+                sink.write_all(report.iter_results(), name)
+
+    for name in VALIDATOR_RUNNERS:
+        report = completed[name]
+        if report is not None:
+            reports[name] = report
 
     return reports
 
 
-def compute_quality_score(plugin_path: Path) -> QualityScoreReport:
+def compute_quality_score(
+    plugin_path: Path,
+    workers: int = 1,
+    scope: ChangeScope | None = None,
+    sink: NDJSONSink | None = None,
+) -> QualityScoreReport:
     """Compute comprehensive quality score for a plugin.
 
     This function:
@@ -521,6 +667,9 @@ def compute_quality_score(plugin_path: Path) -> QualityScoreReport:
 
     Args:
         plugin_path: Path to the plugin directory
+        workers: Maximum concurrent validators (1 = run serially)
+        scope: Optional change scope; only the files in it are scored
+        sink: Optional NDJSON sink; validator results are streamed as they finish
 
     Returns:
         QualityScoreReport with complete scoring breakdown
@@ -528,7 +677,7 @@ def compute_quality_score(plugin_path: Path) -> QualityScoreReport:
     report = QualityScoreReport(plugin_path=str(plugin_path))
 
     # Run all validators
-    validator_reports = run_all_validators(plugin_path)
+    validator_reports = run_all_validators(plugin_path, workers=workers, scope=scope, sink=sink)
     report.validator_reports = validator_reports
 
     # Categorize all results
@@ -745,6 +894,27 @@ Rating scale (0-10 per category):
         help="Output results as JSON instead of formatted text",
     )
 
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream validator results as NDJSON while scoring, then a summary record",
+    )
+
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run up to N validators concurrently (default: 1, serial)",
+    )
+
+    parser.add_argument(
+        "--changed-since",
+        metavar="REV",
+        help="Only validate files changed since git revision REV, plus the files that reference them",
+    )
+
     args = parser.parse_args()
 
     # Validate plugin path exists
@@ -756,11 +926,30 @@ Rating scale (0-10 per category):
         print(f"Error: Plugin path is not a directory: {args.plugin_path}", file=sys.stderr)
         return EXIT_CRITICAL
 
+    scope = None
+    if args.changed_since:
+        try:
+            scope = get_change_scope(args.plugin_path, args.changed_since)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return EXIT_CRITICAL
+
     # Compute quality score
-    report = compute_quality_score(args.plugin_path)
+    sink = NDJSONSink() if args.ndjson else None
+    report = compute_quality_score(args.plugin_path, workers=args.workers, scope=scope, sink=sink)
 
     # Output results
-    if args.json:
+    if sink is not None:
+        # The summary carries the weighted quality score, not the raw health score
+        sink.close(
+            {
+                "plugin_path": report.plugin_path,
+                "score": round(report.overall_score, 2),
+                "grade": report.letter_grade,
+                "status": report.status,
+            }
+        )
+    elif args.json:
         print(report.to_json())
     else:
         print_quality_report(report, verbose=args.verbose)
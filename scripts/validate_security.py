@@ -19,7 +19,6 @@ from __future__ import annotations
 
 import argparse
 import json
-import os
 import re
 import stat
 import sys
@@ -30,9 +29,19 @@ from validation_common import (
     SECRET_PATTERNS,
     SKIP_DIRS,
     USER_PATH_PATTERNS,
+    ChangeScope,
+    NDJSONSink,
+    PluginTreeIndex,
+    ResultCache,
     ValidationReport,
+    ValidationResult,
+    candidate_lines,
+    combine_patterns,
+    get_change_scope,
+    get_tree_index,
     print_report_summary,
     print_results_by_level,
+    validator_version,
 )
 
 # =============================================================================
@@ -104,6 +113,22 @@ PATH_TRAVERSAL_PATTERNS = [
     (re.compile(r"[A-Za-z]:\\"), "Windows absolute path detected"),
 ]
 
+# Literal prefixes the content scans need, per pattern table: every match of
+# a table's patterns contains a match of one of its anchors, so a line no
+# anchor touches cannot match. Each anchor starts with a literal, which lets
+# one pass over a file skip ahead to the few places worth a closer look.
+# Keep this in sync when adding a pattern; test_validator_regressions.py
+# checks that scanning only the candidate lines finds every issue.
+SECURITY_ANCHORS = {
+    "command_substitution": [r"\$\(", r"`"],
+    "unsafe_variable": [r"\$[A-Za-z_]"],
+    "pipe_to_shell": [r"\|\s*(?:sh|bash|zsh|ksh|source|\.\s)"],
+    "eval": [r"eval", r"exec", r"Function"],
+    "path_traversal": [r"\.\./", r"\.\.\\", r":\\", r"/(?:usr|etc|var|tmp|opt|bin|sbin|lib|root)/"],
+    "secrets": [r"AKIA", r"-----BEGIN", r"ghp_", r"sk-", r"xox", r"(?i:api[_-]?key)"],
+    "user_paths": [r"/Users/", r"/home/", r"C:\\Users\\"],
+}
+
 # =============================================================================
 # Binary File Detection
 # =============================================================================
@@ -166,13 +191,20 @@ BINARY_EXTENSIONS = {
 # =============================================================================
 
 
-def is_binary_file(file_path: Path) -> bool:
-    """Check if a file is binary based on extension or content."""
+def is_binary_file(file_path: Path, content: bytes | None = None) -> bool:
+    """Check if a file is binary based on extension or content.
+
+    Args:
+        file_path: Path to the file
+        content: Already-loaded file bytes (read from file_path if omitted)
+    """
     # Check extension first (fast path)
     if file_path.suffix.lower() in BINARY_EXTENSIONS:
         return True
 
     # Check file content for null bytes (binary indicator)
+    if content is not None:
+        return b"\x00" in content[:8192]
     try:
         with open(file_path, "rb") as f:
             chunk = f.read(8192)
@@ -207,15 +239,19 @@ def is_validator_script(file_path: str) -> bool:
     return ("validate_" in file_lower and file_lower.endswith(".py")) or "validation_common" in file_lower
 
 
-def scan_for_injection(content: str, file_path: str, report: ValidationReport) -> int:
+def scan_for_injection(
+    content: str, file_path: str, report: ValidationReport, candidates: list[tuple[int, str]] | None = None
+) -> int:
     """Scan content for injection patterns. Returns count of issues found.
 
     CRITICAL: This check runs BEFORE any allowlist processing.
     Note: Shell scripts (.sh, .bash) legitimately use command substitution,
     so we only flag command substitution in non-shell files where it's unexpected.
+    When candidates is given (see security_prefilter), only those lines are scanned.
     """
     issues_found = 0
-    lines = content.split("\n")
+    if candidates is None:
+        candidates = list(enumerate(content.split("\n"), start=1))
 
     file_lower = file_path.lower()
 
@@ -240,7 +276,7 @@ def scan_for_injection(content: str, file_path: str, report: ValidationReport) -
     # Skip command substitution checks for shell scripts (it's expected) and markdown/tests
     skip_command_sub = is_shell_script or is_markdown or is_test_file
 
-    for line_num, line in enumerate(lines, start=1):
+    for line_num, line in candidates:
         # Skip comment-only lines in shell scripts
         stripped = line.strip()
         if stripped.startswith("#") and not stripped.startswith("#!"):
@@ -277,14 +313,17 @@ def scan_for_injection(content: str, file_path: str, report: ValidationReport) -
     return issues_found
 
 
-def scan_for_path_traversal(content: str, file_path: str, report: ValidationReport) -> int:
+def scan_for_path_traversal(
+    content: str, file_path: str, report: ValidationReport, candidates: list[tuple[int, str]] | None = None
+) -> int:
     """Scan content for path traversal patterns. Returns count of issues found.
 
     Note: Documentation files (.md) often contain examples showing path syntax.
     We skip path checks for markdown documentation to avoid false positives.
     """
     issues_found = 0
-    lines = content.split("\n")
+    if candidates is None:
+        candidates = list(enumerate(content.split("\n"), start=1))
 
     file_lower = file_path.lower()
 
@@ -300,7 +339,7 @@ def scan_for_path_traversal(content: str, file_path: str, report: ValidationRepo
     if "test_" in file_lower or "_test.py" in file_lower or "/tests/" in file_lower:
         return 0
 
-    for line_num, line in enumerate(lines, start=1):
+    for line_num, line in candidates:
         # Skip comment-only lines
         stripped = line.strip()
         if stripped.startswith("#") and not stripped.startswith("#!"):
@@ -318,12 +357,15 @@ def scan_for_path_traversal(content: str, file_path: str, report: ValidationRepo
     return issues_found
 
 
-def scan_for_secrets(content: str, file_path: str, report: ValidationReport) -> int:
+def scan_for_secrets(
+    content: str, file_path: str, report: ValidationReport, candidates: list[tuple[int, str]] | None = None
+) -> int:
     """Scan content for secret patterns. Returns count of issues found."""
     issues_found = 0
-    lines = content.split("\n")
+    if candidates is None:
+        candidates = list(enumerate(content.split("\n"), start=1))
 
-    for line_num, line in enumerate(lines, start=1):
+    for line_num, line in candidates:
         for pattern, secret_type in SECRET_PATTERNS:
             if pattern.search(line):
                 # Mask the actual secret in the report
@@ -334,14 +376,17 @@ def scan_for_secrets(content: str, file_path: str, report: ValidationReport) ->
     return issues_found
 
 
-def scan_for_user_paths(content: str, file_path: str, report: ValidationReport) -> int:
+def scan_for_user_paths(
+    content: str, file_path: str, report: ValidationReport, candidates: list[tuple[int, str]] | None = None
+) -> int:
     """Scan content for hardcoded user paths. Returns count of issues found.
 
     Note: Validator scripts and documentation contain pattern examples that would
     trigger false positives. We skip those files.
     """
     issues_found = 0
-    lines = content.split("\n")
+    if candidates is None:
+        candidates = list(enumerate(content.split("\n"), start=1))
 
     file_lower = file_path.lower()
 
@@ -357,7 +402,7 @@ def scan_for_user_paths(content: str, file_path: str, report: ValidationReport)
     if "test_" in file_lower or "_test.py" in file_lower or "/tests/" in file_lower:
         return 0
 
-    for line_num, line in enumerate(lines, start=1):
+    for line_num, line in candidates:
         for pattern in USER_PATH_PATTERNS:
             match = pattern.search(line)
             if match:
@@ -371,86 +416,138 @@ def scan_for_user_paths(content: str, file_path: str, report: ValidationReport)
     return issues_found
 
 
-def check_dangerous_files(plugin_path: Path, report: ValidationReport) -> int:
+# One combined anchor pattern per set of active tables, built on first use
+_PREFILTERS: dict[frozenset[str], re.Pattern[str]] = {}
+
+
+def security_prefilter(file_path: str) -> re.Pattern[str]:
+    """Combined SECURITY_ANCHORS of the pattern tables the scans run on file_path.
+
+    The scans skip whole tables by file type (validator scripts, markdown,
+    shell scripts, test files), so only the anchors of tables that still
+    apply are combined. Backticks in markdown, for instance, never make a
+    line a candidate.
+
+    Args:
+        file_path: Path as passed to the scan_for_* functions
+
+    Returns:
+        Pattern for candidate_lines(), shared by files with the same tables
+    """
+    file_lower = file_path.lower()
+    is_markdown = file_lower.endswith((".md", ".mdx", ".markdown"))
+    is_test_file = "test_" in file_lower or "_test.py" in file_lower or "/tests/" in file_lower
+
+    tables = {"secrets"}
+    if not is_validator_script(file_path):
+        tables.update(("pipe_to_shell", "eval", "unsafe_variable"))
+        is_shell_script = file_lower.endswith((".sh", ".bash", ".zsh", ".ksh"))
+        if not (is_markdown or is_shell_script or is_test_file or "\\tests\\" in file_lower):
+            tables.add("command_substitution")
+        if not (is_markdown or is_test_file):
+            tables.update(("path_traversal", "user_paths"))
+
+    key = frozenset(tables)
+    prefilter = _PREFILTERS.get(key)
+    if prefilter is None:
+        anchors = [re.compile(anchor) for table in sorted(key) for anchor in SECURITY_ANCHORS[table]]
+        prefilter = _PREFILTERS[key] = combine_patterns(anchors)
+    return prefilter
+
+
+def check_dangerous_files(
+    plugin_path: Path,
+    report: ValidationReport,
+    index: PluginTreeIndex | None = None,
+    scope: ChangeScope | None = None,
+) -> int:
     """Check for presence of dangerous files in the plugin. Returns count found."""
     issues_found = 0
 
-    for root, dirs, files in os.walk(plugin_path):
-        # Skip hidden and cache directories
-        dirs[:] = [d for d in dirs if not should_skip_directory(d)]
-
-        for filename in files:
-            if filename in DANGEROUS_FILES:
-                full_path = Path(root) / filename
-                rel_path = full_path.relative_to(plugin_path)
-                report.critical(f"Dangerous file detected: {rel_path}")
-                issues_found += 1
+    # Skip hidden and cache directories
+    for indexed in get_tree_index(plugin_path, index).iter_files(skip_dir=should_skip_directory):
+        if scope is not None and not scope.includes(indexed.rel_path):
+            continue
+        if indexed.name in DANGEROUS_FILES:
+            report.critical(f"Dangerous file detected: {indexed.rel_path}")
+            issues_found += 1
 
     return issues_found
 
 
-def check_script_permissions(plugin_path: Path, report: ValidationReport) -> int:
+def check_script_permissions(
+    plugin_path: Path,
+    report: ValidationReport,
+    index: PluginTreeIndex | None = None,
+    scope: ChangeScope | None = None,
+) -> int:
     """Check script files for proper permissions. Returns count of issues found."""
     issues_found = 0
 
-    for root, dirs, files in os.walk(plugin_path):
-        # Skip hidden and cache directories
-        dirs[:] = [d for d in dirs if not should_skip_directory(d)]
-
-        for filename in files:
-            file_path = Path(root) / filename
-            rel_path = file_path.relative_to(plugin_path)
-
-            # Check shell scripts
-            if filename.endswith(".sh"):
-                try:
-                    file_stat = file_path.stat()
-                    mode = file_stat.st_mode
-
-                    # Check if executable
-                    if not (mode & stat.S_IXUSR):
-                        report.minor(f"Shell script is not executable: {rel_path}")
-                        issues_found += 1
-
-                    # Check for world-writable (security risk)
-                    if mode & stat.S_IWOTH:
-                        report.critical(f"Script is world-writable: {rel_path}")
-                        issues_found += 1
-
-                    # Check for proper shebang
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        first_line = f.readline()
-                        if not first_line.startswith("#!"):
-                            report.minor(f"Shell script missing shebang: {rel_path}")
-                            issues_found += 1
-                        elif "bash" not in first_line and "sh" not in first_line:
-                            report.info(f"Shell script has non-standard shebang: {first_line.strip()}", str(rel_path))
-
-                except (OSError, PermissionError) as e:
-                    report.major(f"Cannot check script permissions: {rel_path} ({e})")
+    # Skip hidden and cache directories
+    for indexed in get_tree_index(plugin_path, index).iter_files(skip_dir=should_skip_directory):
+        filename = indexed.name
+        rel_path = indexed.rel_path
+        if scope is not None and not scope.includes(rel_path):
+            continue
+
+        # Check shell scripts
+        if filename.endswith(".sh"):
+            try:
+                mode = indexed.stat.st_mode
+
+                # Check if executable
+                if not (mode & stat.S_IXUSR):
+                    report.minor(f"Shell script is not executable: {rel_path}")
                     issues_found += 1
 
-            # Check Python scripts
-            elif filename.endswith(".py"):
-                try:
-                    file_stat = file_path.stat()
-                    mode = file_stat.st_mode
+                # Check for world-writable (security risk)
+                if mode & stat.S_IWOTH:
+                    report.critical(f"Script is world-writable: {rel_path}")
+                    issues_found += 1
 
-                    # Check for world-writable
-                    if mode & stat.S_IWOTH:
-                        report.critical(f"Python script is world-writable: {rel_path}")
-                        issues_found += 1
+                # Check for proper shebang
+                first_line = indexed.text(errors="ignore").split("\n", 1)[0]
+                if not first_line.startswith("#!"):
+                    report.minor(f"Shell script missing shebang: {rel_path}")
+                    issues_found += 1
+                elif "bash" not in first_line and "sh" not in first_line:
+                    report.info(f"Shell script has non-standard shebang: {first_line.strip()}", rel_path)
+
+            except (OSError, PermissionError) as e:
+                report.major(f"Cannot check script permissions: {rel_path} ({e})")
+                issues_found += 1
+
+        # Check Python scripts
+        elif filename.endswith(".py"):
+            try:
+                mode = indexed.stat.st_mode
 
-                except (OSError, PermissionError) as e:
-                    report.major(f"Cannot check script permissions: {rel_path} ({e})")
+                # Check for world-writable
+                if mode & stat.S_IWOTH:
+                    report.critical(f"Python script is world-writable: {rel_path}")
                     issues_found += 1
 
+            except (OSError, PermissionError) as e:
+                report.major(f"Cannot check script permissions: {rel_path} ({e})")
+                issues_found += 1
+
     return issues_found
 
 
-def scan_all_files(plugin_path: Path, report: ValidationReport) -> dict[str, int]:
+def scan_all_files(
+    plugin_path: Path,
+    report: ValidationReport,
+    index: PluginTreeIndex | None = None,
+    cache: ResultCache | None = None,
+    scope: ChangeScope | None = None,
+) -> dict[str, int]:
     """Recursively scan all text files in the plugin for security issues.
 
+    With a result cache, files whose content is unchanged since the last run
+    are not rescanned; their cached findings are replayed instead. With a
+    change scope, only files in the scope are scanned.
+
     Returns a dictionary with counts of issues found by category.
     """
     stats = {
@@ -462,35 +559,50 @@ def scan_all_files(plugin_path: Path, report: ValidationReport) -> dict[str, int
         "user_path_issues": 0,
     }
 
-    for root, dirs, files in os.walk(plugin_path):
-        # Filter out directories to skip
-        dirs[:] = [d for d in dirs if not should_skip_directory(d)]
-
-        for filename in files:
-            file_path = Path(root) / filename
-            rel_path = str(file_path.relative_to(plugin_path))
+    # Filter out directories to skip
+    for indexed in get_tree_index(plugin_path, index).iter_files(skip_dir=should_skip_directory):
+        rel_path = indexed.rel_path
+        if scope is not None and not scope.includes(rel_path):
+            continue
 
-            # Skip binary files
-            if is_binary_file(file_path):
+        try:
+            # Skip binary files (extension check first, so binaries are never read)
+            if is_binary_file(indexed.path, None if indexed.suffix in BINARY_EXTENSIONS else indexed.raw):
                 stats["files_skipped"] += 1
                 continue
 
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-
-                stats["files_scanned"] += 1
+            content = indexed.text(errors="ignore")
+        except (OSError, PermissionError):
+            # Treat unreadable files as binary
+            stats["files_skipped"] += 1
+            continue
 
-                # Run all content scans
-                # CRITICAL: Injection detection runs FIRST, before any allowlisting
-                stats["injection_issues"] += scan_for_injection(content, rel_path, report)
-                stats["path_traversal_issues"] += scan_for_path_traversal(content, rel_path, report)
-                stats["secret_issues"] += scan_for_secrets(content, rel_path, report)
-                stats["user_path_issues"] += scan_for_user_paths(content, rel_path, report)
+        stats["files_scanned"] += 1
 
-            except (OSError, PermissionError) as e:
-                report.minor(f"Cannot read file: {rel_path} ({e})")
-                stats["files_skipped"] += 1
+        if cache is not None:
+            cache_key = cache.key("security", validator_version(__file__), rel_path, indexed.raw)
+            entry = cache.get(cache_key)
+            if entry is not None:
+                cache.replay(entry, report.append, ValidationResult)
+                for category, count in entry["data"].items():
+                    stats[category] += count
+                continue
+            first_result = len(report.results)
+
+        # Run all content scans over the lines the file's prefilter flagged
+        # CRITICAL: Injection detection runs FIRST, before any allowlisting
+        candidates = candidate_lines(content, security_prefilter(rel_path))
+        file_stats = {
+            "injection_issues": scan_for_injection(content, rel_path, report, candidates),
+            "path_traversal_issues": scan_for_path_traversal(content, rel_path, report, candidates),
+            "secret_issues": scan_for_secrets(content, rel_path, report, candidates),
+            "user_path_issues": scan_for_user_paths(content, rel_path, report, candidates),
+        }
+        for category, count in file_stats.items():
+            stats[category] += count
+
+        if cache is not None:
+            cache.put(cache_key, "security", report.results[first_result:], file_stats)
 
     return stats
 
@@ -500,7 +612,14 @@ def scan_all_files(plugin_path: Path, report: ValidationReport) -> dict[str, int
 # =============================================================================
 
 
-def validate_security(plugin_path: Path) -> ValidationReport:
+def validate_security(
+    plugin_path: Path,
+    index: PluginTreeIndex | None = None,
+    cache: ResultCache | None = None,
+    scope: ChangeScope | None = None,
+    sink: NDJSONSink | None = None,
+    keep_passed_info: bool = True,
+) -> ValidationReport:
     """Run all security validations on a plugin directory.
 
     This function performs comprehensive security analysis including:
@@ -514,11 +633,16 @@ def validate_security(plugin_path: Path) -> ValidationReport:
 
     Args:
         plugin_path: Path to the plugin directory
+        index: Shared tree index for this run (built on demand if omitted)
+        cache: Optional result cache; unchanged files replay their cached findings
+        scope: Optional change scope; only files in it are checked (see --changed-since)
+        sink: Optional NDJSON sink; each finding is streamed as soon as it is added
+        keep_passed_info: If False, PASSED and INFO results are only counted, not stored
 
     Returns:
         ValidationReport with all security findings
     """
-    report = ValidationReport()
+    report = ValidationReport(sink=sink, keep_passed_info=keep_passed_info)
 
     # Verify plugin path exists
     if not plugin_path.exists():
@@ -531,18 +655,21 @@ def validate_security(plugin_path: Path) -> ValidationReport:
 
     report.info(f"Starting security scan of: {plugin_path}")
 
+    # One directory scan and one read per file, shared by all checks below
+    index = get_tree_index(plugin_path, index)
+
     # Check 1: Dangerous files (quick check first)
-    dangerous_count = check_dangerous_files(plugin_path, report)
+    dangerous_count = check_dangerous_files(plugin_path, report, index, scope)
     if dangerous_count == 0:
         report.passed("No dangerous files detected")
 
     # Check 2: Script permissions
-    permission_issues = check_script_permissions(plugin_path, report)
+    permission_issues = check_script_permissions(plugin_path, report, index, scope)
     if permission_issues == 0:
         report.passed("All scripts have proper permissions")
 
     # Check 3-6: Full content scan (injection, path traversal, secrets, user paths)
-    scan_stats = scan_all_files(plugin_path, report)
+    scan_stats = scan_all_files(plugin_path, report, index, cache, scope)
 
     # Report scan statistics
     report.info(f"Scanned {scan_stats['files_scanned']} files, skipped {scan_stats['files_skipped']} binary files")
@@ -590,14 +717,45 @@ Exit Codes:
     parser.add_argument("plugin_path", type=Path, help="Path to the plugin directory to validate")
     parser.add_argument("-v", "--verbose", action="store_true", help="Show all results including INFO and PASSED")
     parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    parser.add_argument("--ndjson", action="store_true", help="Stream results as NDJSON, then a summary record")
+    parser.add_argument("--cache", action="store_true", help="Only rescan files changed since the last cached run")
+    parser.add_argument(
+        "--changed-since",
+        metavar="REV",
+        help="Only scan files changed since git revision REV, plus the files that reference them",
+    )
 
     args = parser.parse_args()
 
+    # Shared by the change scope and the validator
+    index = PluginTreeIndex(args.plugin_path)
+    scope = None
+    if args.changed_since:
+        try:
+            scope = get_change_scope(args.plugin_path, args.changed_since, index)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
     # Run validation
-    report = validate_security(args.plugin_path)
+    cache = ResultCache(args.plugin_path) if args.cache else None
+    sink = NDJSONSink(validator="security") if args.ndjson else None
+    report = validate_security(
+        args.plugin_path,
+        index=index,
+        cache=cache,
+        scope=scope,
+        sink=sink,
+        # PASSED/INFO results are only printed in verbose and JSON output
+        keep_passed_info=args.verbose or args.json,
+    )
+    if cache is not None:
+        cache.save()
 
     # Output results
-    if args.json:
+    if sink is not None:
+        sink.close({"plugin_path": str(args.plugin_path)})
+    elif args.json:
         output = report.to_dict()
         output["plugin_path"] = str(args.plugin_path)
         print(json.dumps(output, indent=2))
@@ -24,14 +24,11 @@ import json
 import os
 import re
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any
 
-import yaml
-
-# Validation result levels
-Level = Literal["CRITICAL", "MAJOR", "MINOR", "INFO", "PASSED"]
+from validation_common import NDJSONSink, ValidationReport, parse_frontmatter
 
 # Maximum recommended SKILL.md line count per Anthropic docs
 MAX_SKILL_LINES = 500
@@ -56,76 +53,19 @@ KNOWN_FRONTMATTER_FIELDS = {
 
 
 @dataclass
-class ValidationResult:
-    """Single validation result."""
+class SkillValidationReport(ValidationReport):
+    """Validation report for a skill directory, extends base ValidationReport with skill_path."""
 
-    level: Level
-    message: str
-    file: str | None = None
-    line: int | None = None
+    skill_path: str = ""
 
+    def to_dict(self) -> dict[str, object]:
+        """Convert to dictionary for JSON serialization."""
+        base = super().to_dict()
+        base["skill_path"] = self.skill_path
+        return base
 
-@dataclass
-class ValidationReport:
-    """Complete validation report for a skill."""
-
-    skill_path: str
-    results: list[ValidationResult] = field(default_factory=list)
-
-    def add(
-        self,
-        level: Level,
-        message: str,
-        file: str | None = None,
-        line: int | None = None,
-    ) -> None:
-        """Add a validation result."""
-        self.results.append(ValidationResult(level, message, file, line))
-
-    def passed(self, message: str, file: str | None = None) -> None:
-        """Add a passed check."""
-        self.add("PASSED", message, file)
-
-    def info(self, message: str, file: str | None = None) -> None:
-        """Add an info message."""
-        self.add("INFO", message, file)
-
-    def minor(self, message: str, file: str | None = None, line: int | None = None) -> None:
-        """Add a minor issue."""
-        self.add("MINOR", message, file, line)
-
-    def major(self, message: str, file: str | None = None, line: int | None = None) -> None:
-        """Add a major issue."""
-        self.add("MAJOR", message, file, line)
-
-    def critical(self, message: str, file: str | None = None, line: int | None = None) -> None:
-        """Add a critical issue."""
-        self.add("CRITICAL", message, file, line)
-
-    @property
-    def has_critical(self) -> bool:
-        return any(r.level == "CRITICAL" for r in self.results)
-
-    @property
-    def has_major(self) -> bool:
-        return any(r.level == "MAJOR" for r in self.results)
-
-    @property
-    def has_minor(self) -> bool:
-        return any(r.level == "MINOR" for r in self.results)
-
-    @property
-    def exit_code(self) -> int:
-        if self.has_critical:
-            return 1
-        if self.has_major:
-            return 2
-        if self.has_minor:
-            return 3
-        return 0
-
-
-def validate_skill_md_exists(skill_path: Path, report: ValidationReport) -> bool:
+
+def validate_skill_md_exists(skill_path: Path, report: SkillValidationReport) -> bool:
     """Validate SKILL.md exists (required)."""
     skill_md = skill_path / "SKILL.md"
 
@@ -137,34 +77,7 @@ def validate_skill_md_exists(skill_path: Path, report: ValidationReport) -> bool
     return True
 
 
-def parse_frontmatter(content: str) -> tuple[dict[str, Any] | None, str, int]:
-    """Parse YAML frontmatter from skill content.
-
-    Returns:
-        Tuple of (frontmatter_dict, body_content, frontmatter_end_line)
-        Returns (None, content, 0) if no frontmatter found
-    """
-    if not content.startswith("---"):
-        return None, content, 0
-
-    # Find closing ---
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return None, content, 0
-
-    try:
-        frontmatter = yaml.safe_load(parts[1])
-        if frontmatter is None:
-            frontmatter = {}
-        body = parts[2]
-        # Count lines to find frontmatter end
-        fm_end_line = parts[0].count("\n") + parts[1].count("\n") + 2
-        return frontmatter, body, fm_end_line
-    except yaml.YAMLError:
-        return None, content, 0
-
-
-def validate_frontmatter(skill_path: Path, content: str, report: ValidationReport) -> dict[str, Any] | None:
+def validate_frontmatter(skill_path: Path, content: str, report: SkillValidationReport) -> dict[str, Any] | None:
     """Validate YAML frontmatter structure and content."""
     # Check frontmatter exists
     if not content.startswith("---"):
@@ -198,7 +111,7 @@ def validate_frontmatter(skill_path: Path, content: str, report: ValidationRepor
     return frontmatter
 
 
-def validate_name_field(frontmatter: dict[str, Any], skill_dir_name: str, report: ValidationReport) -> None:
+def validate_name_field(frontmatter: dict[str, Any], skill_dir_name: str, report: SkillValidationReport) -> None:
     """Validate the 'name' frontmatter field."""
     if "name" not in frontmatter:
         report.info(
@@ -240,7 +153,7 @@ def validate_name_field(frontmatter: dict[str, Any], skill_dir_name: str, report
         )
 
 
-def validate_description_field(frontmatter: dict[str, Any], body: str, report: ValidationReport) -> None:
+def validate_description_field(frontmatter: dict[str, Any], body: str, report: SkillValidationReport) -> None:
     """Validate the 'description' frontmatter field."""
     if "description" not in frontmatter:
         # Check if body has content that could serve as description
@@ -279,7 +192,7 @@ def validate_description_field(frontmatter: dict[str, Any], body: str, report: V
     report.passed("'description' field present", "SKILL.md")
 
 
-def validate_context_field(frontmatter: dict[str, Any], report: ValidationReport) -> None:
+def validate_context_field(frontmatter: dict[str, Any], report: SkillValidationReport) -> None:
     """Validate the 'context' frontmatter field."""
     if "context" not in frontmatter:
         return
@@ -303,7 +216,7 @@ def validate_context_field(frontmatter: dict[str, Any], report: ValidationReport
     report.passed(f"'context' field valid: {context}", "SKILL.md")
 
 
-def validate_agent_field(frontmatter: dict[str, Any], report: ValidationReport) -> None:
+def validate_agent_field(frontmatter: dict[str, Any], report: SkillValidationReport) -> None:
     """Validate the 'agent' frontmatter field."""
     if "agent" not in frontmatter:
         # Agent is only relevant if context: fork is set
@@ -344,7 +257,7 @@ def validate_agent_field(frontmatter: dict[str, Any], report: ValidationReport)
 def validate_boolean_field(
     frontmatter: dict[str, Any],
     field_name: str,
-    report: ValidationReport,
+    report: SkillValidationReport,
 ) -> None:
     """Validate a boolean frontmatter field."""
     if field_name not in frontmatter:
@@ -362,7 +275,7 @@ def validate_boolean_field(
     report.passed(f"'{field_name}' field valid: {value}", "SKILL.md")
 
 
-def validate_allowed_tools_field(frontmatter: dict[str, Any], report: ValidationReport) -> None:
+def validate_allowed_tools_field(frontmatter: dict[str, Any], report: SkillValidationReport) -> None:
     """Validate the 'allowed-tools' frontmatter field."""
     if "allowed-tools" not in frontmatter:
         return
@@ -388,7 +301,7 @@ def validate_allowed_tools_field(frontmatter: dict[str, Any], report: Validation
     report.passed(f"'allowed-tools' field valid: {len(tool_list)} tool(s)", "SKILL.md")
 
 
-def validate_model_field(frontmatter: dict[str, Any], report: ValidationReport) -> None:
+def validate_model_field(frontmatter: dict[str, Any], report: SkillValidationReport) -> None:
     """Validate the 'model' frontmatter field."""
     if "model" not in frontmatter:
         return
@@ -405,7 +318,7 @@ def validate_model_field(frontmatter: dict[str, Any], report: ValidationReport)
     report.passed(f"'model' field present: {model}", "SKILL.md")
 
 
-def validate_argument_hint_field(frontmatter: dict[str, Any], report: ValidationReport) -> None:
+def validate_argument_hint_field(frontmatter: dict[str, Any], report: SkillValidationReport) -> None:
     """Validate the 'argument-hint' frontmatter field."""
     if "argument-hint" not in frontmatter:
         return
@@ -422,7 +335,7 @@ def validate_argument_hint_field(frontmatter: dict[str, Any], report: Validation
     report.passed(f"'argument-hint' field present: {hint}", "SKILL.md")
 
 
-def validate_hooks_field(frontmatter: dict[str, Any], report: ValidationReport) -> None:
+def validate_hooks_field(frontmatter: dict[str, Any], report: SkillValidationReport) -> None:
     """Validate the 'hooks' frontmatter field."""
     if "hooks" not in frontmatter:
         return
@@ -439,7 +352,7 @@ def validate_hooks_field(frontmatter: dict[str, Any], report: ValidationReport)
     report.passed("'hooks' field present", "SKILL.md")
 
 
-def validate_skill_content(content: str, report: ValidationReport) -> None:
+def validate_skill_content(content: str, report: SkillValidationReport) -> None:
     """Validate SKILL.md content (body after frontmatter)."""
     _, body, _ = parse_frontmatter(content)
 
@@ -469,7 +382,7 @@ def validate_skill_content(content: str, report: ValidationReport) -> None:
             )
 
 
-def validate_directory_structure(skill_path: Path, report: ValidationReport) -> None:
+def validate_directory_structure(skill_path: Path, report: SkillValidationReport) -> None:
     """Validate skill directory structure."""
     # Common optional directories per docs
     optional_dirs = ["scripts", "examples", "references", "assets", "templates"]
@@ -496,7 +409,7 @@ def validate_directory_structure(skill_path: Path, report: ValidationReport) ->
                     )
 
 
-def validate_supporting_files(skill_path: Path, report: ValidationReport) -> None:
+def validate_supporting_files(skill_path: Path, report: SkillValidationReport) -> None:
     """Validate supporting files referenced in SKILL.md."""
     skill_md = skill_path / "SKILL.md"
     if not skill_md.exists():
@@ -527,16 +440,17 @@ def validate_supporting_files(skill_path: Path, report: ValidationReport) -> Non
             report.passed(f"Referenced file exists: {link_target}", "SKILL.md")
 
 
-def validate_skill(skill_path: Path) -> ValidationReport:
+def validate_skill(skill_path: Path, sink: NDJSONSink | None = None) -> SkillValidationReport:
     """Validate a complete skill directory.
 
     Args:
         skill_path: Path to the skill directory
+        sink: Optional NDJSON sink; each result is streamed as soon as it is added
 
     Returns:
-        ValidationReport with all results
+        SkillValidationReport with all results
     """
-    report = ValidationReport(skill_path=str(skill_path))
+    report = SkillValidationReport(skill_path=str(skill_path), sink=sink)
 
     # Check skill directory exists
     if not skill_path.is_dir():
@@ -579,7 +493,7 @@ def validate_skill(skill_path: Path) -> ValidationReport:
     return report
 
 
-def print_results(report: ValidationReport, verbose: bool = False) -> None:
+def print_results(report: SkillValidationReport, verbose: bool = False) -> None:
     """Print validation results in human-readable format."""
     # ANSI colors
     colors = {
@@ -644,7 +558,7 @@ def print_results(report: ValidationReport, verbose: bool = False) -> None:
     print()
 
 
-def print_json(report: ValidationReport) -> None:
+def print_json(report: SkillValidationReport) -> None:
     """Print validation results as JSON."""
     output = {
         "skill_path": report.skill_path,
@@ -672,6 +586,7 @@ def main() -> int:
         help="Show all results including passed checks",
     )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--ndjson", action="store_true", help="Stream results as NDJSON, then a summary record")
     args = parser.parse_args()
 
     skill_path = Path(args.skill_path)
@@ -680,9 +595,12 @@ def main() -> int:
         print(f"Error: {skill_path} does not exist", file=sys.stderr)
         return 1
 
-    report = validate_skill(skill_path)
+    sink = NDJSONSink(validator="skill") if args.ndjson else None
+    report = validate_skill(skill_path, sink)
 
-    if args.json:
+    if sink is not None:
+        sink.close({"skill_path": report.skill_path})
+    elif args.json:
         print_json(report)
     else:
         print_results(report, args.verbose)
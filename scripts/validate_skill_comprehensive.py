@@ -35,21 +35,30 @@ import argparse
 import json
 import os
 import re
+import stat
 import sys
 import unicodedata
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
-import yaml
+from validation_common import (
+    NDJSONSink,
+    PluginTreeIndex,
+    ResultCache,
+    ValidationReport,
+    ValidationResult,
+    get_tree_index,
+    has_anchor,
+    markdown_anchors,
+    parse_frontmatter,
+    validator_version,
+)
 
 # =============================================================================
 # Constants from Multiple Validation Sources
 # =============================================================================
 
-# Severity levels
-Level = Literal["CRITICAL", "MAJOR", "MINOR", "INFO", "PASSED"]
-
 # Multi-scale scoring (0-3) from agent-validator
 Score = Literal[0, 1, 2, 3]
 
@@ -151,6 +160,7 @@ ABSOLUTE_PATH_PATTERNS = [
 RE_BASEDIR_SCRIPTS = re.compile(r"\{baseDir\}/scripts/([^\s\}]+)")
 RE_BASEDIR_REFERENCES = re.compile(r"\{baseDir\}/references/([^\s\}]+)")
 RE_BASEDIR_ASSETS = re.compile(r"\{baseDir\}/assets/([^\s\}]+)")
+RE_MARKDOWN_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
 
 # --- XML Tag Pattern (Anthropic docs forbid XML tags in name/description) ---
 RE_XML_TAG = re.compile(r"<[a-zA-Z][^>]*>")
@@ -276,18 +286,6 @@ REPL_CENTRIC_LANGUAGES = {"clojure", "elixir", "erlang", "haskell", "fsharp", "f
 # =============================================================================
 
 
-@dataclass
-class ValidationResult:
-    """Single validation result with multi-scale score support."""
-
-    level: Level
-    message: str
-    file: str | None = None
-    line: int | None = None
-    category: str | None = None  # For grouping in reports
-    score: int = 0  # 0-3 multi-scale score (0=missing, 1=inadequate, 2=adequate, 3=excellent)
-
-
 @dataclass
 class PillarScore:
     """Score for a single pillar (0.0, 0.5, or 1.0)."""
@@ -298,70 +296,38 @@ class PillarScore:
 
 
 @dataclass
-class ValidationReport:
-    """Complete validation report for a skill with scoring."""
+class SkillComprehensiveReport(ValidationReport):
+    """Validation report for a skill with scoring, extends base SkillComprehensiveReport.
 
-    skill_path: str
-    results: list[ValidationResult] = field(default_factory=list)
+    Every result carries a category, used to group results in reports.
+    """
+
+    skill_path: str = ""
     pillar_scores: list[PillarScore] = field(default_factory=list)
     category_scores: dict[str, float] = field(default_factory=dict)
     overall_score: float = 0.0
     grade: str = "F"
 
-    def add(
-        self,
-        level: Level,
-        message: str,
-        file: str | None = None,
-        line: int | None = None,
-        category: str | None = None,
-        score: int = 0,
-    ) -> None:
-        """Add a validation result."""
-        self.results.append(ValidationResult(level, message, file, line, category, score))
-
     def passed(self, message: str, file: str | None = None, category: str | None = None) -> None:
-        self.add("PASSED", message, file, category=category, score=3)
+        self.add("PASSED", message, file, category=category)
 
     def info(self, message: str, file: str | None = None, category: str | None = None) -> None:
-        self.add("INFO", message, file, category=category, score=2)
+        self.add("INFO", message, file, category=category)
 
     def minor(
         self, message: str, file: str | None = None, line: int | None = None, category: str | None = None
     ) -> None:
-        self.add("MINOR", message, file, line, category=category, score=1)
+        self.add("MINOR", message, file, line, category=category)
 
     def major(
         self, message: str, file: str | None = None, line: int | None = None, category: str | None = None
     ) -> None:
-        self.add("MAJOR", message, file, line, category=category, score=0)
+        self.add("MAJOR", message, file, line, category=category)
 
     def critical(
         self, message: str, file: str | None = None, line: int | None = None, category: str | None = None
     ) -> None:
-        self.add("CRITICAL", message, file, line, category=category, score=0)
-
-    @property
-    def has_critical(self) -> bool:
-        return any(r.level == "CRITICAL" for r in self.results)
-
-    @property
-    def has_major(self) -> bool:
-        return any(r.level == "MAJOR" for r in self.results)
-
-    @property
-    def has_minor(self) -> bool:
-        return any(r.level == "MINOR" for r in self.results)
-
-    @property
-    def exit_code(self) -> int:
-        if self.has_critical:
-            return 1
-        if self.has_major:
-            return 2
-        if self.has_minor:
-            return 3
-        return 0
+        self.add("CRITICAL", message, file, line, category=category)
 
     def calculate_grade(self) -> None:
         """Calculate letter grade based on overall score."""
@@ -382,31 +348,6 @@ class ValidationReport:
 # =============================================================================
 
 
-def parse_frontmatter(content: str) -> tuple[dict[str, Any] | None, str, int]:
-    """Parse YAML frontmatter from skill content.
-
-    Returns:
-        Tuple of (frontmatter_dict, body_content, frontmatter_end_line)
-        Returns (None, content, 0) if no frontmatter found
-    """
-    if not content.startswith("---"):
-        return None, content, 0
-
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return None, content, 0
-
-    try:
-        frontmatter = yaml.safe_load(parts[1])
-        if frontmatter is None:
-            frontmatter = {}
-        body = parts[2]
-        fm_end_line = parts[0].count("\n") + parts[1].count("\n") + 2
-        return frontmatter, body, fm_end_line
-    except yaml.YAMLError:
-        return None, content, 0
-
-
 def find_skill_md(skill_dir: Path) -> Path | None:
     """Find the SKILL.md file (uppercase preferred, lowercase accepted)."""
     for name in ("SKILL.md", "skill.md"):
@@ -421,7 +362,7 @@ def find_skill_md(skill_dir: Path) -> Path | None:
 # =============================================================================
 
 
-def validate_skill_md_exists(skill_path: Path, report: ValidationReport) -> bool:
+def validate_skill_md_exists(skill_path: Path, report: SkillComprehensiveReport) -> bool:
     """Validate SKILL.md exists (required)."""
     skill_md = find_skill_md(skill_path)
 
@@ -436,7 +377,7 @@ def validate_skill_md_exists(skill_path: Path, report: ValidationReport) -> bool
     return True
 
 
-def validate_frontmatter_structure(content: str, report: ValidationReport) -> dict[str, Any] | None:
+def validate_frontmatter_structure(content: str, report: SkillComprehensiveReport) -> dict[str, Any] | None:
     """Validate YAML frontmatter structure."""
     if not content.startswith("---"):
         report.info("No YAML frontmatter found (optional but recommended)", "SKILL.md", category="Frontmatter")
@@ -478,7 +419,7 @@ def validate_frontmatter_structure(content: str, report: ValidationReport) -> di
 def validate_name_field(
     frontmatter: dict[str, Any],
     skill_dir_name: str,
-    report: ValidationReport,
+    report: SkillComprehensiveReport,
     strict_openspec: bool = False,
 ) -> None:
     """Validate the 'name' frontmatter field with AgentSkills OpenSpec rules."""
@@ -588,7 +529,7 @@ def validate_name_field(
 def validate_description_field(
     frontmatter: dict[str, Any],
     body: str,
-    report: ValidationReport,
+    report: SkillComprehensiveReport,
     strict_mode: bool = False,
 ) -> None:
     """Validate the 'description' field with Nixtla quality standards."""
@@ -688,7 +629,7 @@ def validate_description_field(
 
 def validate_allowed_tools_field(
     frontmatter: dict[str, Any],
-    report: ValidationReport,
+    report: SkillComprehensiveReport,
     strict_mode: bool = False,
     strict_openspec: bool = False,
 ) -> None:
@@ -774,7 +715,7 @@ def validate_allowed_tools_field(
 
 def validate_metadata_field(
     frontmatter: dict[str, Any],
-    report: ValidationReport,
+    report: SkillComprehensiveReport,
 ) -> None:
     """Validate the 'metadata' field (must be string key-value pairs per OpenSpec)."""
     if "metadata" not in frontmatter:
@@ -810,7 +751,7 @@ def validate_metadata_field(
 
 def validate_compatibility_field(
     frontmatter: dict[str, Any],
-    report: ValidationReport,
+    report: SkillComprehensiveReport,
 ) -> None:
     """Validate the 'compatibility' field (OpenSpec: string, max 500 chars)."""
     if "compatibility" not in frontmatter:
@@ -838,7 +779,7 @@ def validate_compatibility_field(
 
 def validate_license_field(
     frontmatter: dict[str, Any],
-    report: ValidationReport,
+    report: SkillComprehensiveReport,
 ) -> None:
     """Validate the 'license' field (OpenSpec: string type)."""
     if "license" not in frontmatter:
@@ -862,7 +803,7 @@ def validate_license_field(
 
 def validate_argument_hint_field(
     frontmatter: dict[str, Any],
-    report: ValidationReport,
+    report: SkillComprehensiveReport,
 ) -> None:
     """Validate the 'argument-hint' field (skills.md: string, shown during autocomplete)."""
     if "argument-hint" not in frontmatter:
@@ -886,7 +827,7 @@ def validate_argument_hint_field(
 
 def validate_model_field(
     frontmatter: dict[str, Any],
-    report: ValidationReport,
+    report: SkillComprehensiveReport,
 ) -> None:
     """Validate the 'model' field (skills.md: sonnet, opus, haiku, or inherit).
 
@@ -925,7 +866,7 @@ def validate_model_field(
 
 def validate_hooks_field(
     frontmatter: dict[str, Any],
-    report: ValidationReport,
+    report: SkillComprehensiveReport,
 ) -> None:
     """Validate the 'hooks' field (skills.md: must be valid hook structure)."""
     if "hooks" not in frontmatter:
@@ -977,7 +918,7 @@ def validate_hooks_field(
     report.passed(f"'hooks' field valid: {len(hooks)} event(s) configured", "SKILL.md", category="Frontmatter")
 
 
-def validate_context_field(frontmatter: dict[str, Any], report: ValidationReport) -> None:
+def validate_context_field(frontmatter: dict[str, Any], report: SkillComprehensiveReport) -> None:
     """Validate the 'context' frontmatter field."""
     if "context" not in frontmatter:
         return
@@ -1003,7 +944,7 @@ def validate_context_field(frontmatter: dict[str, Any], report: ValidationReport
     report.passed(f"'context' field valid: {context}", "SKILL.md", category="Frontmatter")
 
 
-def validate_agent_field(frontmatter: dict[str, Any], report: ValidationReport) -> None:
+def validate_agent_field(frontmatter: dict[str, Any], report: SkillComprehensiveReport) -> None:
     """Validate the 'agent' frontmatter field."""
     if "agent" not in frontmatter:
         if frontmatter.get("context") == "fork":
@@ -1044,7 +985,7 @@ def validate_agent_field(frontmatter: dict[str, Any], report: ValidationReport)
 def validate_boolean_field(
     frontmatter: dict[str, Any],
     field_name: str,
-    report: ValidationReport,
+    report: SkillComprehensiveReport,
 ) -> None:
     """Validate a boolean frontmatter field."""
     if field_name not in frontmatter:
@@ -1065,7 +1006,7 @@ def validate_boolean_field(
 
 def validate_field_whitelist(
     frontmatter: dict[str, Any],
-    report: ValidationReport,
+    report: SkillComprehensiveReport,
     strict_openspec: bool = False,
 ) -> None:
     """Validate frontmatter fields against whitelist."""
@@ -1093,7 +1034,7 @@ def validate_field_whitelist(
                 )
 
 
-def validate_token_budget(content: str, body: str, report: ValidationReport) -> None:
+def validate_token_budget(content: str, body: str, report: SkillComprehensiveReport) -> None:
     """Validate token budget (line count, word count)."""
     total_lines = content.count("\n") + 1
     word_count = len(body.split())
@@ -1130,7 +1071,7 @@ def validate_token_budget(content: str, body: str, report: ValidationReport) ->
         )
 
 
-def validate_required_sections(body: str, report: ValidationReport, strict_mode: bool = False) -> None:
+def validate_required_sections(body: str, report: SkillComprehensiveReport, strict_mode: bool = False) -> None:
     """Validate required sections (Nixtla strict mode)."""
     if not strict_mode:
         return
@@ -1171,13 +1112,13 @@ def validate_required_sections(body: str, report: ValidationReport, strict_mode:
 
 
 def validate_path_formats(
-    body: str, report: ValidationReport, skip_platform_checks: list[str] | None = None
+    body: str, report: SkillComprehensiveReport, skip_platform_checks: list[str] | None = None
 ) -> None:
     """Validate path formats (no absolute paths, forward slashes only).
 
     Args:
         body: The SKILL.md body content
-        report: ValidationReport to add results to
+        report: SkillComprehensiveReport to add results to
         skip_platform_checks: List of platforms to skip checks for (e.g., ['windows'])
     """
     skip_windows = skip_platform_checks is not None and (
@@ -1241,7 +1182,7 @@ def validate_path_formats(
                 )
 
 
-def validate_mcp_tool_references(body: str, report: ValidationReport) -> None:
+def validate_mcp_tool_references(body: str, report: SkillComprehensiveReport) -> None:
     """Validate MCP tool references use qualified format (Anthropic docs requirement).
 
     MCP tools should be referenced with ServerName:tool_name format,
@@ -1276,7 +1217,7 @@ def validate_mcp_tool_references(body: str, report: ValidationReport) -> None:
                 )
 
 
-def validate_time_sensitive_info(body: str, report: ValidationReport) -> None:
+def validate_time_sensitive_info(body: str, report: SkillComprehensiveReport) -> None:
     """Detect time-sensitive information that may become stale (Anthropic docs).
 
     Skills should avoid dates, version numbers, and temporal references
@@ -1312,7 +1253,7 @@ def validate_time_sensitive_info(body: str, report: ValidationReport) -> None:
             )
 
 
-def validate_string_substitutions(body: str, report: ValidationReport) -> None:
+def validate_string_substitutions(body: str, report: SkillComprehensiveReport) -> None:
     """Validate string substitution patterns (skills.md: $ARGUMENTS, $N, ${CLAUDE_SESSION_ID}).
 
     Detects and validates the usage of Claude Code's string substitution variables.
@@ -1356,7 +1297,7 @@ def validate_string_substitutions(body: str, report: ValidationReport) -> None:
         )
 
 
-def validate_dynamic_context(body: str, report: ValidationReport) -> None:
+def validate_dynamic_context(body: str, report: SkillComprehensiveReport) -> None:
     """Validate dynamic context injection (skills.md: `!`command`` syntax).
 
     Detects usage of the dynamic context injection feature.
@@ -1380,7 +1321,7 @@ def validate_dynamic_context(body: str, report: ValidationReport) -> None:
         )
 
 
-def validate_content_patterns(body: str, report: ValidationReport, strict_mode: bool = False) -> None:
+def validate_content_patterns(body: str, report: SkillComprehensiveReport, strict_mode: bool = False) -> None:
     """Validate content quality patterns (best practices: checklists, examples, workflows).
 
     Detects and validates the presence of recommended content patterns.
@@ -1478,7 +1419,7 @@ def validate_content_patterns(body: str, report: ValidationReport, strict_mode:
         )
 
 
-def validate_package_dependencies(body: str, report: ValidationReport) -> None:
+def validate_package_dependencies(body: str, report: SkillComprehensiveReport) -> None:
     """Validate package dependency listings (best practices: document pip install, npm install).
 
     Detects and validates the presence of package installation instructions.
@@ -1515,13 +1456,56 @@ def validate_package_dependencies(body: str, report: ValidationReport) -> None:
             )
 
 
-def validate_resource_references(skill_path: Path, body: str, report: ValidationReport) -> None:
-    """Validate that referenced scripts/resources exist."""
+def validate_reference_anchor(
+    index: PluginTreeIndex,
+    body: str,
+    file_path: str,
+    fragment: str,
+    link_target: str,
+    report: SkillComprehensiveReport,
+) -> None:
+    """Validate that a link fragment matches a heading in SKILL.md or the referenced file.
+
+    Anchors follow GitHub's heading slug rules. Only markdown files inside the
+    skill are checked; a missing file is reported by the existence check.
+    """
+    if file_path:
+        if "../" in file_path or not file_path.endswith(".md"):
+            return
+        indexed = index.get(file_path)
+        if indexed is None:
+            return
+        try:
+            anchors = markdown_anchors(indexed.text())
+        except (OSError, UnicodeDecodeError):
+            return
+    else:
+        anchors = markdown_anchors(body)
+    if not has_anchor(anchors, fragment):
+        report.minor(
+            f"Referenced anchor not found: {link_target}",
+            "SKILL.md",
+            category="Resource References",
+        )
+
+
+def validate_resource_references(
+    skill_path: Path,
+    body: str,
+    report: SkillComprehensiveReport,
+    index: PluginTreeIndex | None = None,
+) -> None:
+    """Validate that referenced scripts/resources exist.
+
+    Existence is looked up in the skill's tree index, so each reference costs
+    a set lookup instead of a stat call. Link fragments (#section) must match
+    a heading in SKILL.md or in the referenced markdown file.
+    """
+    index = get_tree_index(skill_path, index)
     # Check {baseDir}/scripts/... references
     for match in RE_BASEDIR_SCRIPTS.finditer(body):
         rel_path = match.group(1)
-        script_path = skill_path / "scripts" / rel_path
-        if not script_path.exists():
+        if not index.exists(os.path.join("scripts", rel_path)):
             report.major(
                 f"Referenced script not found: '{{baseDir}}/scripts/{rel_path}'",
                 "SKILL.md",
@@ -1533,8 +1517,7 @@ def validate_resource_references(skill_path: Path, body: str, report: Validation
     # Check {baseDir}/references/... references
     for match in RE_BASEDIR_REFERENCES.finditer(body):
         rel_path = match.group(1)
-        ref_path = skill_path / "references" / rel_path
-        if not ref_path.exists():
+        if not index.exists(os.path.join("references", rel_path)):
             report.major(
                 f"Referenced file not found: '{{baseDir}}/references/{rel_path}'",
                 "SKILL.md",
@@ -1544,15 +1527,19 @@ def validate_resource_references(skill_path: Path, body: str, report: Validation
             report.passed(f"Reference exists: references/{rel_path}", category="Resource References")
 
     # Check markdown links to local files
-    local_refs = re.findall(r"\[([^\]]+)\]\(([^)]+)\)", body)
+    local_refs = RE_MARKDOWN_LINK.findall(body)
     checked_files: set[str] = set()  # Track files we've already validated
+    checked_anchors: set[str] = set()
     for _, link_target in local_refs:
-        if link_target.startswith(("http://", "https://", "mailto:", "#", "{")):
+        if link_target.startswith(("http://", "https://", "mailto:", "{")):
             continue
-        # Handle anchor links (e.g., "references/file.md#section-name")
-        file_path = link_target.split("#")[0] if "#" in link_target else link_target
+        # Handle anchor links (e.g., "#usage" or "references/file.md#section-name")
+        file_path, _, fragment = link_target.partition("#")
+        if fragment and link_target not in checked_anchors:
+            checked_anchors.add(link_target)
+            validate_reference_anchor(index, body, file_path, fragment, link_target, report)
         # Skip if we've already checked this file
-        if file_path in checked_files:
+        if not file_path or file_path in checked_files:
             continue
         checked_files.add(file_path)
 
@@ -1564,8 +1551,7 @@ def validate_resource_references(skill_path: Path, body: str, report: Validation
                 category="Resource References",
             )
             # Still check if file exists for completeness
-            ref_path = skill_path / file_path
-            if ref_path.exists():
+            if index.exists(file_path):
                 report.info(
                     f"External file exists but skill not portable: {file_path}",
                     "SKILL.md",
@@ -1573,8 +1559,7 @@ def validate_resource_references(skill_path: Path, body: str, report: Validation
                 )
             continue
 
-        ref_path = skill_path / file_path
-        if not ref_path.exists():
+        if not index.exists(file_path):
             report.major(
                 f"Referenced file not found: {file_path}",
                 "SKILL.md",
@@ -1584,7 +1569,26 @@ def validate_resource_references(skill_path: Path, body: str, report: Validation
             report.passed(f"Referenced file exists: {file_path}", "SKILL.md", category="Resource References")
 
 
-def validate_directory_structure(skill_path: Path, report: ValidationReport) -> None:
+def external_reference_targets(body: str) -> list[str]:
+    """Return the resource references of a SKILL.md body that leave the skill directory.
+
+    Covers the references validate_resource_references checks for existence,
+    as normalized paths relative to the skill directory.
+    """
+    targets = [os.path.join("scripts", m.group(1)) for m in RE_BASEDIR_SCRIPTS.finditer(body)]
+    targets += [os.path.join("references", m.group(1)) for m in RE_BASEDIR_REFERENCES.finditer(body)]
+    for _, link_target in RE_MARKDOWN_LINK.findall(body):
+        if not link_target.startswith(("http://", "https://", "mailto:", "#", "{")):
+            targets.append(link_target.partition("#")[0])
+    external: set[str] = set()
+    for target in targets:
+        rel_path = os.path.normpath(target) if target else "."
+        if rel_path == ".." or rel_path.startswith(".." + os.sep) or os.path.isabs(rel_path):
+            external.add(rel_path)
+    return sorted(external)
+
+
+def validate_directory_structure(skill_path: Path, report: SkillComprehensiveReport) -> None:
     """Validate skill directory structure."""
     optional_dirs = ["scripts", "examples", "references", "assets", "templates"]
 
@@ -1597,7 +1601,7 @@ def validate_directory_structure(skill_path: Path, report: ValidationReport) ->
     validate_scripts_directory(skill_path, report)
 
 
-def validate_scripts_directory(skill_path: Path, report: ValidationReport) -> None:
+def validate_scripts_directory(skill_path: Path, report: SkillComprehensiveReport) -> None:
     """Validate scripts directory (Anthropic docs requirements).
 
     Checks:
@@ -1690,7 +1694,7 @@ def validate_scripts_directory(skill_path: Path, report: ValidationReport) -> No
                 )
 
 
-def validate_reference_files(skill_path: Path, report: ValidationReport) -> None:
+def validate_reference_files(skill_path: Path, report: SkillComprehensiveReport) -> None:
     """Validate reference files structure (Anthropic docs requirements).
 
     Checks:
@@ -1759,7 +1763,7 @@ def validate_reference_files(skill_path: Path, report: ValidationReport) -> None
 def validate_pillars(
     skill_path: Path,
     body: str,
-    report: ValidationReport,
+    report: SkillComprehensiveReport,
     include_ninth: bool = False,
 ) -> None:
     """Validate 8+1 Pillars coverage for lang-* and convert-* skills."""
@@ -1858,13 +1862,14 @@ def validate_pillars(
         )
 
 
-def calculate_overall_score(report: ValidationReport) -> None:
+def calculate_overall_score(report: SkillComprehensiveReport) -> None:
     """Calculate overall score and grade."""
     # Count results by level
-    critical_count = sum(1 for r in report.results if r.level == "CRITICAL")
-    major_count = sum(1 for r in report.results if r.level == "MAJOR")
-    minor_count = sum(1 for r in report.results if r.level == "MINOR")
-    passed_count = sum(1 for r in report.results if r.level == "PASSED")
+    counts = report.count_by_level()
+    critical_count = counts["CRITICAL"]
+    major_count = counts["MAJOR"]
+    minor_count = counts["MINOR"]
+    passed_count = counts["PASSED"]
     total_checks = critical_count + major_count + minor_count + passed_count
 
     if total_checks == 0:
@@ -1892,7 +1897,9 @@ def validate_skill(
     strict_openspec: bool = False,
     validate_pillars_flag: bool = False,
     skip_platform_checks: list[str] | None = None,
-) -> ValidationReport:
+    cache: ResultCache | None = None,
+    sink: NDJSONSink | None = None,
+) -> SkillComprehensiveReport:
     """Validate a complete skill directory.
 
     Args:
@@ -1901,11 +1908,50 @@ def validate_skill(
         strict_openspec: Enable AgentSkills OpenSpec strict validation
         validate_pillars_flag: Enable 8+1 Pillars validation
         skip_platform_checks: List of platforms to skip checks for (e.g., ['windows'])
+        cache: Optional result cache; a skill whose files are all unchanged
+            replays its cached report
+        sink: Optional NDJSON sink; each result is streamed as soon as it is added
 
     Returns:
-        ValidationReport with all results
+        SkillComprehensiveReport with all results
     """
-    report = ValidationReport(skill_path=str(skill_path))
+    options = (strict_mode, strict_openspec, validate_pillars_flag, skip_platform_checks)
+    if cache is not None and skill_path.is_dir():
+        # The report depends on every file and directory in the skill directory,
+        # including permission bits (scripts are checked for the executable bit)
+        index = PluginTreeIndex(skill_path)
+        parts: list[str | bytes] = [str(skill_path), repr(options)]
+        parts += sorted(rel_dir for rel_dir, _dirnames, _files in index.walk())
+        for indexed in sorted(index.iter_files(), key=lambda f: f.rel_path):
+            parts += [f"{indexed.rel_path}:{stat.S_IMODE(indexed.stat.st_mode):o}", indexed.raw]
+        # References leaving the skill directory are checked for existence
+        skill_md = find_skill_md(skill_path)
+        indexed_skill_md = index.get(skill_md.name) if skill_md is not None else None
+        if indexed_skill_md is not None:
+            _, body, _ = parse_frontmatter(indexed_skill_md.text(errors="replace"))
+            for target in external_reference_targets(body):
+                parts.append(f"{target}:{os.path.exists(skill_path / target)}")
+        cache_key = cache.key("skill", validator_version(__file__), *parts)
+        entry = cache.get(cache_key)
+        if entry is not None:
+            report = SkillComprehensiveReport(skill_path=str(skill_path), sink=sink)
+            cache.replay(entry, report.append, ValidationResult)
+            report.pillar_scores = [PillarScore(**p) for p in entry["data"]["pillar_scores"]]
+            report.category_scores = entry["data"]["category_scores"]
+            report.overall_score = entry["data"]["overall_score"]
+            report.grade = entry["data"]["grade"]
+            return report
+        report = validate_skill(skill_path, *options, sink=sink)
+        data = {
+            "pillar_scores": [asdict(p) for p in report.pillar_scores],
+            "category_scores": report.category_scores,
+            "overall_score": report.overall_score,
+            "grade": report.grade,
+        }
+        cache.put(cache_key, "skill", report.results, data)
+        return report
+
+    report = SkillComprehensiveReport(skill_path=str(skill_path), sink=sink)
 
     # Check skill directory exists
     if not skill_path.exists():
@@ -2002,7 +2048,7 @@ def validate_skill(
 # =============================================================================
 
 
-def print_results(report: ValidationReport, verbose: bool = False) -> None:
+def print_results(report: SkillComprehensiveReport, verbose: bool = False) -> None:
     """Print validation results in human-readable format."""
     colors = {
         "CRITICAL": "\033[91m",  # Red
@@ -2082,7 +2128,7 @@ def print_results(report: ValidationReport, verbose: bool = False) -> None:
     print()
 
 
-def print_json(report: ValidationReport) -> None:
+def print_json(report: SkillComprehensiveReport) -> None:
     """Print validation results as JSON."""
     output = {
         "skill_path": report.skill_path,
@@ -2147,6 +2193,12 @@ def main() -> int:
         action="store_true",
         help="Enable 8+1 Pillars validation (for lang-* and convert-* skills)",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse the cached report if no file in the skill changed since the last cached run",
+    )
+    parser.add_argument("--ndjson", action="store_true", help="Stream results as NDJSON, then a summary record")
     args = parser.parse_args()
 
     skill_path = Path(args.skill_path)
@@ -2155,14 +2207,25 @@ def main() -> int:
         print(f"Error: {skill_path} does not exist", file=sys.stderr)
         return 1
 
+    cache = ResultCache(skill_path) if args.cache else None
+    sink = NDJSONSink(validator="skill") if args.ndjson else None
     report = validate_skill(
         skill_path,
         strict_mode=args.strict,
         strict_openspec=args.openspec,
         validate_pillars_flag=args.pillars,
+        cache=cache,
+        sink=sink,
     )
+    if cache is not None:
+        cache.save()
 
-    if args.json:
+    if sink is not None:
+        # The weighted skill score, as in --json, rather than the severity-count score
+        sink.close(
+            {"skill_path": report.skill_path, "score": round(report.overall_score, 2), "grade": report.grade}
+        )
+    elif args.json:
         print_json(report)
     else:
         print_results(report, args.verbose)
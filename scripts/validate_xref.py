@@ -10,10 +10,20 @@ Validates cross-references between plugin components:
 5. Skills referenced in code should exist in skills/ directory
 6. Hook scripts referenced in hooks.json must exist
 
+With --graph, the references found are kept in a persisted dependency graph
+(agents, skills, commands, hook scripts and docs, with reverse edges), so a
+re-run only rescans changed files and --impact can answer "what depends on
+this skill" without scanning the plugin. With --changed-since, the rules only
+check the changed files and the files referencing them; together with --graph
+that set is read from the graph's reverse edges.
+
 Usage:
     uv run python scripts/validate_xref.py /path/to/plugin
     uv run python scripts/validate_xref.py /path/to/plugin --verbose
     uv run python scripts/validate_xref.py /path/to/plugin --json
+    uv run python scripts/validate_xref.py /path/to/plugin --graph
+    uv run python scripts/validate_xref.py /path/to/plugin --impact skill:my-skill
+    uv run python scripts/validate_xref.py /path/to/plugin --graph --changed-since HEAD~1
 
 Exit codes:
     0 - All checks passed (or only INFO/PASSED)
@@ -26,17 +36,25 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import posixpath
 import re
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
 from validation_common import (
     COLORS,
     SKIP_DIRS,
+    ChangeScope,
+    NDJSONSink,
+    PluginTreeIndex,
     ValidationReport,
+    cache_file_path,
+    get_change_scope,
+    get_tree_index,
+    parse_frontmatter,
     print_report_summary,
     print_results_by_level,
 )
@@ -64,6 +82,15 @@ SKILL_REF_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# File extensions scanned for cross-references (subagent_type only in markdown)
+XREF_SCAN_EXTENSIONS = {".py", ".sh", ".md", ".json", ".yaml", ".yml"}
+
+# Directories whose markdown files are scanned for agent spawn phrases
+SPAWN_SCAN_DIRS = {"commands"}
+
+# Pattern to find local link targets in markdown: [text](target)
+MARKDOWN_LINK_PATTERN = re.compile(r"\]\(\s*<?([^)\s>]+)")
+
 # Pattern to extract version from files
 VERSION_PATTERN = re.compile(
     r'(?:version|VERSION)\s*[=:]\s*["\']?(\d+\.\d+\.\d+)["\']?',
@@ -75,6 +102,9 @@ HOOK_SCRIPT_PATTERN = re.compile(
     r'\$\{CLAUDE_PLUGIN_ROOT\}/([^"\'}\s]+)',
 )
 
+# Files inside the plugin that validate_version_sync reads versions from
+VERSION_SOURCES = (".claude-plugin/plugin.json", "README.md", "pyproject.toml")
+
 
 # =============================================================================
 # Data Classes
@@ -165,7 +195,12 @@ def should_skip_dir(path: Path) -> bool:
     Returns:
         True if directory should be skipped
     """
-    return path.name in SKIP_DIRS or path.name.startswith(".")
+    return _skip_dir_name(path.name)
+
+
+def _skip_dir_name(name: str) -> bool:
+    """Directory-name form of should_skip_dir, used to prune the tree walk."""
+    return name in SKIP_DIRS or name.startswith(".")
 
 
 def parse_yaml_frontmatter(content: str) -> dict[str, Any] | None:
@@ -177,18 +212,343 @@ def parse_yaml_frontmatter(content: str) -> dict[str, Any] | None:
     Returns:
         Parsed frontmatter dict or None if not found/invalid
     """
-    if not content.startswith("---"):
-        return None
+    frontmatter, _, _ = parse_frontmatter(content)
+    return frontmatter if isinstance(frontmatter, dict) else None
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return None
 
-    try:
-        frontmatter = yaml.safe_load(parts[1])
-        return frontmatter if isinstance(frontmatter, dict) else None
-    except yaml.YAMLError:
+# =============================================================================
+# Combined File Scan
+# =============================================================================
+
+
+class XrefFileScan:
+    """Cross-reference matches found in one file.
+
+    Attributes:
+        rel_path: Path relative to the plugin root
+        subagent_refs: subagent_type values, in order (markdown files only)
+        spawn_refs: Agent names from spawn/invoke phrases (command files only)
+        skill_refs: Unique skill names referenced, in first-seen order
+        script_refs: Unique ${CLAUDE_PLUGIN_ROOT} script paths referenced
+        doc_links: Unique local link targets, relative to the plugin root (markdown files only)
+        frontmatter_skills: Skill names listed under skills: in the frontmatter (markdown files only)
+    """
+
+    __slots__ = (
+        "rel_path",
+        "subagent_refs",
+        "spawn_refs",
+        "skill_refs",
+        "script_refs",
+        "doc_links",
+        "frontmatter_skills",
+    )
+
+    def __init__(
+        self,
+        rel_path: str,
+        subagent_refs: list[str],
+        spawn_refs: list[str],
+        skill_refs: list[str],
+        script_refs: list[str],
+        doc_links: list[str],
+        frontmatter_skills: list[str],
+    ) -> None:
+        self.rel_path = rel_path
+        self.subagent_refs = subagent_refs
+        self.spawn_refs = spawn_refs
+        self.skill_refs = skill_refs
+        self.script_refs = script_refs
+        self.doc_links = doc_links
+        self.frontmatter_skills = frontmatter_skills
+
+    @classmethod
+    def scan(cls, rel_path: str, content: str) -> XrefFileScan:
+        """Collect all cross-references from a file's content in one pass over the file."""
+        is_markdown = os.path.splitext(rel_path)[1] == ".md"
+        is_command = is_markdown and os.path.dirname(rel_path) in SPAWN_SCAN_DIRS
+        doc_links: list[str] = []
+        frontmatter_skills: list[str] = []
+        if is_markdown:
+            source_dir = posixpath.dirname(rel_path.replace("\\", "/"))
+            for target in MARKDOWN_LINK_PATTERN.findall(content):
+                resolved = _resolve_doc_link(source_dir, target)
+                if resolved is not None:
+                    doc_links.append(resolved)
+            # Agents preload skills listed in their frontmatter
+            if content.startswith("---") and "skills" in content:
+                frontmatter = parse_yaml_frontmatter(content)
+                skills = frontmatter.get("skills") if frontmatter is not None else None
+                if isinstance(skills, list):
+                    frontmatter_skills = [name for name in skills if isinstance(name, str)]
+        return cls(
+            rel_path,
+            SUBAGENT_TYPE_PATTERN.findall(content) if is_markdown else [],
+            AGENT_SPAWN_PATTERN.findall(content) if is_command else [],
+            list(dict.fromkeys(SKILL_REF_PATTERN.findall(content))),
+            list(dict.fromkeys(HOOK_SCRIPT_PATTERN.findall(content))),
+            list(dict.fromkeys(doc_links)),
+            list(dict.fromkeys(frontmatter_skills)),
+        )
+
+    def to_dict(self) -> dict[str, list[str]]:
+        """Convert to a compact dictionary (empty lists omitted) for the graph index."""
+        return {name: getattr(self, name) for name in self.__slots__[1:] if getattr(self, name)}
+
+    @classmethod
+    def from_dict(cls, rel_path: str, data: dict[str, list[str]]) -> XrefFileScan:
+        """Rebuild a scan stored by to_dict()."""
+        return cls(rel_path, *(data.get(name, []) for name in cls.__slots__[1:]))
+
+
+def _resolve_doc_link(source_dir: str, target: str) -> str | None:
+    """Resolve a markdown link target to a path relative to the plugin root.
+
+    Returns:
+        The normalized relative path, or None for external links, anchors,
+        absolute paths and paths leaving the plugin
+    """
+    target = target.split("#", 1)[0]
+    if not target or "://" in target or target.startswith(("mailto:", "/", "$")):
+        return None
+    resolved = posixpath.normpath(posixpath.join(source_dir, target))
+    if resolved == ".." or resolved.startswith("../"):
         return None
+    return resolved
+
+
+def scan_plugin_files(plugin_root: Path, index: PluginTreeIndex | None = None) -> dict[str, XrefFileScan]:
+    """Scan every candidate file once for all cross-reference patterns.
+
+    The walk prunes hidden and cache directories instead of descending into
+    them and filtering afterwards, and each file is read once to collect
+    every kind of reference together.
+
+    Args:
+        plugin_root: Root path of the plugin
+        index: Shared tree index for this run (built on demand if omitted)
+
+    Returns:
+        Dict mapping relative paths to their scan results, in walk order.
+        Files that cannot be read are left out.
+    """
+    scans: dict[str, XrefFileScan] = {}
+    for indexed in get_tree_index(plugin_root, index).iter_files(_skip_dir_name, XREF_SCAN_EXTENSIONS):
+        try:
+            content = indexed.text("ignore")
+        except OSError:
+            continue
+        scans[indexed.rel_path] = XrefFileScan.scan(indexed.rel_path, content)
+    return scans
+
+
+def _get_file_scan(plugin_root: Path, file_path: Path, scans: dict[str, XrefFileScan] | None) -> XrefFileScan:
+    """Return the scan of file_path, scanning it now if the tree scan did not.
+
+    Raises:
+        OSError: If the file has to be read and cannot be
+    """
+    rel_path = str(file_path.relative_to(plugin_root))
+    scan = scans.get(rel_path) if scans is not None else None
+    if scan is None:
+        scan = XrefFileScan.scan(rel_path, file_path.read_text(errors="ignore"))
+    return scan
+
+
+# =============================================================================
+# Cross-Reference Graph
+# =============================================================================
+# A persisted dependency graph built from the file scans. Nodes are
+# "file:<rel_path>" for files and "agent:<name>", "skill:<name>" and
+# "command:<name>" for components. An edge A -> B means A depends on B: a file
+# depends on the agents, skills, scripts and docs it references (including the
+# skills an agent lists in its frontmatter), and a
+# component depends on the files that define it. Reverse edges answer "what
+# breaks if B changes" with one lookup instead of a rescan.
+
+XREF_GRAPH_FORMAT = 2
+
+# Directories whose markdown files each define one component: dir -> node kind
+COMPONENT_DIRS = {"agents": "agent", "commands": "command"}
+
+
+def component_node(rel_path: str) -> str | None:
+    """Return the component node a file belongs to, if any.
+
+    Args:
+        rel_path: File path relative to the plugin root
+
+    Returns:
+        "agent:<name>", "command:<name>", "skill:<name>" or None
+    """
+    parts = rel_path.replace("\\", "/").split("/")
+    if len(parts) == 2 and parts[1].endswith(".md") and parts[0] in COMPONENT_DIRS:
+        return f"{COMPONENT_DIRS[parts[0]]}:{parts[1][: -len('.md')]}"
+    if len(parts) > 2 and parts[0] == "skills":
+        return f"skill:{parts[1]}"
+    return None
+
+
+class XrefGraph:
+    """Dependency graph of a plugin's cross-references, persisted between runs.
+
+    Each file's scan is stored with its size and mtime, so update() only
+    reads the files changed since the last save and reuses the stored
+    edges of the rest.
+
+    Usage:
+        graph = XrefGraph(plugin_root)
+        scans = graph.update(index)
+        graph.dependents("skill:my-skill")
+        graph.save()
+
+    Attributes:
+        root: Plugin root the graph describes
+        path: JSON file the graph is stored in
+        forward: Node -> nodes it depends on
+        reverse: Node -> nodes that depend on it
+        rescanned: Files read by the last update() (the rest were reused)
+    """
+
+    def __init__(self, plugin_root: Path, cache_dir: Path | None = None) -> None:
+        self.root = plugin_root
+        self.path = cache_file_path(plugin_root, "xref-graph", cache_dir)
+        self.forward: dict[str, list[str]] = {}
+        self.reverse: dict[str, list[str]] = {}
+        self.rescanned: list[str] = []
+        # rel_path -> {"stat": [size, mtime_ns], "scan": XrefFileScan.to_dict()}
+        self._files: dict[str, dict[str, Any]] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("format") == XREF_GRAPH_FORMAT and isinstance(data.get("files"), dict):
+                self._files = data["files"]
+                self.forward = data["forward"]
+                self.reverse = data["reverse"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+
+    def update(self, index: PluginTreeIndex | None = None) -> dict[str, XrefFileScan]:
+        """Bring the graph up to date with the plugin tree.
+
+        Args:
+            index: Shared tree index for this run (built on demand if omitted)
+
+        Returns:
+            Scans of all files, as scan_plugin_files() would return them
+        """
+        scans: dict[str, XrefFileScan] = {}
+        files: dict[str, dict[str, Any]] = {}
+        self.rescanned = []
+        for indexed in get_tree_index(self.root, index).iter_files(_skip_dir_name, XREF_SCAN_EXTENSIONS):
+            rel_path = indexed.rel_path
+            try:
+                stat = indexed.stat
+            except OSError:
+                continue
+            stamp = [stat.st_size, stat.st_mtime_ns]
+            entry = self._files.get(rel_path)
+            if entry is not None and entry["stat"] == stamp:
+                scan = XrefFileScan.from_dict(rel_path, entry["scan"])
+            else:
+                try:
+                    content = indexed.text("ignore")
+                except OSError:
+                    continue
+                scan = XrefFileScan.scan(rel_path, content)
+                entry = {"stat": stamp, "scan": scan.to_dict()}
+                self.rescanned.append(rel_path)
+            files[rel_path] = entry
+            scans[rel_path] = scan
+        self._files = files
+        self._link(scans)
+        return scans
+
+    def _link(self, scans: dict[str, XrefFileScan]) -> None:
+        """Rebuild the forward and reverse edges from the file scans."""
+        forward: dict[str, list[str]] = {}
+        for rel_path, scan in scans.items():
+            node = "file:" + rel_path.replace("\\", "/")
+            targets = [f"agent:{name}" for name in scan.subagent_refs]
+            targets.extend(f"agent:{name.lower().strip()}" for name in scan.spawn_refs)
+            targets.extend(f"skill:{name.lower()}" for name in scan.skill_refs)
+            targets.extend(f"skill:{name.lower().strip()}" for name in scan.frontmatter_skills)
+            targets.extend(f"file:{posixpath.normpath(path)}" for path in scan.script_refs)
+            targets.extend(f"file:{path}" for path in scan.doc_links)
+            forward[node] = list(dict.fromkeys(target for target in targets if target != node))
+            owner = component_node(rel_path)
+            if owner is not None:
+                forward.setdefault(owner, []).append(node)
+
+        reverse: dict[str, list[str]] = {}
+        for node, targets in forward.items():
+            for target in targets:
+                reverse.setdefault(target, []).append(node)
+        self.forward = forward
+        self.reverse = reverse
+
+    def dependents(self, node: str) -> list[str]:
+        """Nodes that reference node directly (what breaks if it is renamed or removed)."""
+        return self.reverse.get(node, [])
+
+    def affected_files(self, rel_paths: list[str]) -> list[str]:
+        """Files whose cross-reference findings can change when the given files change.
+
+        That is the files themselves, the files referencing them, and the
+        files referencing the components they belong to (a component can
+        appear or disappear with its files).
+
+        Args:
+            rel_paths: Changed files, relative to the plugin root
+
+        Returns:
+            Sorted relative paths of the changed files and their dependents
+        """
+        nodes: list[str] = []
+        for rel_path in rel_paths:
+            nodes.append("file:" + rel_path.replace("\\", "/"))
+            owner = component_node(rel_path)
+            if owner is not None:
+                nodes.append(owner)
+        files = self._dependent_files(nodes)
+        files.update(node for node in nodes if node.startswith("file:"))
+        return sorted(node[len("file:") :] for node in files)
+
+    def impact(self, node: str) -> list[str]:
+        """Files affected if node is renamed or removed.
+
+        Args:
+            node: Any graph node (e.g. "skill:my-skill" or "file:docs/guide.md")
+
+        Returns:
+            Sorted relative paths of the files referencing node, directly or
+            through the component node belongs to
+        """
+        files = self._dependent_files([node])
+        files.discard(node)
+        return sorted(dependent[len("file:") :] for dependent in files)
+
+    def _dependent_files(self, nodes: list[str]) -> set[str]:
+        """File nodes referencing any of nodes, looking through component nodes."""
+        files: set[str] = set()
+        for node in nodes:
+            for dependent in self.reverse.get(node, ()):
+                if dependent.startswith("file:"):
+                    files.add(dependent)
+                else:
+                    files.update(d for d in self.reverse.get(dependent, ()) if d.startswith("file:"))
+        return files
+
+    def save(self) -> None:
+        """Write the graph as compact JSON."""
+        data = {"format": XREF_GRAPH_FORMAT, "files": self._files, "forward": self.forward, "reverse": self.reverse}
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            # The graph is a cache; never fail a validation run over it
+            tmp.unlink(missing_ok=True)
 
 
 # =============================================================================
@@ -200,6 +560,8 @@ def validate_agent_task_refs(
     plugin_root: Path,
     report: CrossReferenceValidationReport,
     available_agents: set[str],
+    scans: dict[str, XrefFileScan] | None = None,
+    scope: ChangeScope | None = None,
 ) -> None:
     """Validate that Task() calls reference existing agents.
 
@@ -210,6 +572,8 @@ def validate_agent_task_refs(
         plugin_root: Root path of the plugin
         report: Validation report to add results to
         available_agents: Set of available agent names
+        scans: Results of scan_plugin_files() (agent files are read if omitted)
+        scope: Optional change scope; only files in it are checked
     """
     agents_dir = plugin_root / "agents"
     if not agents_dir.exists():
@@ -217,15 +581,17 @@ def validate_agent_task_refs(
         return
 
     for agent_file in agents_dir.glob("*.md"):
+        if scope is not None and not scope.includes(f"agents/{agent_file.name}"):
+            continue
         try:
-            content = agent_file.read_text(errors="ignore")
+            scan = _get_file_scan(plugin_root, agent_file, scans)
         except Exception as e:
             report.minor(f"Could not read agent file: {e}", str(agent_file.relative_to(plugin_root)))
             continue
 
-        # Find all subagent_type references
-        rel_path = str(agent_file.relative_to(plugin_root))
-        matches = SUBAGENT_TYPE_PATTERN.findall(content)
+        # All subagent_type references
+        rel_path = scan.rel_path
+        matches = scan.subagent_refs
 
         if matches:
             report.agent_refs[rel_path] = matches
@@ -252,6 +618,8 @@ def validate_subagent_type_matching(
     plugin_root: Path,
     report: CrossReferenceValidationReport,
     available_agents: set[str],
+    scans: dict[str, XrefFileScan] | None = None,
+    scope: ChangeScope | None = None,
 ) -> None:
     """Validate subagent_type values match actual agent filenames.
 
@@ -262,24 +630,22 @@ def validate_subagent_type_matching(
         plugin_root: Root path of the plugin
         report: Validation report to add results to
         available_agents: Set of available agent names
+        scans: Results of scan_plugin_files() (the plugin is scanned if omitted)
+        scope: Optional change scope; only files in it are checked
     """
-    # Scan all .md files in the plugin
-    for md_file in plugin_root.rglob("*.md"):
-        # Skip hidden directories and cache directories
-        if any(should_skip_dir(p) for p in md_file.parents):
-            continue
+    if scans is None:
+        scans = scan_plugin_files(plugin_root)
 
-        try:
-            content = md_file.read_text(errors="ignore")
-        except Exception:
+    # Each referenced name is checked on disk once
+    agent_exists: dict[str, bool] = {}
+    for rel_path, scan in scans.items():
+        if scope is not None and not scope.includes(rel_path):
             continue
-
-        rel_path = str(md_file.relative_to(plugin_root))
-        matches = SUBAGENT_TYPE_PATTERN.findall(content)
-
-        for ref_agent in matches:
-            expected_file = plugin_root / "agents" / f"{ref_agent}.md"
-            if not expected_file.exists():
+        for ref_agent in scan.subagent_refs:
+            exists = agent_exists.get(ref_agent)
+            if exists is None:
+                exists = agent_exists[ref_agent] = (plugin_root / "agents" / f"{ref_agent}.md").exists()
+            if not exists:
                 report.major(
                     f"subagent_type '{ref_agent}' has no matching agents/{ref_agent}.md",
                     rel_path,
@@ -381,6 +747,8 @@ def validate_command_agent_refs(
     plugin_root: Path,
     report: CrossReferenceValidationReport,
     available_agents: set[str],
+    scans: dict[str, XrefFileScan] | None = None,
+    scope: ChangeScope | None = None,
 ) -> None:
     """Validate that commands do not reference non-existent agents.
 
@@ -391,6 +759,8 @@ def validate_command_agent_refs(
         plugin_root: Root path of the plugin
         report: Validation report to add results to
         available_agents: Set of available agent names
+        scans: Results of scan_plugin_files() (command files are read if omitted)
+        scope: Optional change scope; only files in it are checked
     """
     commands_dir = plugin_root / "commands"
     if not commands_dir.exists():
@@ -398,17 +768,18 @@ def validate_command_agent_refs(
         return
 
     for cmd_file in commands_dir.glob("*.md"):
+        if scope is not None and not scope.includes(f"commands/{cmd_file.name}"):
+            continue
         try:
-            content = cmd_file.read_text(errors="ignore")
+            scan = _get_file_scan(plugin_root, cmd_file, scans)
         except Exception as e:
             report.minor(f"Could not read command file: {e}", str(cmd_file.relative_to(plugin_root)))
             continue
 
-        rel_path = str(cmd_file.relative_to(plugin_root))
+        rel_path = scan.rel_path
 
         # Check for subagent_type references
-        subagent_refs = SUBAGENT_TYPE_PATTERN.findall(content)
-        for ref_agent in subagent_refs:
+        for ref_agent in scan.subagent_refs:
             if ref_agent not in available_agents:
                 report.critical(
                     f"Command references non-existent agent '{ref_agent}' - BREAKING",
@@ -421,8 +792,7 @@ def validate_command_agent_refs(
                 )
 
         # Check for spawn/invoke patterns
-        spawn_refs = AGENT_SPAWN_PATTERN.findall(content)
-        for ref_agent in spawn_refs:
+        for ref_agent in scan.spawn_refs:
             # Normalize the agent name (lowercase, trimmed)
             ref_agent_normalized = ref_agent.lower().strip()
             if ref_agent_normalized not in available_agents:
@@ -444,6 +814,8 @@ def validate_skill_refs(
     plugin_root: Path,
     report: CrossReferenceValidationReport,
     available_skills: set[str],
+    scans: dict[str, XrefFileScan] | None = None,
+    scope: ChangeScope | None = None,
 ) -> None:
     """Validate that skill references point to existing skills.
 
@@ -454,39 +826,28 @@ def validate_skill_refs(
         plugin_root: Root path of the plugin
         report: Validation report to add results to
         available_skills: Set of available skill names
+        scans: Results of scan_plugin_files() (the plugin is scanned if omitted)
+        scope: Optional change scope; only files in it are checked
     """
-    # File extensions to scan for skill references
-    scan_extensions = {".py", ".sh", ".md", ".json", ".yaml", ".yml"}
-
-    for ext in scan_extensions:
-        for file_path in plugin_root.rglob(f"*{ext}"):
-            # Skip hidden/cache directories
-            if any(should_skip_dir(p) for p in file_path.parents):
-                continue
-
-            try:
-                content = file_path.read_text(errors="ignore")
-            except Exception:
-                continue
+    if scans is None:
+        scans = scan_plugin_files(plugin_root)
 
-            rel_path = str(file_path.relative_to(plugin_root))
-            matches = SKILL_REF_PATTERN.findall(content)
-
-            if matches:
-                report.skill_refs[rel_path] = list(set(matches))
+    for rel_path, scan in scans.items():
+        if not scan.skill_refs or (scope is not None and not scope.includes(rel_path)):
+            continue
+        report.skill_refs[rel_path] = scan.skill_refs
 
-            for skill_name in set(matches):
-                skill_name_lower = skill_name.lower()
-                if skill_name_lower not in available_skills:
-                    report.major(
-                        f"Reference to non-existent skill '{skill_name}'",
-                        rel_path,
-                    )
-                else:
-                    report.passed(
-                        f"Skill reference '{skill_name}' is valid",
-                        rel_path,
-                    )
+        for skill_name in scan.skill_refs:
+            if skill_name.lower() not in available_skills:
+                report.major(
+                    f"Reference to non-existent skill '{skill_name}'",
+                    rel_path,
+                )
+            else:
+                report.passed(
+                    f"Skill reference '{skill_name}' is valid",
+                    rel_path,
+                )
 
 
 # =============================================================================
@@ -560,8 +921,6 @@ def validate_hook_script_refs(
             else:
                 # Check if script is executable (for shell scripts)
                 if resolved_path.suffix in {".sh", ".bash"}:
-                    import os
-
                     if not os.access(resolved_path, os.X_OK):
                         report.minor(
                             f"Hook script is not executable: {script_path}",
@@ -619,17 +978,33 @@ def extract_script_paths_from_hooks(hooks_config: dict[str, Any]) -> list[str]:
 # =============================================================================
 
 
-def validate_cross_references(plugin_path: str | Path) -> CrossReferenceValidationReport:
+def validate_cross_references(
+    plugin_path: str | Path,
+    sink: NDJSONSink | None = None,
+    index: PluginTreeIndex | None = None,
+    graph: XrefGraph | None = None,
+    scope: ChangeScope | None = None,
+) -> CrossReferenceValidationReport:
     """Validate all cross-references in a plugin.
 
+    With a graph, only files changed since the graph was last updated are
+    read; the stored references of all other files are reused. With a scope,
+    the rules only check the files in it; given a graph too, the scope is
+    narrowed to the changed files and their dependents in the graph
+    (see XrefGraph.affected_files).
+
     Args:
         plugin_path: Path to the plugin directory
+        sink: Optional NDJSON sink; each result is streamed as soon as it is added
+        index: Shared tree index for this run (built on demand if omitted)
+        graph: Optional persisted cross-reference graph of this plugin, updated in place
+        scope: Optional change scope (see --changed-since)
 
     Returns:
         CrossReferenceValidationReport with all validation results
     """
     plugin_root = Path(plugin_path).resolve()
-    report = CrossReferenceValidationReport()
+    report = CrossReferenceValidationReport(sink=sink)
     report.plugin_path = str(plugin_root)
 
     # Verify plugin directory exists
@@ -648,24 +1023,39 @@ def validate_cross_references(plugin_path: str | Path) -> CrossReferenceValidati
     report.info(f"Found {len(available_agents)} agent(s) in agents/")
     report.info(f"Found {len(available_skills)} skill(s) in skills/")
 
+    # One pruned walk and one read per file feed rules 1, 2, 4 and 5
+    if graph is not None:
+        scans = graph.update(index)
+        report.info(f"Cross-reference graph: rescanned {len(graph.rescanned)} of {len(scans)} file(s)")
+        if scope is not None:
+            # The graph's reverse edges give the exact subgraph a change can affect
+            affected = graph.affected_files(sorted(scope.changed))
+            scope = ChangeScope(scope.since, scope.changed, set(affected))
+    else:
+        scans = scan_plugin_files(plugin_root, index)
+    if scope is not None:
+        report.info(f"Change scope: {len(scope.files)} file(s) affected by {len(scope.changed)} change(s)")
+
     # Run all validation rules
     # Rule 1: Agent Task() calls
-    validate_agent_task_refs(plugin_root, report, available_agents)
+    validate_agent_task_refs(plugin_root, report, available_agents, scans, scope)
 
     # Rule 2: Subagent_type matching
-    validate_subagent_type_matching(plugin_root, report, available_agents)
+    validate_subagent_type_matching(plugin_root, report, available_agents, scans, scope)
 
     # Rule 3: Version synchronization
-    validate_version_sync(plugin_root, report)
+    if scope is None or any(scope.includes(source) for source in VERSION_SOURCES):
+        validate_version_sync(plugin_root, report)
 
     # Rule 4: Command agent references
-    validate_command_agent_refs(plugin_root, report, available_agents)
+    validate_command_agent_refs(plugin_root, report, available_agents, scans, scope)
 
     # Rule 5: Skill references
-    validate_skill_refs(plugin_root, report, available_skills)
+    validate_skill_refs(plugin_root, report, available_skills, scans, scope)
 
     # Rule 6: Hook script references
-    validate_hook_script_refs(plugin_root, report)
+    if scope is None or scope.touches("hooks") or scope.includes(".claude-plugin/plugin.json"):
+        validate_hook_script_refs(plugin_root, report)
 
     return report
 
@@ -675,6 +1065,49 @@ def validate_cross_references(plugin_path: str | Path) -> CrossReferenceValidati
 # =============================================================================
 
 
+def print_impact(plugin_root: Path, query: str, as_json: bool) -> int:
+    """Print what depends on a graph node, updating the persisted graph first.
+
+    Args:
+        plugin_root: Root path of the plugin
+        query: "skill:NAME", "agent:NAME", "command:NAME", "file:PATH" or a bare file path
+        as_json: Print JSON instead of text
+
+    Returns:
+        Exit code (0, or 1 if the plugin directory does not exist)
+    """
+    if not plugin_root.is_dir():
+        print(f"Error: Plugin directory does not exist: {plugin_root}", file=sys.stderr)
+        return 1
+
+    kind, _, name = query.partition(":")
+    if kind == "skill":
+        node = f"skill:{name.lower()}"
+    elif kind in ("agent", "command"):
+        node = query
+    else:
+        path = name if kind == "file" else query
+        node = "file:" + posixpath.normpath(path.replace("\\", "/"))
+
+    graph = XrefGraph(plugin_root)
+    graph.update()
+    graph.save()
+    dependents = graph.dependents(node)
+    affected = graph.impact(node)
+
+    if as_json:
+        print(json.dumps({"node": node, "dependents": dependents, "affected_files": affected}, indent=2))
+        return 0
+
+    print(f"{COLORS['BOLD']}Direct dependents of {node} ({len(dependents)}):{COLORS['RESET']}")
+    for dependent in dependents:
+        print(f"  {dependent}")
+    print(f"{COLORS['BOLD']}Files affected if it is renamed or removed ({len(affected)}):{COLORS['RESET']}")
+    for rel_path in affected:
+        print(f"  {rel_path}")
+    return 0
+
+
 def main() -> int:
     """CLI entry point for cross-reference validation.
 
@@ -689,6 +1122,9 @@ Examples:
     uv run python scripts/validate_xref.py /path/to/plugin
     uv run python scripts/validate_xref.py /path/to/plugin --verbose
     uv run python scripts/validate_xref.py /path/to/plugin --json
+    uv run python scripts/validate_xref.py /path/to/plugin --graph
+    uv run python scripts/validate_xref.py /path/to/plugin --impact skill:my-skill
+    uv run python scripts/validate_xref.py /path/to/plugin --graph --changed-since HEAD~1
 
 Exit codes:
     0 - All checks passed
@@ -714,14 +1150,54 @@ Exit codes:
         action="store_true",
         help="Output results as JSON",
     )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream results as NDJSON, then a summary record",
+    )
+    parser.add_argument(
+        "--graph",
+        action="store_true",
+        help="Keep a persisted cross-reference graph; only files changed since the last run are rescanned",
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REV",
+        help="Only check files changed since git revision REV, plus the files that reference them",
+    )
+    parser.add_argument(
+        "--impact",
+        metavar="NODE",
+        help="List what depends on NODE (skill:NAME, agent:NAME, command:NAME or a file path) and exit",
+    )
 
     args = parser.parse_args()
 
+    if args.impact:
+        return print_impact(Path(args.plugin_path).resolve(), args.impact, args.json)
+
+    # Shared by the change scope and the validator
+    plugin_root = Path(args.plugin_path).resolve()
+    index = PluginTreeIndex(plugin_root)
+    scope = None
+    if args.changed_since:
+        try:
+            scope = get_change_scope(plugin_root, args.changed_since, index)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
     # Run validation
-    report = validate_cross_references(args.plugin_path)
+    sink = NDJSONSink(validator="xref") if args.ndjson else None
+    graph = XrefGraph(plugin_root) if args.graph else None
+    report = validate_cross_references(plugin_root, sink, index=index, graph=graph, scope=scope)
+    if graph is not None:
+        graph.save()
 
     # Output results
-    if args.json:
+    if sink is not None:
+        sink.close({"plugin_path": report.plugin_path})
+    elif args.json:
         print(report.to_json())
     else:
         print_report_summary(report, "Cross-Reference Validation Report")
@@ -13,14 +13,17 @@ All individual validators should import from this module to ensure consistency.
 
 from __future__ import annotations
 
-import fnmatch
+import hashlib
 import json
 import os
 import re
 import subprocess
-from dataclasses import dataclass, field
+import sys
+from bisect import bisect_right
+from dataclasses import asdict, dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Literal
+from typing import Any, Callable, Iterable, Iterator, Literal, TextIO
 
 # =============================================================================
 # Tool Resolution: local install → remote runner fallback (via smart_exec)
@@ -36,19 +39,19 @@ def resolve_tool_command(tool_name: str) -> list[str] | None:
     Supports 25+ tools across Python, Node, Deno, native, and PowerShell
     ecosystems. See smart_exec.py for the full TOOL_DB and PRIORITY tables.
 
+    Resolutions are memoized per process and cached on disk until PATH or
+    an executor on it changes (see smart_exec.resolve_tool_cached). When a
+    "smart_exec.py serve" daemon is running, remote tools are routed through
+    its client so each run skips package resolution.
+
     Returns:
         Command prefix as list (e.g. ["uvx", "ruff@latest"]) or None if
         no suitable executor is available on this system.
     """
-    from smart_exec import choose_best, detect_executors, resolve_tool
+    from smart_exec import daemon_client_argv, resolve_tool_cached
 
-    spec = resolve_tool(tool_name)
-    executors = detect_executors()
-    try:
-        argv, _executor = choose_best(spec, [], executors)
-        return argv
-    except RuntimeError:
-        return None
+    argv = resolve_tool_cached(tool_name)
+    return daemon_client_argv(tool_name, argv) or argv
 
 
 # =============================================================================
@@ -244,17 +247,25 @@ SKIP_DIRS = {
 # Security Patterns
 # =============================================================================
 
+# The pattern tables below are compiled on first access (see __getattr__ in
+# the next section), so importing this module does not pay for them.
+
 # Patterns that indicate potential secrets/credentials
-# Note: Generic API Key pattern excludes env var placeholders like ${VAR} or $VAR
-SECRET_PATTERNS = [
-    (re.compile(r"AKIA[0-9A-Z]{16}"), "AWS Access Key"),
-    (re.compile(r"-----BEGIN (RSA |DSA |EC |OPENSSH )?PRIVATE KEY-----"), "Private Key"),
-    (re.compile(r"ghp_[a-zA-Z0-9]{36}"), "GitHub Personal Access Token"),
-    (re.compile(r"sk-[a-zA-Z0-9]{48}"), "OpenAI API Key"),
-    (re.compile(r"xox[baprs]-[0-9a-zA-Z-]+"), "Slack Token"),
-    # Generic API key pattern excludes environment variable placeholders (${VAR} or $VAR)
-    (re.compile(r"api[_-]?key['\"]?\s*[:=]\s*['\"](?!\$[\{A-Z_])[^'\"]{20,}['\"]", re.I), "Generic API Key"),
-]
+SECRET_PATTERNS: list[tuple[re.Pattern[str], str]]
+
+
+def _build_secret_patterns() -> list[tuple[re.Pattern[str], str]]:
+    # Note: Generic API Key pattern excludes env var placeholders like ${VAR} or $VAR
+    return [
+        (re.compile(r"AKIA[0-9A-Z]{16}"), "AWS Access Key"),
+        (re.compile(r"-----BEGIN (RSA |DSA |EC |OPENSSH )?PRIVATE KEY-----"), "Private Key"),
+        (re.compile(r"ghp_[a-zA-Z0-9]{36}"), "GitHub Personal Access Token"),
+        (re.compile(r"sk-[a-zA-Z0-9]{48}"), "OpenAI API Key"),
+        (re.compile(r"xox[baprs]-[0-9a-zA-Z-]+"), "Slack Token"),
+        # Generic API key pattern excludes environment variable placeholders (${VAR} or $VAR)
+        (re.compile(r"api[_-]?key['\"]?\s*[:=]\s*['\"](?!\$[\{A-Z_])[^'\"]{20,}['\"]", re.I), "Generic API Key"),
+    ]
+
 
 # Generic example usernames that are acceptable in documentation
 EXAMPLE_USERNAMES = {
@@ -291,21 +302,34 @@ EXAMPLE_USERNAMES = {
 
 # Patterns for hardcoded user paths (should use ${CLAUDE_PLUGIN_ROOT} instead)
 # Note: These are generic patterns that may produce false positives for example paths
-USER_PATH_PATTERNS = [
-    re.compile(r"/Users/[^/\s]+/"),
-    re.compile(r"C:\\Users\\[^\\\s]+\\"),
-    re.compile(r"/home/[^/\s]+/"),
-]
+USER_PATH_PATTERNS: list[re.Pattern[str]]
+
+
+def _build_user_path_patterns() -> list[re.Pattern[str]]:
+    return [
+        re.compile(r"/Users/[^/\s]+/"),
+        re.compile(r"C:\\Users\\[^\\\s]+\\"),
+        re.compile(r"/home/[^/\s]+/"),
+    ]
+
 
 # Patterns for ANY absolute path (stricter check for plugins)
 # Plugins should use relative paths or ${CLAUDE_PLUGIN_ROOT} / ${HOME}
 # Only check for home directory paths which are the problematic ones
-ABSOLUTE_PATH_PATTERNS = [
-    # macOS/Linux home directory paths - these are problematic
-    (re.compile(r'(?<![#!])(/(?:Users|home)/[^/\s"\'`>\]})]+/[^\s"\'`>\]})]+)'), "home directory path"),
-    # Windows home directory paths
-    (re.compile(r'(?<!\$\{)(?<!\$)([A-Z]:[\\\/]Users[\\\/][^\s"\'`>\]})]+)', re.IGNORECASE), "Windows home path"),
-]
+ABSOLUTE_PATH_PATTERNS: list[tuple[re.Pattern[str], str]]
+
+
+def _build_absolute_path_patterns() -> list[tuple[re.Pattern[str], str]]:
+    return [
+        # macOS/Linux home directory paths - these are problematic
+        (re.compile(r'(?<![#!])(/(?:Users|home)/[^/\s"\'`>\]})]+/[^\s"\'`>\]})]+)'), "home directory path"),
+        # Windows home directory paths
+        (
+            re.compile(r'(?<!\$\{)(?<!\$)([A-Z]:[\\\/]Users[\\\/][^\s"\'`>\]})]+)', re.IGNORECASE),
+            "Windows home path",
+        ),
+    ]
+
 
 # Allowed absolute path prefixes in documentation examples
 ALLOWED_DOC_PATH_PREFIXES = {
@@ -387,17 +411,20 @@ def _get_private_usernames() -> set[str]:
     return usernames
 
 
-# Auto-detect at import time
-PRIVATE_USERNAMES: set[str] = _get_private_usernames()
+# Auto-detected on first access (see __getattr__ below)
+PRIVATE_USERNAMES: set[str]
 
 
 # Patterns for detecting private paths with actual usernames
 # More specific than USER_PATH_PATTERNS - these flag as CRITICAL
-def build_private_path_patterns(usernames: set[str]) -> list[tuple[re.Pattern[str], str]]:
+def build_private_path_patterns(usernames: Iterable[str]) -> list[tuple[re.Pattern[str], str]]:
     """Build regex patterns for detecting private usernames in paths.
 
+    Scanners should prefer get_private_path_matcher(), which compiles these
+    once per username set.
+
     Args:
-        usernames: Set of private usernames to detect
+        usernames: Private usernames to detect
 
     Returns:
         List of (pattern, description) tuples
@@ -428,8 +455,90 @@ def build_private_path_patterns(usernames: set[str]) -> list[tuple[re.Pattern[st
     return patterns
 
 
-# Pre-built patterns for default usernames
-PRIVATE_PATH_PATTERNS = build_private_path_patterns(PRIVATE_USERNAMES)
+class PrivatePathMatcher:
+    """Private-path patterns for one username set, behind a single-pass gate.
+
+    The gate is one alternation over every username, anchored on the path
+    separator each pattern requires before the name. A file the gate does not
+    hit cannot match any pattern, so the common clean file costs one scan.
+    """
+
+    __slots__ = ("patterns", "_gate")
+
+    def __init__(self, usernames: Iterable[str]) -> None:
+        names = sorted(set(usernames))
+        self.patterns = build_private_path_patterns(names)
+        alternation = "|".join(re.escape(name) for name in names)
+        self._gate = re.compile(rf"[/\\](?:{alternation})", re.IGNORECASE) if names else None
+
+    def finditer(self, content: str) -> Iterator[tuple[re.Match[str], str]]:
+        """Yield (match, description) per pattern in order, as a per-pattern loop would."""
+        if self._gate is None or not self._gate.search(content):
+            return
+        for pattern, desc in self.patterns:
+            for match in pattern.finditer(content):
+                yield match, desc
+
+
+_private_path_matchers: dict[frozenset[str], PrivatePathMatcher] = {}
+
+
+def get_private_path_matcher(usernames: Iterable[str]) -> PrivatePathMatcher:
+    """Return the matcher for a username set, compiling it once per process.
+
+    Args:
+        usernames: Private usernames to detect
+
+    Returns:
+        Cached PrivatePathMatcher keyed by the frozen username set
+    """
+    key = frozenset(usernames)
+    matcher = _private_path_matchers.get(key)
+    if matcher is None:
+        matcher = _private_path_matchers[key] = PrivatePathMatcher(key)
+    return matcher
+
+
+# Patterns for the default usernames, built on first access
+PRIVATE_PATH_PATTERNS: list[tuple[re.Pattern[str], str]]
+
+# Module constants built on first use: name -> builder
+_LAZY_CONSTANTS: dict[str, Callable[[], Any]] = {
+    "SECRET_PATTERNS": _build_secret_patterns,
+    "USER_PATH_PATTERNS": _build_user_path_patterns,
+    "ABSOLUTE_PATH_PATTERNS": _build_absolute_path_patterns,
+    "PRIVATE_USERNAMES": _get_private_usernames,
+    "PRIVATE_PATH_PATTERNS": lambda: get_private_path_matcher(get_private_usernames()).patterns,
+}
+
+
+def _lazy_constant(name: str) -> Any:
+    """Return a lazily built module constant, building it on first use.
+
+    The value is stored as a module global, so later lookups (including
+    from-imports) find it directly.
+    """
+    value = globals().get(name)
+    if value is None:
+        value = globals()[name] = _LAZY_CONSTANTS[name]()
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the module constants in _LAZY_CONSTANTS on first access (PEP 562)."""
+    if name in _LAZY_CONSTANTS:
+        return _lazy_constant(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_private_usernames() -> set[str]:
+    """Return the private usernames detected on this system (PRIVATE_USERNAMES).
+
+    Returns:
+        The detected usernames; detection runs once per process
+    """
+    usernames: set[str] = _lazy_constant("PRIVATE_USERNAMES")
+    return usernames
 
 # File extensions to check for private info
 SCANNABLE_EXTENSIONS = {
@@ -485,157 +594,1438 @@ PRIVATE_INFO_SKIP_DIRS = {
 
 
 # =============================================================================
-# Gitignore Support
+# Gitignore Support
+# =============================================================================
+
+
+def _git_index_path(root_path: Path) -> Path | None:
+    """Locate the git index of the work tree containing root_path (None outside git)."""
+    for parent in (root_path, *root_path.parents):
+        dot_git = parent / ".git"
+        if dot_git.is_dir():
+            return dot_git / "index"
+        if dot_git.is_file():
+            # Worktrees and submodules: ".git" is a file pointing at the git dir
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if content.startswith("gitdir:"):
+                return (parent / content[len("gitdir:") :].strip()).resolve() / "index"
+            return None
+    return None
+
+
+def _mtime_ns(path: Path | None) -> int | None:
+    if path is None:
+        return None
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class GitListing:
+    """Cached "git ls-files" output for one root.
+
+    The ignored set is fetched on creation. The file list of the work tree
+    (tracked plus untracked, not ignored) is fetched on first access, so
+    callers that only need one of them pay for one git call.
+
+    Attributes:
+        root: Directory git was run in (paths are relative to it)
+        ignored: Ignored files and directories (--directory collapses the latter)
+    """
+
+    __slots__ = ("root", "ignored", "_tracked", "_untracked", "_files", "_has_submodules")
+
+    def __init__(self, root: Path, ignored: set[str]) -> None:
+        self.root = root
+        self.ignored = ignored
+        self._tracked: list[str] | None = None
+        self._untracked: list[str] | None = None
+        self._files: list[str] | None = None
+        self._has_submodules = False
+
+    def _load_files(self) -> None:
+        tracked: list[str] = []
+        untracked: list[str] = []
+        try:
+            result = subprocess.run(
+                ["git", "ls-files", "-z", "--stage", "--cached", "--others", "--exclude-standard"],
+                cwd=self.root,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+            result = None
+        if result is not None and result.returncode == 0:
+            for entry in result.stdout.split("\0"):
+                if not entry:
+                    continue
+                # Index entries are "<mode> <sha> <stage>\t<path>", untracked ones a bare path
+                meta, tab, rel_path = entry.partition("\t")
+                if not tab:
+                    untracked.append(entry)
+                    continue
+                if meta.startswith("160000 "):
+                    self._has_submodules = True
+                tracked.append(rel_path)
+        # Unmerged paths appear once per stage
+        self._tracked = sorted(set(tracked))
+        self._untracked = sorted(set(untracked))
+        self._files = sorted(set(tracked).union(untracked))
+
+    @property
+    def tracked(self) -> list[str]:
+        """Paths in the git index, sorted."""
+        if self._tracked is None:
+            self._load_files()
+        return self._tracked or []
+
+    @property
+    def untracked(self) -> list[str]:
+        """Untracked, non-ignored files, sorted."""
+        if self._untracked is None:
+            self._load_files()
+        return self._untracked or []
+
+    @property
+    def files(self) -> list[str] | None:
+        """Tracked and untracked non-ignored files, sorted.
+
+        None when the tree contains submodules, whose contents git does not
+        list; callers should walk the directory tree instead.
+        """
+        if self._files is None:
+            self._load_files()
+        return None if self._has_submodules else self._files
+
+
+_git_listings: dict[Path, tuple[tuple[int | None, ...], GitListing | None]] = {}
+
+
+def get_git_listing(root_path: Path) -> GitListing | None:
+    """Return git ls-files output for root_path, cached per process.
+
+    The cache entry is reused until the git index, the root .gitignore or
+    .git/info/exclude changes (by mtime).
+
+    Args:
+        root_path: Directory inside a git work tree
+
+    Returns:
+        GitListing, or None if git is unavailable or root_path is not in a work tree
+    """
+    index_path = _git_index_path(root_path)
+    exclude_path = index_path.parent / "info" / "exclude" if index_path is not None else None
+    fingerprint = (_mtime_ns(index_path), _mtime_ns(root_path / ".gitignore"), _mtime_ns(exclude_path))
+    cached = _git_listings.get(root_path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    listing: GitListing | None = None
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "--ignored", "--exclude-standard", "--others", "--directory"],
+            cwd=root_path,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if result.returncode == 0:
+            ignored = {line.rstrip("/") for line in result.stdout.strip().split("\n") if line}
+            listing = GitListing(root_path, ignored)
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        pass
+    _git_listings[root_path] = (fingerprint, listing)
+    return listing
+
+
+def get_gitignored_files(root_path: Path) -> set[str]:
+    """Get set of files/directories that are gitignored.
+
+    Uses git ls-files (cached per root, see get_git_listing) to accurately
+    determine what's ignored, falling back to evaluating .gitignore rules
+    directly if git is not available.
+
+    Args:
+        root_path: Root directory to check for .gitignore
+
+    Returns:
+        Set of relative paths that are gitignored
+    """
+    # Use git for accuracy (respects the whole .gitignore hierarchy), cached per root
+    listing = get_git_listing(root_path)
+    if listing is not None:
+        return set(listing.ignored)
+
+    ignored: set[str] = set()
+
+    # Fallback: evaluate .gitignore rules directly (ignored directories are
+    # reported once and not descended into, like git's --directory)
+    gitignore = get_gitignore_matcher(root_path)
+    try:
+        for dirpath, dirnames, filenames in os.walk(root_path):
+            rel_dir = os.path.relpath(dirpath, root_path)
+            rel_dir = "" if rel_dir == "." else rel_dir
+            kept = []
+            for name in dirnames:
+                rel_path = os.path.join(rel_dir, name) if rel_dir else name
+                if name == ".git":
+                    continue
+                if gitignore.is_ignored(rel_path, is_dir=True):
+                    ignored.add(rel_path)
+                else:
+                    kept.append(name)
+            dirnames[:] = kept
+            for name in filenames:
+                rel_path = os.path.join(rel_dir, name) if rel_dir else name
+                if gitignore.is_ignored(rel_path):
+                    ignored.add(rel_path)
+    except Exception:
+        pass
+
+    return ignored
+
+
+def parse_gitignore(gitignore_path: Path) -> list[str]:
+    """Parse a .gitignore file and return list of patterns.
+
+    Args:
+        gitignore_path: Path to .gitignore file
+
+    Returns:
+        List of gitignore patterns (comments and empty lines stripped)
+    """
+    patterns: list[str] = []
+    try:
+        with open(gitignore_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                # Skip empty lines and comments
+                if not line or line.startswith("#"):
+                    continue
+                patterns.append(line)
+    except (OSError, UnicodeDecodeError):
+        pass
+    return patterns
+
+
+def _gitignore_glob_to_regex(pattern: str) -> str:
+    """Translate one gitignore glob (negation and trailing "/" removed) to a regex.
+
+    Follows git's wildmatch rules: "*" and "?" never cross "/", a leading
+    "**/" matches in all directories, a trailing "/**" matches everything
+    inside, "/**/" matches zero or more directories, and a pattern with a
+    "/" before its end is anchored to the .gitignore directory.
+    """
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+    out = [] if anchored else ["(?:.*/)?"]
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            j = i
+            while j < n and pattern[j] == "*":
+                j += 1
+            if j - i == 2 and (i == 0 or pattern[i - 1] == "/") and (j == n or pattern[j] == "/"):
+                if j == n:
+                    out.append(".*")
+                    i = j
+                else:
+                    out.append("(?:.*/)?")
+                    i = j + 1
+                continue
+            # Any other run of asterisks is a plain "*"
+            out.append("[^/]*")
+            i = j
+            continue
+        if c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i + 1
+            if j < n and pattern[j] in "!^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : j].replace("\\", "\\\\")
+                if body[:1] in ("!", "^"):
+                    out.append(f"[^/{body[1:]}]")
+                else:
+                    out.append(f"[{body}]")
+                i = j + 1
+                continue
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class GitignoreRules:
+    """The rules of one .gitignore file, compiled into two alternations.
+
+    Rules are joined in reverse order, one capturing group each, so the first
+    alternative that fullmatches is the last matching rule, as in git. Rules
+    ending in "/" only take part in the directory alternation.
+    """
+
+    __slots__ = ("_file_re", "_file_negated", "_dir_re", "_dir_negated")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        file_parts: list[str] = []
+        dir_parts: list[str] = []
+        self._file_negated: list[bool] = []
+        self._dir_negated: list[bool] = []
+        for pattern in reversed(list(patterns)):
+            negated = pattern.startswith("!")
+            if negated:
+                pattern = pattern[1:]
+            elif pattern.startswith(("\\!", "\\#")):
+                pattern = pattern[1:]
+            dir_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            if not pattern:
+                continue
+            group = f"({_gitignore_glob_to_regex(pattern)})"
+            dir_parts.append(group)
+            self._dir_negated.append(negated)
+            if not dir_only:
+                file_parts.append(group)
+                self._file_negated.append(negated)
+        self._file_re = re.compile("|".join(file_parts), re.DOTALL) if file_parts else None
+        self._dir_re = re.compile("|".join(dir_parts), re.DOTALL) if dir_parts else None
+
+    def match(self, rel_path: str, is_dir: bool) -> bool | None:
+        """Decide a path relative to this file's directory.
+
+        Returns:
+            True if ignored, False if re-included by a negation, None if no rule matches
+        """
+        regex, negated = (self._dir_re, self._dir_negated) if is_dir else (self._file_re, self._file_negated)
+        if regex is None:
+            return None
+        match = regex.fullmatch(rel_path)
+        if match is None or match.lastindex is None:
+            return None
+        return not negated[match.lastindex - 1]
+
+
+class GitignoreMatcher:
+    """Compiled .gitignore rules for a tree, evaluated without running git.
+
+    Supports nested .gitignore files (loaded lazily, once per directory),
+    .git/info/exclude, negation, anchoring, "**" and directory-only rules.
+    Deeper .gitignore files override shallower ones, and nothing inside an
+    ignored directory can be re-included.
+
+    Usage:
+        gitignore = get_gitignore_matcher(plugin_root)
+        if gitignore.is_ignored("build/out.json"):
+            ...
+    """
+
+    __slots__ = ("root", "_rules", "_dir_cache")
+
+    def __init__(self, root: Path | None, root_patterns: Iterable[str] | None = None) -> None:
+        """Create a matcher.
+
+        Args:
+            root: Tree root to load .gitignore files from (None: use root_patterns only)
+            root_patterns: Rules for the root directory instead of reading them from disk
+        """
+        self.root = root
+        self._rules: dict[str, tuple[GitignoreRules, ...]] = {}
+        self._dir_cache: dict[str, bool] = {}
+        if root_patterns is not None:
+            self._rules[""] = (GitignoreRules(root_patterns),)
+
+    def _rules_for(self, rel_dir: str) -> tuple[GitignoreRules, ...]:
+        """Rules that apply in rel_dir, highest precedence first (loaded once)."""
+        rules = self._rules.get(rel_dir)
+        if rules is None:
+            rules = ()
+            if self.root is not None:
+                base = self.root / rel_dir if rel_dir else self.root
+                sources = [base / ".gitignore"]
+                if not rel_dir:
+                    sources.append(base / ".git" / "info" / "exclude")
+                rules = tuple(GitignoreRules(parse_gitignore(source)) for source in sources if source.is_file())
+            self._rules[rel_dir] = rules
+        return rules
+
+    def _match_own(self, parts: list[str], is_dir: bool) -> bool:
+        """Apply the rules of every ancestor directory, deepest first."""
+        for depth in range(len(parts) - 1, -1, -1):
+            rules = self._rules_for("/".join(parts[:depth]))
+            if rules:
+                sub_path = "/".join(parts[depth:])
+                for file_rules in rules:
+                    decision = file_rules.match(sub_path, is_dir)
+                    if decision is not None:
+                        return decision
+        return False
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Check whether a path relative to the root is gitignored.
+
+        Args:
+            rel_path: Relative path (either separator style)
+            is_dir: True if the path is a directory
+
+        Returns:
+            True if the path or any of its parent directories is ignored
+        """
+        rel_path = rel_path.replace("\\", "/").strip("/")
+        if not rel_path:
+            return False
+        parent, _, _ = rel_path.rpartition("/")
+        if parent and self._dir_ignored(parent):
+            return True
+        return self._match_own(rel_path.split("/"), is_dir)
+
+    def _dir_ignored(self, rel_dir: str) -> bool:
+        ignored = self._dir_cache.get(rel_dir)
+        if ignored is None:
+            ignored = self._dir_cache[rel_dir] = self.is_ignored(rel_dir, is_dir=True)
+        return ignored
+
+
+_gitignore_matchers: dict[Path, GitignoreMatcher] = {}
+_pattern_matchers: dict[tuple[str, ...], GitignoreMatcher] = {}
+
+
+def get_gitignore_matcher(root_path: Path) -> GitignoreMatcher:
+    """Return the compiled gitignore matcher for a tree, built once per process.
+
+    Args:
+        root_path: Root directory of the tree
+
+    Returns:
+        Cached GitignoreMatcher for root_path
+    """
+    matcher = _gitignore_matchers.get(root_path)
+    if matcher is None:
+        matcher = _gitignore_matchers[root_path] = GitignoreMatcher(root_path)
+    return matcher
+
+
+def is_path_gitignored(rel_path: str, patterns: list[str]) -> bool:
+    """Check if a relative path matches any gitignore pattern.
+
+    The patterns are compiled once per distinct list (see GitignoreMatcher).
+
+    Args:
+        rel_path: Relative path to check
+        patterns: List of gitignore patterns
+
+    Returns:
+        True if the path (or one of its parent directories) is ignored
+    """
+    key = tuple(patterns)
+    matcher = _pattern_matchers.get(key)
+    if matcher is None:
+        matcher = _pattern_matchers[key] = GitignoreMatcher(None, key)
+    return matcher.is_ignored(rel_path)
+
+
+def get_skip_dirs_with_gitignore(root_path: Path, additional_skip: set[str] | None = None) -> set[str]:
+    """Get combined set of directories to skip (built-in + gitignored).
+
+    Args:
+        root_path: Root directory to check for .gitignore
+        additional_skip: Additional directories to skip
+
+    Returns:
+        Combined set of directory names to skip
+    """
+    dirs_to_skip = set(PRIVATE_INFO_SKIP_DIRS)
+    if additional_skip:
+        dirs_to_skip.update(additional_skip)
+
+    # Add gitignored directories
+    gitignored = get_gitignored_files(root_path)
+    for path in gitignored:
+        # Add both the full path and just the directory name
+        dirs_to_skip.add(path)
+        if "/" in path:
+            dirs_to_skip.add(path.split("/")[-1])
+
+    return dirs_to_skip
+
+
+# =============================================================================
+# Git Submodule State
+# =============================================================================
+
+
+class SubmoduleState:
+    """One line of "git submodule status" output.
+
+    Attributes:
+        path: Submodule path relative to the superproject root
+        sha: Commit recorded in the index (or checked out, if modified)
+        flag: Status prefix: "-" not initialized, "+" checked-out commit
+            differs from the recorded one, "U" merge conflicts, " " clean
+        describe: git describe output for the commit, if any
+    """
+
+    __slots__ = ("path", "sha", "flag", "describe")
+
+    def __init__(self, path: str, sha: str, flag: str, describe: str | None = None) -> None:
+        self.path = path
+        self.sha = sha
+        self.flag = flag
+        self.describe = describe
+
+    @property
+    def initialized(self) -> bool:
+        """Whether the submodule has been cloned into the work tree."""
+        return self.flag != "-"
+
+    @property
+    def modified(self) -> bool:
+        """Whether the checked-out commit differs from the recorded one."""
+        return self.flag == "+"
+
+
+class SubmoduleSnapshot:
+    """Submodule state of a superproject from one "git submodule status --recursive".
+
+    Attributes:
+        root: Superproject directory git was run in
+        ok: Whether the git call succeeded
+        output: Raw git output (stdout plus stderr), for error messages
+        states: SubmoduleState by path, nested submodules included
+    """
+
+    __slots__ = ("root", "ok", "output", "states")
+
+    def __init__(self, root: Path, ok: bool, output: str) -> None:
+        self.root = root
+        self.ok = ok
+        self.output = output
+        self.states: dict[str, SubmoduleState] = {}
+        if ok:
+            for line in output.splitlines():
+                state = self._parse_line(line)
+                if state is not None:
+                    self.states[state.path] = state
+
+    @staticmethod
+    def _parse_line(line: str) -> SubmoduleState | None:
+        # Format: <flag><sha> <path>[ (<describe>)]
+        if not line or line[0] not in " -+U":
+            return None
+        sha, _, rest = line[1:].partition(" ")
+        if not sha or not rest:
+            return None
+        describe = None
+        if rest.endswith(")") and " (" in rest:
+            rest, _, describe = rest[:-1].rpartition(" (")
+        return SubmoduleState(rest, sha, line[0], describe)
+
+    def get(self, path: str) -> SubmoduleState | None:
+        """Look up the state of the submodule at path (relative to root)."""
+        return self.states.get(path.strip("/"))
+
+
+_submodule_snapshots: dict[Path, tuple[tuple[int | None, ...], SubmoduleSnapshot]] = {}
+
+
+def get_submodule_snapshot(root_path: Path) -> SubmoduleSnapshot:
+    """Return the submodule state of root_path, cached per process.
+
+    Runs "git submodule status --recursive" once; every validator that needs
+    submodule state shares the result, so the number of git calls does not
+    grow with the number of submodules. The cache entry is reused until the
+    git index or .gitmodules changes (by mtime).
+
+    Args:
+        root_path: Superproject root directory
+
+    Returns:
+        SubmoduleSnapshot (ok is False if git failed or is unavailable)
+    """
+    root_path = root_path.resolve()
+    fingerprint = (_mtime_ns(_git_index_path(root_path)), _mtime_ns(root_path / ".gitmodules"))
+    cached = _submodule_snapshots.get(root_path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    try:
+        result = subprocess.run(
+            ["git", "submodule", "status", "--recursive"],
+            cwd=root_path,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        snapshot = SubmoduleSnapshot(root_path, result.returncode == 0, result.stdout + result.stderr)
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
+        snapshot = SubmoduleSnapshot(root_path, False, str(e))
+    _submodule_snapshots[root_path] = (fingerprint, snapshot)
+    return snapshot
+
+
+# =============================================================================
+# Line Index and Combined Patterns
+# =============================================================================
+
+
+class LineIndex:
+    """Newline offsets of a text buffer, for O(log n) offset -> line lookups.
+
+    Build once per file; replaces content[:offset].count("\\n") per match.
+    The offsets are computed on the first lookup, so creating an index for a
+    file that ends up with no matches costs nothing.
+    """
+
+    __slots__ = ("_content", "_starts")
+
+    def __init__(self, content: str) -> None:
+        self._content = content
+        self._starts: list[int] | None = None
+
+    def _line_starts(self) -> list[int]:
+        if self._starts is None:
+            starts = [0]
+            find = self._content.find
+            pos = find("\n")
+            while pos != -1:
+                starts.append(pos + 1)
+                pos = find("\n", pos + 1)
+            self._starts = starts
+        return self._starts
+
+    def __len__(self) -> int:
+        """Number of lines (as produced by content.split("\\n"))."""
+        return len(self._line_starts())
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number containing the character at offset."""
+        return bisect_right(self._line_starts(), offset)
+
+    def lines_spanned(self, start: int, end: int) -> range:
+        """1-based line numbers touched by the span [start, end)."""
+        return range(self.line_of(start), self.line_of(max(start, end - 1)) + 1)
+
+
+def combine_patterns(patterns: Iterable[re.Pattern[str]]) -> re.Pattern[str]:
+    """Compile patterns into one alternation for a single pass over a whole buffer.
+
+    Per-pattern flags are kept as scoped inline flags, and MULTILINE makes ^/$
+    match at line boundaries as they do when each line is searched on its own.
+
+    Args:
+        patterns: Compiled patterns without named groups
+
+    Returns:
+        A pattern matching wherever any of the inputs would start a match
+    """
+    parts = []
+    for pattern in patterns:
+        inline = "".join(flag for bit, flag in ((re.I, "i"), (re.S, "s"), (re.X, "x")) if pattern.flags & bit)
+        parts.append(f"(?{inline}:{pattern.pattern})" if inline else f"(?:{pattern.pattern})")
+    return re.compile("|".join(parts), re.MULTILINE)
+
+
+def candidate_lines(content: str, prefilter: re.Pattern[str]) -> list[tuple[int, str]]:
+    """Lines a per-line pattern scan can match, as (line_num, line) pairs in order.
+
+    The prefilter must match somewhere inside every match of the scanned
+    patterns (e.g. an alternation of literal anchors they all contain). Each
+    such position is then touched by some prefilter match, so scanning only
+    these lines yields exactly the findings of a full line-by-line scan.
+
+    Args:
+        content: Whole file content
+        prefilter: Pattern built by combine_patterns()
+
+    Returns:
+        Candidate lines, 1-based numbering as in enumerate(content.split("\\n"), 1)
+    """
+    index = LineIndex(content)
+    touched: set[int] = set()
+    for match in prefilter.finditer(content):
+        touched.update(index.lines_spanned(match.start(), match.end()))
+    if not touched:
+        return []
+    lines = content.split("\n")
+    return [(line_num, lines[line_num - 1]) for line_num in sorted(touched)]
+
+
+# =============================================================================
+# Shared Plugin Tree Index
+# =============================================================================
+
+
+class IndexedFile:
+    """A single file in a PluginTreeIndex with lazily loaded content.
+
+    Stat data comes from the directory scan. Raw bytes are read from disk at
+    most once, and decoded text is cached per error-handling mode, so several
+    validators can inspect the same file without re-reading it.
+
+    Attributes:
+        path: Absolute path to the file
+        rel_path: Path relative to the index root
+        name: File name
+    """
+
+    __slots__ = ("path", "rel_path", "name", "_entry", "_stat", "_raw", "_text")
+
+    def __init__(self, path: Path, rel_path: str, entry: os.DirEntry[str] | None = None) -> None:
+        self.path = path
+        self.rel_path = rel_path
+        self.name = path.name
+        self._entry = entry
+        self._stat: os.stat_result | None = None
+        self._raw: bytes | None = None
+        self._text: dict[str, str] = {}
+
+    @property
+    def suffix(self) -> str:
+        """Lowercased file extension (e.g. '.md')."""
+        return self.path.suffix.lower()
+
+    @property
+    def stat(self) -> os.stat_result:
+        """Stat result (follows symlinks, like Path.stat)."""
+        if self._stat is None:
+            self._stat = self._entry.stat() if self._entry is not None else self.path.stat()
+        return self._stat
+
+    @property
+    def raw(self) -> bytes:
+        """Raw file bytes, read from disk on first access.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        if self._raw is None:
+            with open(self.path, "rb") as f:
+                self._raw = f.read()
+        return self._raw
+
+    def text(self, errors: str = "strict") -> str:
+        """Decode the file as UTF-8 with universal newlines (like open() in text mode).
+
+        Args:
+            errors: Codec error handler ("strict", "ignore", "replace")
+
+        Returns:
+            Decoded file content
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If errors="strict" and the file is not valid UTF-8
+        """
+        cached = self._text.get(errors)
+        if cached is None:
+            cached = self.raw.decode("utf-8", errors)
+            if "\r" in cached:
+                cached = cached.replace("\r\n", "\n").replace("\r", "\n")
+            self._text[errors] = cached
+        return cached
+
+
+class PluginTreeIndex:
+    """Single-pass index of a plugin tree shared by all validators in one run.
+
+    Each directory is scanned at most once and each file is read from disk at
+    most once. Validators walk the index with their own skip rules instead of
+    calling os.walk()/rglob() themselves, so pruning stays per-validator while
+    the I/O is shared. Not thread-safe: the caches fill lazily without
+    locking, so share one index only between validators run one at a time.
+
+    Usage:
+        index = PluginTreeIndex(plugin_root)
+        report = validate_security(plugin_root, index=index)
+        validate_no_absolute_paths(plugin_root, report, index=index)
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        # rel_dir ("" for root) -> (subdir names, file names, subdirs safe to descend into)
+        self._dirs: dict[str, tuple[list[str], list[str], set[str]]] = {}
+        self._files: dict[str, IndexedFile] = {}
+        # Collected on the first exists() call: every file and directory in the
+        # tree, plus the directories the walk lists but never enters (symlinked
+        # dirs and SKIP_DIRS such as node_modules or .git)
+        self._paths: set[str] | None = None
+        self._unwalked_dirs: set[str] = set()
+        # Targets answered from disk (outside the tree or inside an unwalked dir)
+        self._disk_exists: dict[str, bool] = {}
+
+    def _scan(self, rel_dir: str) -> tuple[list[str], list[str], set[str]]:
+        """Scan one directory (cached) and register its files."""
+        listing = self._dirs.get(rel_dir)
+        if listing is not None:
+            return listing
+
+        dirnames: list[str] = []
+        filenames: list[str] = []
+        descendable: set[str] = set()
+        try:
+            with os.scandir(self.root / rel_dir if rel_dir else self.root) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        dirnames.append(entry.name)
+                        # Mirror os.walk(followlinks=False): list symlinked dirs, never enter them
+                        if not entry.is_symlink():
+                            descendable.add(entry.name)
+                    else:
+                        filenames.append(entry.name)
+                        rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                        self._files[rel_path] = IndexedFile(Path(entry.path), rel_path, entry)
+        except OSError:
+            pass
+
+        listing = (dirnames, filenames, descendable)
+        self._dirs[rel_dir] = listing
+        return listing
+
+    def walk(self, skip_dir: Callable[[str], bool] | None = None) -> Iterator[tuple[str, list[str], list[IndexedFile]]]:
+        """Walk the tree top-down in os.walk() order.
+
+        Args:
+            skip_dir: Predicate on a directory name; matching directories are pruned
+
+        Yields:
+            (rel_dir, dirnames, files) for each visited directory
+        """
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            dirnames, filenames, descendable = self._scan(rel_dir)
+            if skip_dir is not None:
+                dirnames = [d for d in dirnames if not skip_dir(d)]
+            files = [self._files[os.path.join(rel_dir, f) if rel_dir else f] for f in filenames]
+            yield rel_dir, dirnames, files
+            for d in reversed(dirnames):
+                if d in descendable:
+                    stack.append(os.path.join(rel_dir, d) if rel_dir else d)
+
+    def iter_files(
+        self,
+        skip_dir: Callable[[str], bool] | None = None,
+        suffixes: set[str] | None = None,
+    ) -> Iterator[IndexedFile]:
+        """Iterate over indexed files in os.walk() order.
+
+        Args:
+            skip_dir: Predicate on a directory name; matching directories are pruned
+            suffixes: If given, only yield files whose (case-sensitive) suffix is listed
+
+        Yields:
+            IndexedFile for each file in the visited directories
+        """
+        for _rel_dir, _dirnames, files in self.walk(skip_dir):
+            for indexed in files:
+                if suffixes is None or indexed.path.suffix in suffixes:
+                    yield indexed
+
+    def get(self, rel_path: str) -> IndexedFile | None:
+        """Look up a file by its path relative to the index root.
+
+        Args:
+            rel_path: Relative path (either separator style)
+
+        Returns:
+            The IndexedFile, or None if it is not a file inside the tree
+        """
+        rel_path = os.path.normpath(rel_path.replace("\\", "/"))
+        indexed = self._files.get(rel_path)
+        if indexed is not None:
+            return indexed
+        parent = os.path.dirname(rel_path)
+        if parent.startswith("..") or os.path.isabs(rel_path):
+            return None
+        # Scan the chain of parent directories on demand
+        parts = parent.split(os.sep) if parent else []
+        for i in range(len(parts) + 1):
+            self._scan(os.path.join(*parts[:i]) if i else "")
+        return self._files.get(rel_path)
+
+    def _collect_paths(self) -> set[str]:
+        """Walk the tree once, pruning SKIP_DIRS, and collect every file and directory path."""
+        if self._paths is None:
+            paths = {""}
+            for rel_dir, dirnames, files in self.walk(SKIP_DIRS.__contains__):
+                # List pruned dirs too; only their contents are left to the disk
+                all_dirnames, _filenames, descendable = self._dirs[rel_dir]
+                for d in all_dirnames:
+                    rel_path = os.path.join(rel_dir, d) if rel_dir else d
+                    paths.add(rel_path)
+                    if d not in descendable or d not in dirnames:
+                        self._unwalked_dirs.add(rel_path)
+                paths.update(indexed.rel_path for indexed in files)
+            self._paths = paths
+        return self._paths
+
+    def exists(self, rel_path: str) -> bool:
+        """Check whether a file or directory exists, without touching the disk.
+
+        The first call walks the tree (reusing every directory already
+        scanned) and collects all paths; later calls are set lookups. Only
+        paths that leave the root or pass through a directory the walk does
+        not enter (a symlinked dir or one of SKIP_DIRS) are checked on disk,
+        once each.
+
+        Args:
+            rel_path: Path relative to the index root (either separator style,
+                may contain "." and ".." segments)
+
+        Returns:
+            True if the path exists
+        """
+        rel_path = os.path.normpath(rel_path.replace("\\", "/"))
+        if rel_path == ".":
+            return True
+        paths = self._collect_paths()
+        if rel_path in paths:
+            return True
+        if not (rel_path.startswith("..") or os.path.isabs(rel_path)):
+            parent = os.path.dirname(rel_path)
+            while parent and parent not in self._unwalked_dirs:
+                parent = os.path.dirname(parent)
+            if not parent:
+                return False
+        cached = self._disk_exists.get(rel_path)
+        if cached is None:
+            cached = self._disk_exists[rel_path] = os.path.exists(os.path.join(self.root, rel_path))
+        return cached
+
+
+def get_tree_index(root_path: Path, index: PluginTreeIndex | None = None) -> PluginTreeIndex:
+    """Return the shared index if it covers root_path, otherwise build a fresh one.
+
+    Args:
+        root_path: Root directory being validated
+        index: Optional shared index passed in by the caller
+
+    Returns:
+        A PluginTreeIndex rooted at root_path
+    """
+    if index is not None and index.root == root_path:
+        return index
+    return PluginTreeIndex(root_path)
+
+
+# =============================================================================
+# Shared Frontmatter Parsing
+# =============================================================================
+# The agent, command, skill, enterprise, plugin and xref validators all parse
+# the same markdown frontmatter. Parsed blocks are memoized by their content,
+# so each block is loaded once per process no matter how many validators (or
+# how many rules within one validator) look at it. yaml is imported on first
+# use to keep it off the startup path of CLIs that never parse frontmatter.
+
+# Frontmatter YAML text -> parsed value, or the YAMLError it raised
+_frontmatter_cache: dict[str, Any] = {}
+_yaml_loader: Any = None
+
+
+def load_frontmatter_yaml(text: str) -> Any:
+    """Parse a frontmatter YAML block, memoized by its content.
+
+    Uses libyaml's CSafeLoader when PyYAML was built with it, falling back to
+    the pure Python SafeLoader. The returned value is shared between callers
+    and must be treated as read-only.
+
+    Args:
+        text: YAML text between the --- markers
+
+    Returns:
+        The parsed value (None for an empty block)
+
+    Raises:
+        yaml.YAMLError: If the block is not valid YAML
+    """
+    global _yaml_loader
+    try:
+        value = _frontmatter_cache[text]
+    except KeyError:
+        import yaml
+
+        if _yaml_loader is None:
+            _yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        try:
+            value = yaml.load(text, Loader=_yaml_loader)
+        except yaml.YAMLError as e:
+            value = e
+        _frontmatter_cache[text] = value
+    if isinstance(value, Exception):
+        raise value.with_traceback(None)
+    return value
+
+
+def parse_frontmatter(content: str) -> tuple[dict[str, Any] | None, str, int]:
+    """Split markdown content into parsed frontmatter and body.
+
+    Args:
+        content: Full markdown file content
+
+    Returns:
+        Tuple of (frontmatter_dict, body_content, frontmatter_end_line)
+        Returns (None, content, 0) if no frontmatter is found or it is invalid YAML
+    """
+    if not content.startswith("---"):
+        return None, content, 0
+
+    # Find closing ---
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        return None, content, 0
+
+    import yaml
+
+    try:
+        frontmatter = load_frontmatter_yaml(parts[1])
+    except yaml.YAMLError:
+        return None, content, 0
+    if frontmatter is None:
+        frontmatter = {}
+    # Count lines to find frontmatter end
+    fm_end_line = parts[0].count("\n") + parts[1].count("\n") + 2
+    return frontmatter, parts[2], fm_end_line
+
+
+# =============================================================================
+# Markdown Heading Anchors
 # =============================================================================
+# Links such as [text](#usage) or [text](guide.md#setup) point at the anchors
+# GitHub generates from heading text. A file's anchor set is built once from
+# its headings (outside code blocks) with GitHub's slug rules, so every
+# fragment can be checked with a set lookup.
 
+# ATX heading (## Text, optionally closed by #s); group 1 is the text
+ATX_HEADING_RE = re.compile(r"^#{1,6}(?:\s+(.*?))?(?:\s+#+)?\s*$")
 
-def get_gitignored_files(root_path: Path) -> set[str]:
-    """Get set of files/directories that are gitignored.
+# Setext underline (=== or ---) turning the line above into a heading
+SETEXT_UNDERLINE_RE = re.compile(r"^(?:=+|-+)$")
 
-    Uses git check-ignore to accurately determine what's ignored,
-    falling back to parsing .gitignore directly if git is not available.
+# Lines that cannot be the text of a setext heading (list items, quotes, tables, rules)
+_SETEXT_BLOCKER_RE = re.compile(r"^(?:[-*+]\s|\d+[.)]\s|>|\||=+$|-+$)")
+
+# Inline markup rendered away before slugging: links/images keep their text, tags vanish
+_HEADING_LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# GitHub keeps letters, digits, underscores, hyphens and spaces (which become hyphens)
+_SLUG_STRIP_RE = re.compile(r"[^\w\- ]")
+
+# Explicit HTML anchors: <a name="x">, <span id="x">
+HTML_ANCHOR_RE = re.compile(r"<[a-zA-Z][^>]*?\s(?:id|name)\s*=\s*[\"']([^\"']+)[\"']")
+
+# Markdown content -> its anchor set
+_anchor_cache: dict[str, frozenset[str]] = {}
+
+
+def markdown_heading(stripped: str, previous: str | None = None) -> str | None:
+    """Return the heading text of a line, or None if it does not complete a heading.
 
     Args:
-        root_path: Root directory to check for .gitignore
+        stripped: A stripped line outside code blocks
+        previous: The stripped line directly above, if it is also outside code
+            blocks; a === or --- underline makes it a setext heading
 
     Returns:
-        Set of relative paths that are gitignored
+        The raw heading text (ATX text, or previous for a setext underline)
     """
-    ignored: set[str] = set()
+    if stripped.startswith("#"):
+        match = ATX_HEADING_RE.match(stripped)
+        return (match.group(1) or "") if match else None
+    if (
+        previous
+        and SETEXT_UNDERLINE_RE.match(stripped)
+        and not _SETEXT_BLOCKER_RE.match(previous)
+        and markdown_heading(previous) is None
+    ):
+        return previous
+    return None
+
+
+def github_slug(text: str) -> str:
+    """Convert heading text to the anchor GitHub generates for it (before de-duplication).
 
-    # Try using git check-ignore for accuracy (respects .gitignore hierarchy)
-    try:
-        result = subprocess.run(
-            ["git", "ls-files", "--ignored", "--exclude-standard", "--others", "--directory"],
-            cwd=root_path,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        if result.returncode == 0:
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    ignored.add(line.rstrip("/"))
-            return ignored
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        pass
+    Args:
+        text: Raw heading text, inline markdown included
 
-    # Fallback: Parse .gitignore directly
-    gitignore_path = root_path / ".gitignore"
-    if gitignore_path.exists():
-        try:
-            patterns = parse_gitignore(gitignore_path)
-            # Scan directory and match patterns
-            for dirpath, dirnames, filenames in os.walk(root_path):
-                rel_dir = Path(dirpath).relative_to(root_path)
-                for name in dirnames + filenames:
-                    rel_path = str(rel_dir / name) if str(rel_dir) != "." else name
-                    if is_path_gitignored(rel_path, patterns):
-                        ignored.add(rel_path)
-        except Exception:
-            pass
+    Returns:
+        The slug: lowercase, punctuation removed, spaces turned into hyphens
+    """
+    text = _HTML_TAG_RE.sub("", _HEADING_LINK_RE.sub(r"\1", text))
+    return _SLUG_STRIP_RE.sub("", text.strip().lower()).replace(" ", "-")
 
-    return ignored
 
+def heading_anchors(headings: Iterable[str], content: str = "") -> set[str]:
+    """Build a file's anchor set from its headings, in document order.
 
-def parse_gitignore(gitignore_path: Path) -> list[str]:
-    """Parse a .gitignore file and return list of patterns.
+    Repeated slugs get -1, -2, ... suffixes, as on GitHub. Explicit HTML
+    anchors found in content are included too.
 
     Args:
-        gitignore_path: Path to .gitignore file
+        headings: Raw heading texts in document order
+        content: File content to scan for HTML id/name anchors
 
     Returns:
-        List of gitignore patterns (comments and empty lines stripped)
+        The set of valid fragments for the file
     """
-    patterns: list[str] = []
-    try:
-        with open(gitignore_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
-                patterns.append(line)
-    except (OSError, UnicodeDecodeError):
-        pass
-    return patterns
+    anchors: set[str] = set()
+    occurrences: dict[str, int] = {}
+    for heading in headings:
+        base = slug = github_slug(heading)
+        while slug in occurrences:
+            occurrences[base] += 1
+            slug = f"{base}-{occurrences[base]}"
+        occurrences[slug] = 0
+        anchors.add(slug)
+    if "<" in content:
+        anchors.update(HTML_ANCHOR_RE.findall(content))
+    return anchors
+
+
+def markdown_anchors(content: str) -> frozenset[str]:
+    """Return the anchor set of markdown content, memoized by content.
+
+    For callers without a tokenized document; headings inside fenced code
+    blocks are ignored.
 
+    Args:
+        content: Markdown file content
 
-def is_path_gitignored(rel_path: str, patterns: list[str]) -> bool:
-    """Check if a relative path matches any gitignore pattern.
+    Returns:
+        The set of valid fragments for the file
+    """
+    anchors = _anchor_cache.get(content)
+    if anchors is None:
+        headings: list[str] = []
+        in_code_block = False
+        previous: str | None = None
+        for line in content.split("\n"):
+            stripped = line.strip()
+            if stripped.startswith("```"):
+                in_code_block = not in_code_block
+                previous = None
+                continue
+            if in_code_block:
+                continue
+            heading = markdown_heading(stripped, previous)
+            if heading is not None:
+                headings.append(heading)
+            # A setext underline is consumed by its heading
+            previous = None if heading is not None and heading is previous else stripped
+        anchors = _anchor_cache[content] = frozenset(heading_anchors(headings, content))
+    return anchors
+
+
+def has_anchor(anchors: set[str] | frozenset[str], fragment: str) -> bool:
+    """Check a link fragment (the part after #) against a file's anchor set.
+
+    Like GitHub, the fragment is percent-decoded, matched case-insensitively
+    and may carry the "user-content-" prefix; "top" always points at the
+    top of the page.
 
     Args:
-        rel_path: Relative path to check
-        patterns: List of gitignore patterns
+        anchors: The target file's anchor set
+        fragment: Link fragment without the #
 
     Returns:
-        True if path matches any pattern
+        True if the fragment resolves to an anchor
     """
-    # Normalize path separators
-    rel_path = rel_path.replace("\\", "/")
-    path_parts = rel_path.split("/")
+    if "%" in fragment:
+        from urllib.parse import unquote
 
-    for pattern in patterns:
-        # Handle negation (!) - not fully implemented, just skip
-        if pattern.startswith("!"):
-            continue
+        fragment = unquote(fragment)
+    fragment = fragment.removeprefix("user-content-")
+    return fragment in anchors or fragment.lower() in anchors or fragment.lower() == "top"
 
-        # Handle directory-only patterns (ending with /)
-        is_dir_pattern = pattern.endswith("/")
-        if is_dir_pattern:
-            pattern = pattern[:-1]
-
-        # Handle patterns starting with /
-        is_anchored = pattern.startswith("/")
-        if is_anchored:
-            pattern = pattern[1:]
-
-        # Convert gitignore pattern to fnmatch pattern
-        # Handle ** for directory matching
-        if "**" in pattern:
-            # Simplified: treat ** as matching any path
-            pattern = pattern.replace("**/", "*/").replace("/**", "/*")
-
-        # Check if pattern matches any component or the full path
-        if is_anchored:
-            # Anchored patterns only match from root
-            if fnmatch.fnmatch(rel_path, pattern):
-                return True
-        else:
-            # Non-anchored patterns can match any component
-            if fnmatch.fnmatch(rel_path, pattern):
-                return True
-            # Also check if any path component matches
-            for part in path_parts:
-                if fnmatch.fnmatch(part, pattern):
-                    return True
 
-    return False
+# =============================================================================
+# Incremental Validation Cache
+# =============================================================================
+# Per-file results keyed by validator name, validator version and a hash of the
+# file content (plus anything else the results depend on). On a re-run only
+# changed files are validated again; cached findings are replayed for the rest.
+
+RESULT_CACHE_FORMAT = 1
 
+# Override the cache location (default: $XDG_CACHE_HOME/claude-plugin-validation)
+RESULT_CACHE_DIR_ENV = "CLAUDE_VALIDATION_CACHE_DIR"
+
+_validator_versions: dict[tuple[str, ...], str] = {}
 
-def get_skip_dirs_with_gitignore(root_path: Path, additional_skip: set[str] | None = None) -> set[str]:
-    """Get combined set of directories to skip (built-in + gitignored).
+
+def validator_version(*module_files: str) -> str:
+    """Fingerprint validator source code, so any code change invalidates its cached results.
 
     Args:
-        root_path: Root directory to check for .gitignore
-        additional_skip: Additional directories to skip
+        module_files: Source files of the validator (this module is always included)
 
     Returns:
-        Combined set of directory names to skip
+        Short hex digest of the sources
     """
-    dirs_to_skip = set(PRIVATE_INFO_SKIP_DIRS)
-    if additional_skip:
-        dirs_to_skip.update(additional_skip)
+    key = (*module_files, __file__)
+    if key not in _validator_versions:
+        digest = hashlib.sha256()
+        for module_file in key:
+            digest.update(Path(module_file).read_bytes())
+        _validator_versions[key] = digest.hexdigest()[:16]
+    return _validator_versions[key]
 
-    # Add gitignored directories
-    gitignored = get_gitignored_files(root_path)
-    for path in gitignored:
-        # Add both the full path and just the directory name
-        dirs_to_skip.add(path)
-        if "/" in path:
-            dirs_to_skip.add(path.split("/")[-1])
 
-    return dirs_to_skip
+def cache_file_path(plugin_root: Path, name: str, cache_dir: Path | None = None) -> Path:
+    """Location of a per-plugin cache file.
+
+    Args:
+        plugin_root: Plugin root the cached data belongs to
+        name: Cache kind, used as the file name prefix
+        cache_dir: Cache directory (default: $CLAUDE_VALIDATION_CACHE_DIR or
+            $XDG_CACHE_HOME/claude-plugin-validation)
+
+    Returns:
+        Path of the JSON cache file for this plugin root
+    """
+    if cache_dir is None:
+        env_dir = os.environ.get(RESULT_CACHE_DIR_ENV)
+        xdg = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+        cache_dir = Path(env_dir) if env_dir else Path(xdg) / "claude-plugin-validation"
+    root_id = hashlib.sha256(str(plugin_root.resolve()).encode("utf-8", "surrogateescape")).hexdigest()[:16]
+    return cache_dir / f"{name}-{root_id}.json"
+
+
+class ResultCache:
+    """On-disk cache of per-file validation results for one plugin root.
+
+    Usage:
+        cache = ResultCache(plugin_root)
+        key = cache.key("security", version, rel_path, content)
+        entry = cache.get(key)
+        if entry is None:
+            ...validate, then cache.put(key, "security", new_results, data)
+        else:
+            cache.replay(entry, report.append, ValidationResult)
+        cache.save()
+    """
+
+    def __init__(self, plugin_root: Path, cache_dir: Path | None = None) -> None:
+        self.path = cache_file_path(plugin_root, "results", cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._touched: set[str] = set()
+        self._validators: set[str] = set()
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("format") == RESULT_CACHE_FORMAT and isinstance(data.get("entries"), dict):
+                self._entries = data["entries"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    @staticmethod
+    def key(validator: str, version: str, *parts: str | bytes) -> str:
+        """Build a cache key from validator identity and everything the results depend on."""
+        digest = hashlib.sha256(f"{validator}\0{version}".encode())
+        for part in parts:
+            data = part.encode("utf-8", "surrogateescape") if isinstance(part, str) else part
+            digest.update(b"\0%d\0" % len(data))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached entry for key, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touched.add(key)
+        self._validators.add(entry["validator"])
+        return entry
+
+    def put(self, key: str, validator: str, results: list[Any], data: dict[str, Any] | None = None) -> None:
+        """Store a file's results (dataclass instances) and any extra JSON data."""
+        self._entries[key] = {
+            "validator": validator,
+            "results": [asdict(r) for r in results],
+            "data": data or {},
+        }
+        self._touched.add(key)
+        self._validators.add(validator)
+
+    @staticmethod
+    def replay(entry: dict[str, Any], append: Callable[[Any], None], result_cls: type) -> None:
+        """Feed an entry's cached results to a report's append method."""
+        for r in entry["results"]:
+            append(result_cls(**r))
+
+    def save(self) -> None:
+        """Write the cache, dropping stale entries of the validators used in this run."""
+        entries = {
+            k: v for k, v in self._entries.items() if k in self._touched or v["validator"] not in self._validators
+        }
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps({"format": RESULT_CACHE_FORMAT, "entries": entries}), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            # Caching is best-effort; never fail a validation run over it
+            tmp.unlink(missing_ok=True)
+
+
+# =============================================================================
+# Changed-Files Scope (--changed-since)
+# =============================================================================
+# Validators given a ChangeScope only check the files changed since a git
+# revision plus the files that reference them, so a push touching one skill
+# does not re-validate the whole plugin.
+
+# Extensions searched for references to changed files
+REFERENCE_EXTENSIONS = {".md", ".json", ".yml", ".yaml", ".py", ".sh", ".js", ".ts", ".toml"}
+
+
+def _reference_needles(rel_path: str) -> list[str]:
+    """Strings whose presence in another file marks it as referencing rel_path.
+
+    Links are usually relative, so the last two path components are used
+    rather than the full path. Agents, commands and skills are also
+    referenced by name (subagent_type, slash commands, skills/<name>), and
+    Python modules by the import statements that load them.
+    """
+    parts = rel_path.split("/")
+    needles = ["/".join(parts[-2:])] if len(parts) > 1 else []
+    if parts[-1].endswith(".py"):
+        module = parts[-1][: -len(".py")]
+        if module == "__init__" and len(parts) > 1:
+            module = parts[-2]
+        needles.extend((f"import {module}", f"from {module} import", f"from .{module} import"))
+    if len(parts) == 2 and parts[0] in ("agents", "commands") and parts[1].endswith(".md"):
+        needles.append(parts[1][: -len(".md")])
+    elif len(parts) > 2 and parts[0] == "skills":
+        needles.append(f"skills/{parts[1]}")
+        needles.append(parts[1])
+    elif len(parts) == 1:
+        needles.append(parts[0])
+    return needles
+
+
+class ChangeScope:
+    """The files a --changed-since run validates.
+
+    Attributes:
+        since: Git revision the work tree was compared against
+        changed: Files changed since the revision, including deleted and untracked files
+        files: changed plus the files that reference one of them
+    """
+
+    __slots__ = ("since", "changed", "files", "_dirs")
+
+    def __init__(self, since: str, changed: set[str], files: set[str]) -> None:
+        self.since = since
+        self.changed = changed
+        self.files = files
+        # Every ancestor directory of an in-scope file, for touches()
+        self._dirs: set[str] = set()
+        for rel_path in files:
+            parent = rel_path.rpartition("/")[0]
+            while parent and parent not in self._dirs:
+                self._dirs.add(parent)
+                parent = parent.rpartition("/")[0]
+
+    def includes(self, rel_path: str) -> bool:
+        """Check whether a file (path relative to the root) is in scope."""
+        return rel_path.replace("\\", "/") in self.files
+
+    def touches(self, rel_dir: str) -> bool:
+        """Check whether any in-scope file lies under a directory (relative to the root)."""
+        return rel_dir.replace("\\", "/").strip("/") in self._dirs
+
+
+def get_change_scope(root_path: Path, since: str, index: PluginTreeIndex | None = None) -> ChangeScope:
+    """Collect the files changed since a git revision and the files referencing them.
+
+    Changed files come from "git diff --name-only <since>" (committed and
+    uncommitted changes) plus untracked, non-ignored files. A file that
+    mentions a changed file (see _reference_needles) is added as a dependent
+    so cross-reference checks still run on it.
+
+    Args:
+        root_path: Plugin root inside a git work tree
+        since: Any revision git understands (commit, branch, tag, HEAD~3)
+        index: Shared tree index for this run (built on demand if omitted)
+
+    Returns:
+        ChangeScope for root_path
+
+    Raises:
+        ValueError: If git is unavailable or the revision cannot be diffed
+    """
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--name-only", "--relative", "-z", since, "--"],
+            cwd=root_path,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
+        raise ValueError(f"cannot run git diff in {root_path}: {e}") from e
+    if result.returncode != 0:
+        raise ValueError(f"git diff {since} failed: {result.stderr.strip()}")
+
+    changed = {rel_path for rel_path in result.stdout.split("\0") if rel_path}
+    listing = get_git_listing(root_path)
+    if listing is not None:
+        changed.update(listing.untracked)
+
+    files = set(changed)
+    if not changed:
+        return ChangeScope(since, changed, files)
+
+    global_needles: set[str] = set()
+    siblings: dict[str, set[str]] = {}
+    for rel_path in changed:
+        parent, _, name = rel_path.rpartition("/")
+        siblings.setdefault(parent, set()).add(name)
+        global_needles.update(_reference_needles(rel_path))
+
+    alternation = "|".join(re.escape(needle) for needle in sorted(global_needles, key=len, reverse=True))
+    needle_re = re.compile(rf"(?<![\w-])(?:{alternation})(?![\w-])")
+    tree = get_tree_index(root_path, index)
+    for indexed in tree.iter_files(skip_dir=SKIP_DIRS.__contains__):
+        rel_path = indexed.rel_path
+        if rel_path in files or indexed.suffix not in REFERENCE_EXTENSIONS:
+            continue
+        try:
+            content = indexed.text(errors="ignore")
+        except OSError:
+            continue
+        if needle_re.search(content):
+            files.add(rel_path)
+            continue
+        # Same-directory links may use the bare file name
+        parent = rel_path.rpartition("/")[0]
+        if any(name in content for name in siblings.get(parent, ())):
+            files.add(rel_path)
+    return ChangeScope(since, changed, files)
 
 
 # =============================================================================
@@ -656,10 +2046,15 @@ MAX_BODY_WORDS = 2000
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Single validation check result.
 
+    Slotted, with level, file and phase interned: large scans create
+    hundreds of thousands of results, mostly repeating a few levels and
+    file paths, and these would otherwise each carry a __dict__ and their
+    own copy of the path string.
+
     Attributes:
         level: Severity level (CRITICAL, MAJOR, MINOR, INFO, PASSED)
         message: Human-readable description of the result
@@ -668,6 +2063,8 @@ class ValidationResult:
         phase: Optional validation phase (structure, semantic, security, cross-reference)
         fixable: Whether this issue can be auto-fixed
         fix_id: Identifier for the fix function (if fixable)
+        category: Optional report grouping (e.g. "Frontmatter", "Token Budget")
+        suggestion: Optional hint on how to resolve the issue
     """
 
     level: Level
@@ -677,6 +2074,17 @@ class ValidationResult:
     phase: str | None = None
     fixable: bool = False
     fix_id: str | None = None
+    category: str | None = None
+    suggestion: str | None = None
+
+    def __post_init__(self) -> None:
+        self.level = sys.intern(self.level)  # type: ignore[assignment]
+        if self.file is not None:
+            self.file = sys.intern(self.file)
+        if self.phase is not None:
+            self.phase = sys.intern(self.phase)
+        if self.category is not None:
+            self.category = sys.intern(self.category)
 
     def to_dict(self) -> dict[str, str | int | bool | None]:
         """Convert to dictionary for JSON serialization."""
@@ -691,6 +2099,10 @@ class ValidationResult:
             result["fixable"] = self.fixable
             if self.fix_id:
                 result["fix_id"] = self.fix_id
+        if self.category is not None:
+            result["category"] = self.category
+        if self.suggestion is not None:
+            result["suggestion"] = self.suggestion
         return result
 
 
@@ -723,24 +2135,208 @@ class FixableIssue:
         return self.fix_func(self.result.file, self.result.line)
 
 
+# =============================================================================
+# Streaming Result Output (NDJSON)
+# =============================================================================
+
+# Score deduction per result level (INFO and PASSED don't affect the score)
+LEVEL_PENALTIES: dict[str, int] = {"CRITICAL": 25, "MAJOR": 10, "MINOR": 3}
+
+
+def score_from_counts(counts: dict[str, int]) -> int:
+    """Compute the 0-100 health score from per-level result counts.
+
+    Args:
+        counts: Number of results per level
+
+    Returns:
+        100 minus the level penalties, floored at 0
+    """
+    return max(0, 100 - sum(penalty * counts.get(level, 0) for level, penalty in LEVEL_PENALTIES.items()))
+
+
+def exit_code_from_counts(counts: dict[str, int]) -> int:
+    """Compute the exit code for the highest severity level present.
+
+    Args:
+        counts: Number of results per level
+
+    Returns:
+        EXIT_CRITICAL, EXIT_MAJOR, EXIT_MINOR or EXIT_OK
+    """
+    if counts.get("CRITICAL"):
+        return EXIT_CRITICAL
+    if counts.get("MAJOR"):
+        return EXIT_MAJOR
+    if counts.get("MINOR"):
+        return EXIT_MINOR
+    return EXIT_OK
+
+
+class NDJSONSink:
+    """Streams validation results as newline-delimited JSON.
+
+    Each result is written (and flushed) as one record the moment it is
+    added to a report, so consumers see findings while the run is still
+    going. close() ends the stream with a single summary record. Counts
+    and score are kept incrementally, so the summary never needs the
+    full results list.
+
+    Record shapes:
+        {"type": "result", "validator": ..., "level": ..., "message": ..., ...}
+        {"type": "summary", "score": ..., "grade": ..., "exit_code": ..., "counts": {...}}
+
+    Attributes:
+        stream: Text stream records are written to (default: stdout)
+        validator: Optional validator name stamped on every result record
+        counts: Running number of results per level
+    """
+
+    __slots__ = ("stream", "validator", "counts", "_closed")
+
+    def __init__(self, stream: TextIO | None = None, validator: str | None = None) -> None:
+        self.stream = stream if stream is not None else sys.stdout
+        self.validator = validator
+        self.counts: dict[str, int] = {"CRITICAL": 0, "MAJOR": 0, "MINOR": 0, "INFO": 0, "PASSED": 0}
+        self._closed = False
+
+    def write(self, result: ValidationResult, validator: str | None = None) -> None:
+        """Write one result record.
+
+        Args:
+            result: The result to stream
+            validator: Validator name for this record (overrides the sink default)
+        """
+        record: dict[str, Any] = {"type": "result"}
+        name = validator or self.validator
+        if name is not None:
+            record["validator"] = name
+        record.update(result.to_dict())
+        self.stream.write(json.dumps(record) + "\n")
+        self.stream.flush()
+        self.counts[result.level] = self.counts.get(result.level, 0) + 1
+
+    def write_all(self, results: Iterable[ValidationResult], validator: str | None = None) -> None:
+        """Write a record for each result, in order."""
+        for result in results:
+            self.write(result, validator)
+
+    @property
+    def score(self) -> int:
+        """Health score (0-100) of everything streamed so far."""
+        return score_from_counts(self.counts)
+
+    @property
+    def exit_code(self) -> int:
+        """Exit code for everything streamed so far."""
+        return exit_code_from_counts(self.counts)
+
+    def close(self, extra: dict[str, Any] | None = None) -> None:
+        """Write the summary record. Further calls do nothing.
+
+        Args:
+            extra: Additional fields for the summary record (e.g. plugin_path)
+        """
+        if self._closed:
+            return
+        self._closed = True
+        summary: dict[str, Any] = {
+            "type": "summary",
+            "score": self.score,
+            "grade": calculate_letter_grade(self.score),
+            "exit_code": self.exit_code,
+            "counts": dict(self.counts),
+        }
+        if extra:
+            summary.update(extra)
+        self.stream.write(json.dumps(summary) + "\n")
+        self.stream.flush()
+
+
 @dataclass
 class ValidationReport:
     """Complete validation report with results collection and scoring.
 
-    This is the base class that all validators should use (or extend).
-    Provides consistent methods for adding results and computing scores.
+    This is the report type shared by all validators (extended with extra
+    fields where a validator needs them). Provides consistent methods for
+    adding results and computing scores.
 
     Supports:
     - Error accumulation (collect all errors before reporting)
     - Fixable issues registration and auto-fix application
     - Multi-phase validation tracking
     - Partial validation (return valid items even when some fail)
+    - Streaming output (every result is forwarded to an optional NDJSONSink)
+    - Zero-copy merging (child reports are chained, not copied)
+
+    Per-level counts and the score are maintained as results are added, so
+    has_critical, exit_code, score and count_by_level are O(1). Results must
+    therefore be added through add()/append()/extend()/merge()/splice(), not
+    by mutating the results list directly. With keep_passed_info=False,
+    PASSED and INFO results are only counted (and streamed), not stored.
+
+    merge() and splice() chain the other report at a position of this
+    report's own results instead of copying its results; iter_results()
+    walks the chain in order. Reading the results attribute flattens the
+    chain once into a plain list. A report must not be modified after it has
+    been merged into another one, as the parent's counts would go stale.
     """
 
-    results: list[ValidationResult] = field(default_factory=list)
     fixable_issues: list[FixableIssue] = field(default_factory=list)
     valid_items: list[Any] = field(default_factory=list)
     failed_items: list[Any] = field(default_factory=list)
+    sink: NDJSONSink | None = field(default=None, repr=False, compare=False)
+    keep_passed_info: bool = field(default=True, repr=False, compare=False)
+    _results: list[ValidationResult] = field(init=False, default_factory=list, repr=False)
+    _children: list[tuple[int, ValidationReport]] = field(init=False, default_factory=list, repr=False, compare=False)
+    _counts: dict[str, int] = field(init=False, repr=False, compare=False)
+    _penalty: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._counts = {"CRITICAL": 0, "MAJOR": 0, "MINOR": 0, "INFO": 0, "PASSED": 0}
+        self._penalty = 0
+
+    def _count(self, level: str, n: int) -> None:
+        self._counts[level] = self._counts.get(level, 0) + n
+        self._penalty += LEVEL_PENALTIES.get(level, 0) * n
+
+    @property
+    def results(self) -> list[ValidationResult]:
+        """All stored results in order, including those of merged reports.
+
+        The first access after a merge flattens the chained reports into this
+        report's own list; iterate with iter_results() to avoid the copy.
+        """
+        if self._children:
+            self._results = list(self.iter_results())
+            self._children = []
+        return self._results
+
+    def iter_results(self) -> Iterator[ValidationResult]:
+        """Yield all stored results in order, walking merged reports in place."""
+        own = iter(self._results)
+        start = 0
+        for position, child in self._children:
+            yield from islice(own, position - start)
+            start = position
+            if self.keep_passed_info:
+                yield from child.iter_results()
+            else:
+                yield from (r for r in child.iter_results() if r.level not in ("PASSED", "INFO"))
+        yield from own
+
+    def append(self, result: ValidationResult) -> None:
+        """Record a result object, forwarding it to the sink if one is attached."""
+        self._count(result.level, 1)
+        if self.keep_passed_info or result.level not in ("PASSED", "INFO"):
+            self._results.append(result)
+        if self.sink is not None:
+            self.sink.write(result)
+
+    def extend(self, results: Iterable[ValidationResult]) -> None:
+        """Record several result objects, in order."""
+        for result in results:
+            self.append(result)
 
     def add(
         self,
@@ -751,9 +2347,11 @@ class ValidationReport:
         phase: str | None = None,
         fixable: bool = False,
         fix_id: str | None = None,
+        category: str | None = None,
+        suggestion: str | None = None,
     ) -> None:
         """Add a validation result."""
-        self.results.append(ValidationResult(level, message, file, line, phase, fixable, fix_id))
+        self.append(ValidationResult(level, message, file, line, phase, fixable, fix_id, category, suggestion))
 
     def passed(self, message: str, file: str | None = None) -> None:
         """Add a passed check."""
@@ -778,28 +2376,22 @@ class ValidationReport:
     @property
     def has_critical(self) -> bool:
         """Check if any CRITICAL issues exist."""
-        return any(r.level == "CRITICAL" for r in self.results)
+        return self._counts["CRITICAL"] > 0
 
     @property
     def has_major(self) -> bool:
         """Check if any MAJOR issues exist."""
-        return any(r.level == "MAJOR" for r in self.results)
+        return self._counts["MAJOR"] > 0
 
     @property
     def has_minor(self) -> bool:
         """Check if any MINOR issues exist."""
-        return any(r.level == "MINOR" for r in self.results)
+        return self._counts["MINOR"] > 0
 
     @property
     def exit_code(self) -> int:
         """Get appropriate exit code based on highest severity issue."""
-        if self.has_critical:
-            return EXIT_CRITICAL
-        if self.has_major:
-            return EXIT_MAJOR
-        if self.has_minor:
-            return EXIT_MINOR
-        return EXIT_OK
+        return exit_code_from_counts(self._counts)
 
     @property
     def score(self) -> int:
@@ -812,26 +2404,35 @@ class ValidationReport:
         - Deduct 3 for each MINOR
         - INFO and PASSED don't affect score
         """
-        score = 100
-        for r in self.results:
-            if r.level == "CRITICAL":
-                score -= 25
-            elif r.level == "MAJOR":
-                score -= 10
-            elif r.level == "MINOR":
-                score -= 3
-        return max(0, score)
+        return max(0, 100 - self._penalty)
 
     def count_by_level(self) -> dict[str, int]:
         """Get count of results by level."""
-        counts: dict[str, int] = {"CRITICAL": 0, "MAJOR": 0, "MINOR": 0, "INFO": 0, "PASSED": 0}
-        for r in self.results:
-            counts[r.level] = counts.get(r.level, 0) + 1
-        return counts
+        return dict(self._counts)
+
+    def splice(self, position: int, other: ValidationReport) -> None:
+        """Chain another report's results in before own result number position.
+
+        Nothing is copied: counts (including PASSED/INFO results the other
+        report only counted) are combined directly, and its results are read
+        in place by iter_results(). Reports spliced at the same position keep
+        the order they were spliced in. Results are forwarded to this
+        report's sink unless the other report already streamed them to it.
 
-    def merge(self, other: "ValidationReport") -> None:
-        """Merge results from another report into this one."""
-        self.results.extend(other.results)
+        Args:
+            position: Index into this report's own results (as stored when
+                the position was taken, e.g. len(report.results))
+            other: The report to chain; it must not be modified afterwards
+        """
+        for level, n in other._counts.items():
+            self._count(level, n)
+        self._children.insert(bisect_right(self._children, position, key=lambda c: c[0]), (position, other))
+        if self.sink is not None and other.sink is not self.sink:
+            self.sink.write_all(other.iter_results())
+
+    def merge(self, other: ValidationReport) -> None:
+        """Merge results from another report into this one (see splice())."""
+        self.splice(len(self._results), other)
 
     def to_dict(self) -> dict[str, object]:
         """Convert to dictionary for JSON serialization."""
@@ -841,7 +2442,7 @@ class ValidationReport:
             "grade": calculate_letter_grade(self.score),
             "exit_code": self.exit_code,
             "counts": counts,
-            "results": [r.to_dict() for r in self.results],
+            "results": [r.to_dict() for r in self.iter_results()],
             "fixable_count": len(self.fixable_issues),
             "valid_items_count": len(self.valid_items),
             "failed_items_count": len(self.failed_items),
@@ -868,7 +2469,7 @@ class ValidationReport:
         Returns:
             List of all error-level results, excluding INFO and PASSED
         """
-        return [r for r in self.results if r.level in ("CRITICAL", "MAJOR", "MINOR")]
+        return [r for r in self.iter_results() if r.level in ("CRITICAL", "MAJOR", "MINOR")]
 
     def get_errors_by_level(self, level: Level) -> list[ValidationResult]:
         """Get all results of a specific level.
@@ -879,7 +2480,7 @@ class ValidationReport:
         Returns:
             List of results matching the specified level
         """
-        return [r for r in self.results if r.level == level]
+        return [r for r in self.iter_results() if r.level == level]
 
     def get_errors_by_phase(self, phase: str) -> list[ValidationResult]:
         """Get all errors from a specific validation phase.
@@ -890,7 +2491,7 @@ class ValidationReport:
         Returns:
             List of error results from the specified phase
         """
-        return [r for r in self.results if r.phase == phase and r.level in ("CRITICAL", "MAJOR", "MINOR")]
+        return [r for r in self.iter_results() if r.phase == phase and r.level in ("CRITICAL", "MAJOR", "MINOR")]
 
     # =========================================================================
     # Partial Validation Support Methods
@@ -966,7 +2567,7 @@ class ValidationReport:
             fixable=True,
             fix_id=fix_id,
         )
-        self.results.append(result)
+        self.append(result)
 
         # Register the fixable issue
         fixable = FixableIssue(
@@ -1325,7 +2926,7 @@ def print_results_by_level(report: ValidationReport, verbose: bool = False) -> N
         "PASSED": [],
     }
 
-    for result in report.results:
+    for result in report.iter_results():
         by_level[result.level].append(result)
 
     # Print each level
@@ -1402,6 +3003,7 @@ def scan_file_for_private_info(
     report: ValidationReport,
     rel_path: str,
     additional_usernames: set[str] | None = None,
+    content: str | None = None,
 ) -> int:
     """Scan a single file for private information (usernames, home paths).
 
@@ -1410,38 +3012,38 @@ def scan_file_for_private_info(
         report: ValidationReport to add results to
         rel_path: Relative path for error messages
         additional_usernames: Extra usernames to check beyond defaults
+        content: Already-loaded file text (read from filepath if omitted)
 
     Returns:
         Number of issues found
     """
     issues_found = 0
 
-    # Build patterns including any additional usernames
-    patterns = list(PRIVATE_PATH_PATTERNS)
-    if additional_usernames:
-        patterns.extend(build_private_path_patterns(additional_usernames))
-
-    try:
-        content = filepath.read_text(errors="ignore")
-    except Exception:
-        return 0
+    # Cached matcher covering the default and any additional usernames
+    matcher = get_private_path_matcher(get_private_usernames() | set(additional_usernames or ()))
 
-    for pattern, desc in patterns:
-        for match in pattern.finditer(content):
-            matched_text = match.group(0)
-            line_num = content[: match.start()].count("\n") + 1
-            issues_found += 1
-            report.critical(
-                f"Private info leaked: {desc} - found '{matched_text}' "
-                "(replace with relative path or ${CLAUDE_PLUGIN_ROOT})",
-                rel_path,
-                line_num,
-            )
+    if content is None:
+        try:
+            content = filepath.read_text(errors="ignore")
+        except Exception:
+            return 0
+
+    lines = LineIndex(content)
+    for match, desc in matcher.finditer(content):
+        matched_text = match.group(0)
+        line_num = lines.line_of(match.start())
+        issues_found += 1
+        report.critical(
+            f"Private info leaked: {desc} - found '{matched_text}' "
+            "(replace with relative path or ${CLAUDE_PLUGIN_ROOT})",
+            rel_path,
+            line_num,
+        )
 
     # Also check for generic home path patterns (MAJOR, not CRITICAL)
     # But only if no specific username was found
     if issues_found == 0:
-        for pattern in USER_PATH_PATTERNS:
+        for pattern in _lazy_constant("USER_PATH_PATTERNS"):
             for match in pattern.finditer(content):
                 matched_text = match.group(0)
 
@@ -1462,7 +3064,7 @@ def scan_file_for_private_info(
                     if extracted_username in EXAMPLE_USERNAMES:
                         continue
 
-                line_num = content[: match.start()].count("\n") + 1
+                line_num = lines.line_of(match.start())
                 issues_found += 1
                 report.major(
                     f"Hardcoded user path found: '{matched_text}...' (use relative paths or ${{CLAUDE_PLUGIN_ROOT}})",
@@ -1473,12 +3075,53 @@ def scan_file_for_private_info(
     return issues_found
 
 
+def _iter_scan_files(
+    root_path: Path,
+    tree: PluginTreeIndex,
+    dirs_to_skip: set[str],
+    gitignore: GitignoreMatcher | None,
+    scope: ChangeScope | None = None,
+) -> Iterator[IndexedFile]:
+    """Yield the files a directory scan should visit.
+
+    With a change scope only its files are visited. Otherwise, when gitignore
+    rules apply and git can list the work tree, the files come from the cached
+    git ls-files output instead of a directory walk. The same skip-dir and
+    gitignore filters are applied either way.
+    """
+    listed: list[str] | None
+    if scope is not None:
+        listed = sorted(scope.files)
+    else:
+        listing = get_git_listing(root_path) if gitignore is not None else None
+        listed = listing.files if listing is not None else None
+    if listed is None:
+        for indexed in tree.iter_files(skip_dir=dirs_to_skip.__contains__):
+            if gitignore is not None and gitignore.is_ignored(indexed.rel_path):
+                continue
+            yield indexed
+        return
+
+    for rel_path in listed:
+        parent_dirs = rel_path.split("/")[:-1]
+        if any(part in dirs_to_skip for part in parent_dirs):
+            continue
+        if gitignore is not None and gitignore.is_ignored(rel_path):
+            continue
+        # Skips index entries deleted from disk and symlinked directories
+        listed_file = tree.get(rel_path)
+        if listed_file is not None:
+            yield listed_file
+
+
 def scan_directory_for_private_info(
     root_path: Path,
     report: ValidationReport,
     additional_usernames: set[str] | None = None,
     skip_dirs: set[str] | None = None,
     respect_gitignore: bool = True,
+    index: PluginTreeIndex | None = None,
+    scope: ChangeScope | None = None,
 ) -> tuple[int, int]:
     """Scan a directory tree for private information.
 
@@ -1488,6 +3131,8 @@ def scan_directory_for_private_info(
         additional_usernames: Extra usernames to check beyond defaults
         skip_dirs: Additional directories to skip
         respect_gitignore: If True, skip files/dirs listed in .gitignore
+        index: Shared tree index for this run (built on demand if omitted)
+        scope: Optional change scope; only files in it are scanned
 
     Returns:
         Tuple of (files_checked, issues_found)
@@ -1498,35 +3143,31 @@ def scan_directory_for_private_info(
     # Combine skip dirs (includes gitignored dirs if respect_gitignore=True)
     if respect_gitignore:
         dirs_to_skip = get_skip_dirs_with_gitignore(root_path, skip_dirs)
-        gitignore_patterns = parse_gitignore(root_path / ".gitignore") if (root_path / ".gitignore").exists() else []
+        gitignore: GitignoreMatcher | None = get_gitignore_matcher(root_path)
     else:
         dirs_to_skip = set(PRIVATE_INFO_SKIP_DIRS)
         if skip_dirs:
             dirs_to_skip.update(skip_dirs)
-        gitignore_patterns = []
-
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        # Skip excluded directories
-        dirnames[:] = [d for d in dirnames if d not in dirs_to_skip]
+        gitignore = None
 
-        rel_dir = Path(dirpath).relative_to(root_path)
+    tree = get_tree_index(root_path, index)
+    # Skip excluded directories (including gitignored) and gitignored files
+    for indexed in _iter_scan_files(root_path, tree, dirs_to_skip, gitignore, scope):
+        rel_path = indexed.rel_path
 
-        for filename in filenames:
-            filepath = Path(dirpath) / filename
-            rel_path = str(rel_dir / filename) if str(rel_dir) != "." else filename
-
-            # Skip gitignored files
-            if respect_gitignore and gitignore_patterns and is_path_gitignored(rel_path, gitignore_patterns):
-                continue
+        # Check only relevant file types
+        if indexed.suffix not in SCANNABLE_EXTENSIONS:
+            continue
 
-            # Check only relevant file types
-            if filepath.suffix.lower() not in SCANNABLE_EXTENSIONS:
-                continue
+        files_checked += 1
 
-            files_checked += 1
+        try:
+            content = indexed.text(errors="ignore")
+        except OSError:
+            continue
 
-            issues = scan_file_for_private_info(filepath, report, rel_path, additional_usernames)
-            total_issues += issues
+        issues = scan_file_for_private_info(indexed.path, report, rel_path, additional_usernames, content)
+        total_issues += issues
 
     return files_checked, total_issues
 
@@ -1535,6 +3176,8 @@ def validate_no_private_info(
     root_path: Path,
     report: ValidationReport,
     additional_usernames: set[str] | None = None,
+    index: PluginTreeIndex | None = None,
+    scope: ChangeScope | None = None,
 ) -> None:
     """Validate that a directory contains no private information.
 
@@ -1548,8 +3191,12 @@ def validate_no_private_info(
         root_path: Root directory to scan
         report: ValidationReport to add results to
         additional_usernames: Extra usernames to check beyond PRIVATE_USERNAMES
+        index: Shared tree index for this run (built on demand if omitted)
+        scope: Optional change scope; only files in it are scanned
     """
-    files_checked, issues_found = scan_directory_for_private_info(root_path, report, additional_usernames)
+    files_checked, issues_found = scan_directory_for_private_info(
+        root_path, report, additional_usernames, index=index, scope=scope
+    )
 
     if issues_found == 0:
         report.passed(f"No private info found ({files_checked} files checked)")
@@ -1561,6 +3208,7 @@ def scan_file_for_absolute_paths(
     filepath: Path,
     report: ValidationReport,
     rel_path: str,
+    content: str | None = None,
 ) -> int:
     """Scan a file for ANY absolute paths (stricter plugin validation).
 
@@ -1571,32 +3219,33 @@ def scan_file_for_absolute_paths(
         filepath: Absolute path to the file
         report: ValidationReport to add results to
         rel_path: Relative path for error messages
+        content: Already-loaded file text (read from filepath if omitted)
 
     Returns:
         Number of issues found
     """
     issues_found = 0
 
-    try:
-        content = filepath.read_text(errors="ignore")
-    except Exception:
-        return 0
+    if content is None:
+        try:
+            content = filepath.read_text(errors="ignore")
+        except Exception:
+            return 0
 
     # First check for private usernames (CRITICAL)
-    private_patterns = build_private_path_patterns(PRIVATE_USERNAMES)
-    for pattern, desc in private_patterns:
-        for match in pattern.finditer(content):
-            matched_text = match.group(0)
-            line_num = content[: match.start()].count("\n") + 1
-            issues_found += 1
-            report.critical(
-                f"Private path leaked: {desc} - '{matched_text}' (use relative path or ${{CLAUDE_PLUGIN_ROOT}})",
-                rel_path,
-                line_num,
-            )
+    lines = LineIndex(content)
+    for match, desc in get_private_path_matcher(get_private_usernames()).finditer(content):
+        matched_text = match.group(0)
+        line_num = lines.line_of(match.start())
+        issues_found += 1
+        report.critical(
+            f"Private path leaked: {desc} - '{matched_text}' (use relative path or ${{CLAUDE_PLUGIN_ROOT}})",
+            rel_path,
+            line_num,
+        )
 
     # Then check for ALL absolute paths (MAJOR)
-    for pattern, desc in ABSOLUTE_PATH_PATTERNS:
+    for pattern, desc in _lazy_constant("ABSOLUTE_PATH_PATTERNS"):
         for match in pattern.finditer(content):
             matched_text = match.group(1) if match.lastindex else match.group(0)
 
@@ -1620,7 +3269,7 @@ def scan_file_for_absolute_paths(
                 if extracted_username in EXAMPLE_USERNAMES:
                     continue
 
-            line_num = content[: match.start()].count("\n") + 1
+            line_num = lines.line_of(match.start())
             issues_found += 1
             report.major(
                 f"Absolute path found: '{matched_text[:60]}...' - "
@@ -1637,6 +3286,8 @@ def validate_no_absolute_paths(
     report: ValidationReport,
     skip_dirs: set[str] | None = None,
     respect_gitignore: bool = True,
+    index: PluginTreeIndex | None = None,
+    scope: ChangeScope | None = None,
 ) -> None:
     """Validate that a plugin contains no absolute paths.
 
@@ -1650,6 +3301,8 @@ def validate_no_absolute_paths(
         report: ValidationReport to add results to
         skip_dirs: Additional directories to skip
         respect_gitignore: If True, skip files/dirs listed in .gitignore
+        index: Shared tree index for this run (built on demand if omitted)
+        scope: Optional change scope; only files in it are scanned
     """
     files_checked = 0
     total_issues = 0
@@ -1657,35 +3310,31 @@ def validate_no_absolute_paths(
     # Combine skip dirs (includes gitignored dirs if respect_gitignore=True)
     if respect_gitignore:
         dirs_to_skip = get_skip_dirs_with_gitignore(root_path, skip_dirs)
-        gitignore_patterns = parse_gitignore(root_path / ".gitignore") if (root_path / ".gitignore").exists() else []
+        gitignore: GitignoreMatcher | None = get_gitignore_matcher(root_path)
     else:
         dirs_to_skip = set(PRIVATE_INFO_SKIP_DIRS)
         if skip_dirs:
             dirs_to_skip.update(skip_dirs)
-        gitignore_patterns = []
-
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        # Skip excluded directories (including gitignored)
-        dirnames[:] = [d for d in dirnames if d not in dirs_to_skip]
+        gitignore = None
 
-        rel_dir = Path(dirpath).relative_to(root_path)
+    tree = get_tree_index(root_path, index)
+    # Skip excluded directories (including gitignored) and gitignored files
+    for indexed in _iter_scan_files(root_path, tree, dirs_to_skip, gitignore, scope):
+        rel_path = indexed.rel_path
 
-        for filename in filenames:
-            filepath = Path(dirpath) / filename
-            rel_path = str(rel_dir / filename) if str(rel_dir) != "." else filename
-
-            # Skip gitignored files
-            if respect_gitignore and gitignore_patterns and is_path_gitignored(rel_path, gitignore_patterns):
-                continue
+        # Check only relevant file types
+        if indexed.suffix not in SCANNABLE_EXTENSIONS:
+            continue
 
-            # Check only relevant file types
-            if filepath.suffix.lower() not in SCANNABLE_EXTENSIONS:
-                continue
+        files_checked += 1
 
-            files_checked += 1
+        try:
+            content = indexed.text(errors="ignore")
+        except OSError:
+            continue
 
-            issues = scan_file_for_absolute_paths(filepath, report, rel_path)
-            total_issues += issues
+        issues = scan_file_for_absolute_paths(indexed.path, report, rel_path, content)
+        total_issues += issues
 
     if total_issues == 0:
         report.passed(f"No absolute paths found ({files_checked} files checked)")